@@ -1,13 +1,31 @@
+import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
+from app.apis.v1.ai_router import router as ai_router
 from app.apis.v1.diary_router import router as diary_router
 from app.apis.v1.diary_tags_router import router as diary_tags_router
+from app.apis.v1.emotion_stats_router import router as emotion_stats_router
+from app.apis.v1.health_router import router as health_router
+from app.apis.v1.job_router import router as job_router
+from app.apis.v1.metrics_router import router as metrics_router
 from app.apis.v1.tags_router import router as tags_router
 from app.apis.v1.user_router import router as user_router
-from app.config.database import init_db
-from app.config.tortoise_config import initialize_tortoise
+from app.config.config import settings
+from app.config.tortoise_config import close_tortoise, init_tortoise
+from app.middlewares.metrics import MetricsMiddleware
+from app.middlewares.query_profiler import QueryProfilerMiddleware
+from app.services.job_service import job_worker_pool
+from app.services.tag_catalog import tag_catalog
+from app.services.token_revocation import token_revocation_store
+
+# 루트 로거에 핸들러가 이미 있으면(로그 설정을 따로 넘긴 경우) 그대로 사용
+logging.basicConfig(
+    level=settings.LOG_LEVEL,
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+)
+logger = logging.getLogger(__name__)
 
 
 #
@@ -16,13 +34,21 @@ from app.config.tortoise_config import initialize_tortoise
 #     await init_db()      #
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    print("Start Lifespan")
-    await init_db()  # DB 시작
+    logger.info("Starting up")
+    await init_tortoise()  # ORM 초기화는 여기서 한 번만 (커넥션 풀 예열 포함)
+    await token_revocation_store.load()  # 토큰 블랙리스트를 메모리에 적재
+    token_revocation_store.start()  # 블랙리스트 동기화/만료 정리 시작
+    job_worker_pool.start()  # 백그라운드 작업 워커 시작
+    tag_catalog.start()  # 다른 워커의 태그 추가/삭제 감지 (목록은 처음 사용 시 적재)
     yield  # 시작과 종료의 경계: 종료 시 실행할 codes
-    print("End Lifespan")
+    await tag_catalog.stop()
+    await job_worker_pool.stop()
+    await token_revocation_store.stop()
+    await close_tortoise()
+    logger.info("Shut down")
 
 
-app = FastAPI()  # 서버의 뇌를 만드는 과정,
+app = FastAPI(lifespan=lifespan)  # 서버의 뇌를 만드는 과정,
 # Flask API는 애플리케이션 생성;
 # Uvicorn(ASGI 서버)가 그 객체를 통해 요청을 처리.
 
@@ -30,5 +56,12 @@ app.include_router(user_router)
 app.include_router(diary_router)
 app.include_router(tags_router)
 app.include_router(diary_tags_router)
+app.include_router(job_router)
+app.include_router(ai_router)
+app.include_router(emotion_stats_router)
+app.include_router(health_router)
+app.include_router(metrics_router)
 
-initialize_tortoise(app)
+app.add_middleware(MetricsMiddleware)  # 요청별 지연 시간/DB 쿼리 지표
+if settings.QUERY_PROFILER_ENABLED:
+    app.add_middleware(QueryProfilerMiddleware)  # 요청별 SQL 요약과 N+1 경고
@@ -0,0 +1,33 @@
+from fastapi import APIRouter, Depends
+
+from app.dependencies import get_current_user
+from app.dtos.ai_dto import AICacheStatsResponse, GeminiStatsResponse
+from app.dtos.user_dto import UserResponse
+from app.services.ai_cache import ai_result_cache
+from app.services.gemini_service import gemini_stats
+
+router = APIRouter(prefix="/ai", tags=["AI"])
+
+
+@router.get("/cache/stats", response_model=AICacheStatsResponse)
+async def get_ai_cache_stats(
+    current_user: UserResponse = Depends(get_current_user),
+):
+    """
+    이 워커의 Gemini 결과 캐시 적중/미스 횟수를 반환합니다.
+    :param current_user: 현재 로그인된 사용자 정보
+    :return: 캐시 크기와 메모리/DB 적중, 미스 횟수
+    """
+    return AICacheStatsResponse(**ai_result_cache.stats())
+
+
+@router.get("/gemini/stats", response_model=GeminiStatsResponse)
+async def get_gemini_stats(
+    current_user: UserResponse = Depends(get_current_user),
+):
+    """
+    이 워커의 Gemini 차단기 상태와 동시 요청 상한을 반환합니다.
+    :param current_user: 현재 로그인된 사용자 정보
+    :return: 차단기 상태/연속 실패/거절 횟수, 현재 상한/진행 중 요청/거절 횟수
+    """
+    return GeminiStatsResponse(**gemini_stats())
@@ -1,19 +1,107 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from starlette.status import HTTP_201_CREATED, HTTP_404_NOT_FOUND
+import math
+from contextlib import aclosing
+from datetime import datetime
+from typing import AsyncIterator
 
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from starlette.status import (
+    HTTP_201_CREATED,
+    HTTP_202_ACCEPTED,
+    HTTP_400_BAD_REQUEST,
+    HTTP_404_NOT_FOUND,
+    HTTP_502_BAD_GATEWAY,
+    HTTP_503_SERVICE_UNAVAILABLE,
+    HTTP_504_GATEWAY_TIMEOUT,
+)
+from tortoise.expressions import Q, Subquery
+from tortoise.functions import Count, Max, Min
+from tortoise.transactions import in_transaction
+
+from app.config.database import read_db
 from app.dependencies import get_current_user
 from app.dtos.diary_dto import (
     DiaryCreateRequest,
+    DiaryImportResponse,
+    DiaryListResponse,
     DiaryResponse,
     DiaryUpdateRequest,
 )
-from app.models.diaries import DiaryModel, EmotionType
-from app.models.emotion_keywords import EmotionKeywordModel
+from app.dtos.job_dto import JobResponse
+from app.models.diaries import DiaryModel
+from app.models.diary_tags import DiaryTagModel
+from app.models.jobs import JobType
 from app.models.users import UserModel
-from app.services import gemini_service
+from app.services import diary_import, diary_search, gemini_service, job_service
+from app.services.diary_export import gzip_stream, iter_diary_export
+from app.services.diary_tags import DiaryTagService
+from app.services.gemini_service import (
+    GeminiError,
+    GeminiTimeoutError,
+    GeminiUnavailableError,
+)
+from app.services.tag_catalog import tag_catalog
+from app.utils.etag import etag_matches, make_etag, not_modified
+from app.utils.pagination import (
+    decode_cursor,
+    decode_rank_cursor,
+    encode_cursor,
+    encode_rank_cursor,
+)
+from app.utils.sse import SSE_HEADERS, format_sse
 
 router = APIRouter(prefix="/diaries", tags=["diaries"])
 
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+diary_tag_service = DiaryTagService()
+
+
+def _gemini_http_error(error: GeminiError) -> HTTPException:
+    """
+    Gemini 호출 실패를 HTTP 오류로 바꿉니다.
+    거절(차단기 열림/상한 초과)은 Retry-After와 함께 503, 시간 초과는 504,
+    그 외 Gemini 오류는 502로 응답합니다.
+    """
+    if isinstance(error, GeminiUnavailableError):
+        return HTTPException(
+            status_code=HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(error),
+            headers={"Retry-After": str(max(1, math.ceil(error.retry_after)))},
+        )
+    if isinstance(error, GeminiTimeoutError):
+        return HTTPException(status_code=HTTP_504_GATEWAY_TIMEOUT, detail=str(error))
+    return HTTPException(status_code=HTTP_502_BAD_GATEWAY, detail=str(error))
+
+
+def _page_fingerprint(
+    count: int,
+    last_updated_at: datetime | None,
+    min_id: int | None,
+    max_id: int | None,
+) -> str:
+    """
+    목록 한 페이지(limit + 1행)의 ETag용 요약. 추가/삭제는 개수나 id 범위,
+    수정은 max(updated_at)를 바꿈. 집계 쿼리 결과와 읽은 행 어느 쪽으로 만들어도
+    같은 값이 되도록 시각은 epoch 초로 맞춤
+    """
+    timestamp = last_updated_at.timestamp() if last_updated_at else None
+    return f"{count}:{timestamp}:{min_id}:{max_id}"
+
+
+async def _embed_tags(items: list[DiaryResponse]) -> tuple[int, int | None]:
+    """
+    include=tags일 때 페이지의 모든 일기 태그를 한 번의 쿼리로 채웁니다.
+    :return: 읽은 태그 연결의 ETag용 요약 (get_tags_fingerprint와 같은 값)
+    """
+    tags_by_diary, fingerprint = await diary_tag_service.get_tags_with_fingerprint(
+        [item.id for item in items]
+    )
+    for item in items:
+        item.tags = tags_by_diary.get(item.id, [])
+    return fingerprint
+
 
 @router.post(
     "", response_model=DiaryResponse, status_code=HTTP_201_CREATED
@@ -22,23 +110,44 @@ async def create_diary(
     dairy_create: DiaryCreateRequest,
     current_user: UserModel = Depends(get_current_user),  # 0. 로그인 여부 확인
 ):
-    # email의 타입을 되돌리기. (str -> email)
-    user = await UserModel.get(email=current_user.email)
-    # 2. User을 넣어야 하니 이에 따른 모델 생성. (모델에 맞게 생성해야함)
-    diary = await DiaryModel.create(
-        user=user,
-        title=dairy_create.title,
-        content=dairy_create.content,
-        mood=dairy_create.mood,
-    )
-    print("diary is generated")
-    print(type(diary))
-
+    # 2. get_current_user가 찾은 사용자 ID로 바로 생성 (사용자 재조회 없음)
+    #    검색 문서도 같은 트랜잭션에서 함께 저장
+    async with in_transaction("default") as conn:
+        diary = await DiaryModel.create(
+            user_id=current_user.id,
+            title=dairy_create.title,
+            content=dairy_create.content,
+            mood=dairy_create.mood,
+            using_db=conn,
+        )
+        await diary_search.index_diary(diary, using_db=conn)
     # 3. 리턴 값이 딕셔너리여야 함.
     await diary.fetch_related("emotion_keywords")
     return DiaryResponse.model_validate(diary)
 
 
+@router.post("/import", response_model=DiaryImportResponse)  # Import Diaries
+async def import_diaries(
+    request: Request,
+    file_format: str = Query("ndjson", alias="format", enum=["ndjson", "csv"]),
+    current_user: UserModel = Depends(get_current_user),
+):
+    """
+    NDJSON(한 줄에 일기 하나) 또는 CSV(헤더: title,content,mood[,tags,created_at])
+    본문을 스트리밍으로 읽어 일기를 일괄 생성합니다.
+    Content-Encoding: gzip이면 압축을 풀면서 읽으므로 /diaries/export 결과를 그대로
+    올릴 수 있습니다. 잘못된 행은 건너뛰고 줄 번호와 함께 보고합니다.
+    :param request: 요청 객체 (본문 스트림)
+    :param file_format: 본문 형식 (ndjson/csv)
+    :param current_user: 현재 로그인된 사용자 정보
+    :return: 저장/실패 건수와 행별 오류
+    """
+    gzipped = request.headers.get("content-encoding", "").lower() == "gzip"
+    return await diary_import.import_diaries(
+        current_user.id, request.stream(), file_format, gzipped
+    )
+
+
 @router.post("/{diary_id}/summarize")
 async def summarize_diary(
     diary_id: int,
@@ -51,31 +160,40 @@ async def summarize_diary(
     :return: 요약된 일기 내용
     """
     diary = await DiaryModel.get_or_none(id=diary_id, user=current_user.id)
-    # print(f"DEBUG: diary_id={diary_id}, current_user.id={current_user.id})
-    # print(f"DEBUG: Retrieved diary: {diary})
     if not diary:
         raise HTTPException(
             status_code=HTTP_404_NOT_FOUND,
             detail="Diary not found or you don't have permission to access it",
         )
 
-    summarized_text = await gemini_service.summarize_diary_content(diary.content)
+    try:
+        summarized_text = await gemini_service.summarize_diary_content(diary.content)
+    except GeminiError as e:
+        raise _gemini_http_error(e)
 
     diary.emotion_summary = {"summary_text": summarized_text}
+    await diary.save(update_fields=["emotion_summary"])
 
     return {"summary": summarized_text}
 
 
-@router.post("/{diary_id}/emotion_stats", response_model=DiaryResponse)
-async def analyze_diary_emotion_endpoint(
+@router.post(
+    "/{diary_id}/summarize/stream", response_class=StreamingResponse
+)  # Summarize Diary (SSE)
+async def summarize_diary_stream(
     diary_id: int,
     current_user: UserModel = Depends(get_current_user),
 ):
     """
-    일기 내용을 Gemini API로 분석하여 감정 키워드를 추출하고 저장합니다.
-    :param diary_id: 분석할 일기의 ID
+    일기 요약을 Server-Sent Events로 생성되는 대로 전송합니다.
+    이벤트: chunk({"text"}) 여러 번, 이후 done({"summary"}) 또는 error({"detail"}).
+    (요약이 비어 있으면 error)
+    첫 조각을 받기 전의 실패(거절/시간 초과)는 일반 오류 응답(503/504)으로 반환합니다.
+    요약이 끝까지 생성되면 emotion_summary에 저장하고, 클라이언트 연결이 끊기면
+    Gemini 호출을 취소하며 저장하지 않습니다.
+    :param diary_id: 요약할 일기의 ID
     :param current_user: 현재 로그인된 사용자 정보
-    :return: 업데이트된 일기 정보 (감정 키워드 포함)
+    :return: text/event-stream 응답
     """
     diary = await DiaryModel.get_or_none(id=diary_id, user=current_user.id)
     if not diary:
@@ -84,99 +202,323 @@ async def analyze_diary_emotion_endpoint(
             detail="Diary not found or you don't have permission to access it",
         )
 
-    analysis_result = await gemini_service.analyze_diary_emotion(
-        diary_id=diary.id, user_id=current_user.id, content=diary.content
+    chunks = gemini_service.stream_summary(diary.content)
+    # 첫 조각을 받은 뒤에 응답을 시작해 상태 코드로 실패를 알릴 수 있도록 함
+    try:
+        first = await anext(chunks, None)
+    except GeminiError as e:
+        raise _gemini_http_error(e)
+
+    async def events() -> AsyncIterator[bytes]:
+        parts: list[str] = []
+        try:
+            # 응답이 중간에 끝나도 요약 스트림을 바로 닫아 Gemini 호출이 취소되도록 함
+            async with aclosing(chunks):
+                if first is not None:
+                    parts.append(first)
+                    yield format_sse("chunk", {"text": first})
+                async for text in chunks:
+                    parts.append(text)
+                    yield format_sse("chunk", {"text": text})
+        except GeminiError as e:
+            yield format_sse("error", {"detail": str(e)})
+            return
+
+        summarized_text = "".join(parts)
+        if not summarized_text:
+            # 빈 요약은 저장하지 않고 실패로 알림
+            yield format_sse("error", {"detail": "Gemini returned an empty summary"})
+            return
+        diary.emotion_summary = {"summary_text": summarized_text}
+        await diary.save(update_fields=["emotion_summary"])
+        yield format_sse("done", {"summary": summarized_text})
+
+    return StreamingResponse(
+        events(), media_type="text/event-stream", headers=SSE_HEADERS
     )
-    print(f"DEBUG: Gemini analysis result: {analysis_result}")
-
-    # 기존 감정 키워드 삭제
-    await EmotionKeywordModel.filter(diary=diary).delete()
-
-    # 새로운 감정 키워드 저장
-    overall_sentiment_scores = {
-        EmotionType.POSITIVE: 0,
-        EmotionType.NEGATIVE: 0,
-        EmotionType.NEUTRAL: 0,
-    }
-    if "keywords" in analysis_result:
-        for keyword_data in analysis_result["keywords"]:
-            word = keyword_data.get("word")
-            emotion_str = keyword_data.get("emotion")
-            if word and emotion_str:
-                try:
-                    emotion_type = EmotionType(emotion_str)
-                    await EmotionKeywordModel.create(
-                        diary=diary, word=word, emotion=emotion_type
-                    )
-                    overall_sentiment_scores[emotion_type] += 1
-                except ValueError:
-                    print(f"Invalid emotion type received: {emotion_str}")
-
-    # 전체 감정 결정 (가장 많은 키워드 감정으로)
-    overall_emotion: EmotionType | None = None
-    max_score = 0
-    for emotion_type, score in overall_sentiment_scores.items():
-        if score > max_score:
-            max_score = score
-            overall_emotion = emotion_type
-        elif score == max_score and overall_emotion is not None:
-            # 동점일 경우, 부정 > 긍정 > 중립 순으로 우선순위 (선택 사항)
-            if (
-                overall_emotion is not None
-                and emotion_type == EmotionType.NEGATIVE
-                and overall_emotion != EmotionType.NEGATIVE
-            ):
-                overall_emotion = EmotionType.NEGATIVE
-            elif (
-                overall_emotion is not None
-                and emotion_type == EmotionType.POSITIVE
-                and overall_emotion == EmotionType.NEUTRAL
-            ):
-                overall_emotion = EmotionType.POSITIVE
-
-    if overall_emotion is not None:
-        diary.emotion = overall_emotion
-    else:
-        diary.emotion = None
-    await diary.save()
 
-    # 업데이트된 일기 정보 반환 (감정 키워드 포함)
-    return await DiaryModel.get(id=diary_id).prefetch_related("emotion_keywords")
+
+@router.post(
+    "/{diary_id}/emotion_stats",
+    response_model=JobResponse,
+    status_code=HTTP_202_ACCEPTED,
+)
+async def analyze_diary_emotion_endpoint(
+    diary_id: int,
+    response: Response,
+    current_user: UserModel = Depends(get_current_user),
+):
+    """
+    일기 감정 분석 작업을 등록하고 바로 202 Accepted를 반환합니다.
+    Gemini 분석과 감정 키워드 저장은 백그라운드 워커가 수행하며,
+    진행 상황은 GET /jobs/{job_id}로 확인합니다.
+    :param diary_id: 분석할 일기의 ID
+    :param response: 응답 객체 (Location 헤더 설정용)
+    :param current_user: 현재 로그인된 사용자 정보
+    :return: 등록된 작업 정보
+    """
+    if not await DiaryModel.exists(id=diary_id, user=current_user.id):
+        raise HTTPException(
+            status_code=HTTP_404_NOT_FOUND,
+            detail="Diary not found or you don't have permission to access it",
+        )
+
+    job = await job_service.enqueue_job(
+        user_id=current_user.id,
+        job_type=JobType.EMOTION_ANALYSIS,
+        payload={"diary_id": diary_id},
+    )
+    response.headers["Location"] = f"/jobs/{job.id}"
+    return JobResponse.model_validate(job)
+
+
+@router.get("/search", response_model=DiaryListResponse)  # Search Diaries
+async def search_diaries(
+    q: str = Query(..., min_length=1, max_length=200, description="검색어"),
+    cursor: str | None = Query(None, description="이전 페이지의 next_cursor"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    current_user: UserModel = Depends(get_current_user),
+):
+    """
+    내 일기의 제목/내용을 전문 검색하여 관련도 순으로 반환합니다.
+    :param q: 검색어 (모든 단어가 포함된 일기만 검색)
+    :param cursor: 이전 페이지의 next_cursor
+    :param limit: 페이지 크기
+    :param current_user: 현재 로그인된 사용자 정보
+    :return: 검색된 일기 목록과 다음 페이지 커서
+    """
+    search_query = diary_search.build_search_query(q)
+    if search_query is None:
+        return DiaryListResponse(items=[])
+
+    after = None
+    if cursor:
+        try:
+            after = decode_rank_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+            )
+
+    # 다음 페이지 존재 여부를 알기 위해 limit + 1개 조회
+    matches = await diary_search.search_diaries(
+        current_user.id, search_query, limit + 1, after
+    )
+    next_cursor = None
+    if len(matches) > limit:
+        matches = matches[:limit]
+        last_id, last_rank = matches[-1]
+        next_cursor = encode_rank_cursor(last_rank, last_id)
+
+    diaries = (
+        await DiaryModel.filter(id__in=[diary_id for diary_id, _ in matches])
+        .using_db(read_db())
+        .prefetch_related("emotion_keywords")
+    )
+    diaries_by_id = {diary.id: diary for diary in diaries}
+    return DiaryListResponse(
+        items=[
+            DiaryResponse.model_validate(diaries_by_id[diary_id])
+            for diary_id, _ in matches
+            if diary_id in diaries_by_id
+        ],
+        next_cursor=next_cursor,
+    )
+
+
+@router.get("/export", response_class=StreamingResponse)  # Export Diaries
+async def export_diaries(
+    gzip: bool = Query(False, description="gzip으로 압축하여 내려받기"),
+    current_user: UserModel = Depends(get_current_user),
+):
+    """
+    내 일기 전체를 NDJSON(한 줄에 일기 하나, 태그/감정 키워드 포함)으로 내보냅니다.
+    일기를 묶음 단위로 읽으면서 바로 전송하므로 일기 수와 관계없이 메모리가 일정합니다.
+    :param gzip: True면 gzip으로 압축한 파일로 내려받음
+    :param current_user: 현재 로그인된 사용자 정보
+    :return: NDJSON 스트리밍 응답
+    """
+    body = iter_diary_export(current_user.id)
+    filename = "diaries.ndjson"
+    media_type = "application/x-ndjson"
+    if gzip:
+        body = gzip_stream(body)
+        filename += ".gz"
+        media_type = "application/gzip"
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
 
 @router.get("/{diary_id}", response_model=DiaryResponse)  # GetDiary
-async def get_diary(diary_id: int):
-    diary = await DiaryModel.get_or_none(id=diary_id).prefetch_related(
+async def get_diary(
+    diary_id: int,
+    response: Response,
+    include: str | None = Query(None, enum=["tags"], description="함께 포함할 항목"),
+    if_none_match: str | None = Header(None),
+):
+    # 읽기 전용 조회는 복제본(설정된 경우)에서 처리
+    db = read_db()
+    # 태그 연결은 일기의 updated_at을 바꾸지 않으므로 태그를 포함할 때는 ETag에 반영
+    # 조건부 요청이면 updated_at만 먼저 읽어 바뀌지 않았을 때 본문 없이 304 응답
+    # (감정 분석 결과가 바뀌어도 updated_at이 갱신되므로 키워드까지 반영됨)
+    if if_none_match:
+        tags_fingerprint = None
+        if include == "tags":
+            tags_fingerprint = await diary_tag_service.get_tags_fingerprint([diary_id])
+        updated_at = (
+            await DiaryModel.filter(id=diary_id)
+            .using_db(db)
+            .first()
+            .values_list("updated_at", flat=True)
+        )
+        if updated_at is None:
+            raise HTTPException(
+                status_code=HTTP_404_NOT_FOUND, detail="Diary not found"
+            )
+        etag = make_etag(diary_id, updated_at, include, tags_fingerprint)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+    diary = await DiaryModel.get_or_none(id=diary_id, using_db=db).prefetch_related(
         "emotion_keywords"
     )
     if not diary:
         raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail="Diary not found")
 
-    return DiaryResponse.model_validate(diary)
+    item = DiaryResponse.model_validate(diary)
+    # 태그 연결 요약은 태그를 채우면서 읽은 연결로 계산 (추가 집계 쿼리 없음)
+    tags_fingerprint = await _embed_tags([item]) if include == "tags" else None
+    response.headers["ETag"] = make_etag(
+        diary.id, diary.updated_at, include, tags_fingerprint
+    )
+    return item
 
 
-@router.get("", response_model=list[DiaryResponse])  # List Update
+@router.get("", response_model=DiaryListResponse)  # List Update
 async def list_diaries(
+    response: Response,
     sort: str = Query("Latest", enum=["Oldest", "Latest"]),
     tag: str | None = None,
+    tags: str | None = Query(None, description="쉼표로 구분한 태그명 (예: a,b,c)"),
+    mode: str = Query("all", enum=["all", "any"]),
+    cursor: str | None = Query(None, description="이전 페이지의 next_cursor"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    include: str | None = Query(None, enum=["tags"], description="함께 포함할 항목"),
+    if_none_match: str | None = Header(None),
 ):
-    # order가 Oldest이면 오래된 순, Latest이면 최신순   \
-    order_by_field = "-created_at" if sort == "Latest" else "created_at"
+    # order가 Oldest이면 오래된 순, Latest이면 최신순
+    # id를 보조 정렬 키로 사용해 created_at이 같은 행도 순서가 고정되도록 함
+    if sort == "Latest":
+        order_by_fields = ("-created_at", "-id")
+    else:
+        order_by_fields = ("created_at", "id")
+
+    # tag(단일)는 이전 클라이언트 호환용으로 tags와 합쳐서 처리
+    tag_names = [name.strip() for name in (tags or "").split(",") if name.strip()]
     if tag:
-        diaries = (
-            await DiaryModel.filter(tags__name=tag)
-            .order_by(order_by_field)
-            .distinct()
-            .prefetch_related("emotion_keywords")
+        tag_names.append(tag)
+    tag_names = list(dict.fromkeys(tag_names))
+
+    # 읽기 전용 조회는 복제본(설정된 경우)에서 처리
+    query = DiaryModel.all(using_db=read_db())
+    if tag_names:
+        tag_ids = list((await tag_catalog.resolve_ids(tag_names)).values())
+        # all: 없는 태그가 하나라도 있으면 결과 없음, any: 있는 태그만으로 검색
+        if not tag_ids or (mode == "all" and len(tag_ids) < len(tag_names)):
+            return DiaryListResponse(items=[])
+        # diary_tags(tag_id, diary_id) 인덱스로 일기 ID만 고르는 세미 조인
+        # (diary, tag)가 unique이므로 all은 태그 개수만큼 매칭된 일기만 남김
+        tagged = DiaryTagModel.filter(tag_id__in=tag_ids)
+        if mode == "all" and len(tag_ids) > 1:
+            tagged = (
+                tagged.group_by("diary_id")
+                .annotate(matched=Count("tag_id"))
+                .filter(matched=len(tag_ids))
+            )
+        query = query.filter(id__in=Subquery(tagged.values("diary_id")))
+
+    if cursor:
+        try:
+            cursor_created_at, cursor_id = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+            )
+        # 마지막으로 본 (created_at, id) 이후의 행만 인덱스 범위로 조회 (OFFSET 미사용)
+        if sort == "Latest":
+            query = query.filter(
+                Q(created_at__lt=cursor_created_at)
+                | Q(created_at=cursor_created_at, id__lt=cursor_id)
+            )
+        else:
+            query = query.filter(
+                Q(created_at__gt=cursor_created_at)
+                | Q(created_at=cursor_created_at, id__gt=cursor_id)
+            )
+
+    # 다음 페이지 존재 여부를 알기 위해 limit + 1개 조회
+    page = query.order_by(*order_by_fields).limit(limit + 1)
+    etag_parts = (sort, ",".join(sorted(tag_names)), mode, cursor, limit, include)
+
+    # 조건부 요청이면 이번 페이지 범위(limit + 1행)만 집계해 ETag를 만들고,
+    # 일치하면 목록을 읽거나 직렬화하지 않고 304 응답
+    # (범위를 페이지로 제한해 첫 페이지도 테이블 전체를 집계하지 않음)
+    if if_none_match:
+        aggregate = (
+            await DiaryModel.filter(id__in=Subquery(page.values("id")))
+            .using_db(read_db())
+            .annotate(
+                count=Count("id"),
+                last_updated_at=Max("updated_at"),
+                min_id=Min("id"),
+                max_id=Max("id"),
+            )
+            .first()
+            .values("count", "last_updated_at", "min_id", "max_id")
         )
-    else:
-        diaries = (
-            await DiaryModel.all()
-            .order_by(order_by_field)
-            .prefetch_related("emotion_keywords")
+        tags_fingerprint = None
+        if include == "tags":
+            tags_fingerprint = await diary_tag_service.get_tags_fingerprint(
+                Subquery(query.order_by(*order_by_fields).limit(limit).values("id"))
+            )
+        etag = make_etag(
+            *etag_parts,
+            _page_fingerprint(
+                aggregate["count"] if aggregate else 0,
+                aggregate["last_updated_at"] if aggregate else None,
+                aggregate["min_id"] if aggregate else None,
+                aggregate["max_id"] if aggregate else None,
+            ),
+            tags_fingerprint,
         )
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+    diaries = await page.prefetch_related("emotion_keywords")
+    # 조건부 요청이 아니면 이미 읽은 행으로 같은 방식의 ETag를 만듦 (추가 쿼리 없음)
+    page_fingerprint = _page_fingerprint(
+        len(diaries),
+        max((diary.updated_at for diary in diaries), default=None),
+        min((diary.id for diary in diaries), default=None),
+        max((diary.id for diary in diaries), default=None),
+    )
 
-    return [DiaryResponse.model_validate(diary) for diary in diaries]
+    next_cursor = None
+    if len(diaries) > limit:
+        diaries = diaries[:limit]
+        last = diaries[-1]
+        next_cursor = encode_cursor(last.created_at, last.id)
+
+    items = [DiaryResponse.model_validate(diary) for diary in diaries]
+    # 태그 연결 요약은 태그를 채우면서 읽은 연결로 계산 (추가 집계 쿼리 없음)
+    tags_fingerprint = await _embed_tags(items) if include == "tags" else None
+    response.headers["ETag"] = make_etag(
+        *etag_parts, page_fingerprint, tags_fingerprint
+    )
+    return DiaryListResponse(items=items, next_cursor=next_cursor)
 
 
 @router.patch("/{diary_id}", response_model=DiaryResponse)  # Update Diary
@@ -197,8 +539,11 @@ async def update_diary(
     if request.content is not None:
         diary.content = request.content
 
-    # 3. DB 저장
-    await diary.save()
+    # 3. DB 저장 (제목/내용이 바뀌면 검색 문서도 함께 갱신)
+    async with in_transaction("default") as conn:
+        await diary.save(using_db=conn)
+        if request.title is not None or request.content is not None:
+            await diary_search.index_diary(diary, using_db=conn)
 
     # 4. 수정된 diary를 response 모델로 반환
     return DiaryResponse.model_validate(diary)
@@ -23,6 +23,40 @@ async def add_tag_to_diary(
     return await service.add_tag_to_diary(diary_id, tag_data.id)
 
 
+# "/{diary_id}/tags/{tag_id}"보다 먼저 등록해야 "batch"가 tag_id로 해석되지 않음
+@router.post(
+    "/{diary_id}/tags/batch",
+    response_model=DiaryTagSchemas.TagBatchResponse,
+    summary="일기 태그 일괄 추가",
+    description="태그 ID/태그명 목록을 한 번에 일기에 추가합니다. "
+    "create_missing이 true이면 없는 태그명은 새로 만듭니다.",
+)
+async def add_tags_to_diary(
+    diary_id: int = Path(...),
+    tag_data: DiaryTagSchemas.TagBatchAddRequest = Body(...),
+):
+    try:
+        return await service.add_tags_to_diary(diary_id, tag_data)
+    except Exception as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.delete(
+    "/{diary_id}/tags/batch",
+    response_model=DiaryTagSchemas.TagBatchResponse,
+    summary="일기 태그 일괄 제거",
+    description="태그 ID/태그명 목록을 한 번에 일기에서 제거합니다.",
+)
+async def remove_tags_from_diary(
+    diary_id: int = Path(...),
+    tag_data: DiaryTagSchemas.TagBatchRequest = Body(...),
+):
+    try:
+        return await service.remove_tags_from_diary(diary_id, tag_data)
+    except Exception as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
 @router.delete(
     "/{diary_id}/tags/{tag_id}",
     response_model=DiaryTagSchemas.MessageResponse,
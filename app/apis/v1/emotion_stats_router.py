@@ -0,0 +1,38 @@
+from typing import List
+
+from fastapi import APIRouter, Depends, Query
+
+from app.dependencies import get_current_user
+from app.dtos.emotion_stats_dto import EmotionStatResponse
+from app.dtos.user_dto import UserResponse
+from app.models.emotion_stats import EmotionStatModel, TimePeriodTypeModel
+
+router = APIRouter(prefix="/emotion_stats", tags=["Emotion Stats"])
+
+
+@router.get("", response_model=List[EmotionStatResponse])
+async def get_emotion_stats(
+    period: TimePeriodTypeModel = Query(TimePeriodTypeModel.DAILY),
+    start: str | None = Query(None, description="시작 기간 (예: 2025-07-01, 2025-W27)"),
+    end: str | None = Query(None, description="끝 기간 (포함)"),
+    current_user: UserResponse = Depends(get_current_user),
+):
+    """
+    기간별 감정 통계를 조회합니다.
+    감정 분석 때마다 갱신되는 집계 행만 읽으므로
+    조회 비용은 일기 수와 관계없이 기간 수에 비례합니다.
+    :param period: 집계 단위 (daily/weekly/monthly)
+    :param start: 시작 기간 값 (period 형식과 동일)
+    :param end: 끝 기간 값 (포함)
+    :param current_user: 현재 로그인된 사용자 정보
+    :return: 기간, 감정별 빈도
+    """
+    query = EmotionStatModel.filter(
+        user_email_id=current_user.id, time_period_type=period, frequency__gt=0
+    )
+    if start:
+        query = query.filter(time_period_value__gte=start)
+    if end:
+        query = query.filter(time_period_value__lte=end)
+    stats = await query.order_by("time_period_value", "emotion_type")
+    return [EmotionStatResponse.model_validate(stat) for stat in stats]
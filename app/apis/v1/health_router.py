@@ -0,0 +1,13 @@
+from fastapi import APIRouter
+
+router = APIRouter(tags=["health"])
+
+
+@router.get("/health", summary="헬스 체크")
+async def health():
+    """
+    서버가 요청을 받을 수 있는지 확인합니다. (로드밸런서/오토스케일러용)
+    lifespan(ORM 초기화, 커넥션 풀 예열)이 끝난 뒤에만 응답하므로
+    DB를 조회하지 않고 바로 반환합니다.
+    """
+    return {"status": "ok"}
@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.dependencies import get_current_user
+from app.dtos.job_dto import JobResponse
+from app.dtos.user_dto import UserResponse
+from app.models.jobs import JobModel
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(
+    job_id: int,
+    current_user: UserResponse = Depends(get_current_user),
+):
+    """
+    백그라운드 작업의 진행 상태와 결과를 조회합니다.
+    :param job_id: 조회할 작업 ID
+    :param current_user: 현재 로그인된 사용자 정보
+    :return: 작업 상태 (pending/running/succeeded/failed)와 결과
+    """
+    job = await JobModel.get_or_none(id=job_id, user=current_user.id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Job not found"
+        )
+    return JobResponse.model_validate(job)
@@ -0,0 +1,19 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.services.metrics import registry
+
+router = APIRouter(tags=["metrics"])
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", summary="Prometheus 지표", response_class=PlainTextResponse)
+async def metrics():
+    """
+    이 워커의 지표를 Prometheus 텍스트 형식으로 반환합니다.
+    (라우트별 지연 시간/상태 코드, 요청별 DB 쿼리 수/시간, Gemini 호출,
+    bcrypt 시간, 캐시 적중률, Gemini 차단기/동시 요청 상한)
+    외부에 공개하지 않도록 프록시에서 내부망으로만 열어 두어야 합니다.
+    """
+    return PlainTextResponse(registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
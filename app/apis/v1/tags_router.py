@@ -5,6 +5,7 @@ from tortoise.exceptions import IntegrityError
 
 from app.dtos.tags_dto import TagCreate, TagResponse
 from app.models.tags import Tag
+from app.services.tag_catalog import tag_catalog
 
 # APIRouter 생성
 router = APIRouter(prefix="/tags", tags=["tags"])
@@ -22,6 +23,7 @@ async def create_tag(tag_data: TagCreate):
     try:
         # 새 태그 생성
         new_tag = await Tag.create(name=tag_data.name)
+        await tag_catalog.add(new_tag.id, new_tag.name)  # 카탈로그에 바로 반영
         return TagResponse(id=new_tag.id, name=new_tag.name)
 
     except IntegrityError:
@@ -40,8 +42,9 @@ async def create_tag(tag_data: TagCreate):
     description="모든 태그 목록을 조회합니다.",
 )
 async def get_tags():
-    tags = await Tag.all()
-    return [TagResponse(id=tag.id, name=tag.name) for tag in tags]
+    # 메모리의 태그 카탈로그에서 조회 (DB 미조회)
+    tags = await tag_catalog.all_tags()
+    return [TagResponse(id=tag_id, name=name) for tag_id, name in tags]
 
 
 # 조회(특정 태그만)랑 삭제?
@@ -52,12 +55,12 @@ async def get_tags():
     description="ID로 특정 태그를 조회합니다.",
 )
 async def get_tag(tag_id: int):
-    tag = await Tag.filter(id=tag_id).first()
-    if not tag:
+    name = await tag_catalog.get_name(tag_id)
+    if name is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="태그를 찾을 수 없습니다."
         )
-    return TagResponse(id=tag.id, name=tag.name)
+    return TagResponse(id=tag_id, name=name)
 
 
 @router.delete(
@@ -67,11 +70,11 @@ async def get_tag(tag_id: int):
     description="특정 태그를 삭제합니다.",
 )
 async def delete_tag(tag_id: int):
-    tag = await Tag.filter(id=tag_id).first()
-    if not tag:
+    deleted = await Tag.filter(id=tag_id).delete()
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="태그를 찾을 수 없습니다."
         )
 
-    await tag.delete()
+    await tag_catalog.remove(tag_id)  # 카탈로그에서 바로 제거
     return
@@ -36,7 +36,7 @@ async def register_user(user_create: UserCreate):
         )
 
     # 비밀번호 해싱
-    hashed_password = auth_service.get_password_hash(user_create.password)
+    hashed_password = await auth_service.get_password_hash_async(user_create.password)
 
     # 사용자 생성
     user = await UserModel.create(
@@ -12,6 +12,45 @@ class Settings(BaseSettings):
     DB_HOST: str
     DB_PORT: int
     DB_NAME: str
+    DB_READ_HOST: str | None = None  # 읽기 전용 복제본 호스트 (없으면 primary 사용)
+    DB_READ_PORT: int | None = None  # 읽기 전용 복제본 포트 (없으면 DB_PORT)
+    DB_POOL_MIN_SIZE: int = 1  # 연결별 커넥션 풀 최소 크기
+    DB_POOL_MAX_SIZE: int = (
+        10  # 연결별 커넥션 풀 최대 크기 (워커 수 x 이 값 <= DB 한도)
+    )
+    DB_STATEMENT_CACHE_SIZE: int = 100  # 커넥션당 prepared statement 캐시 크기
+    DB_COMMAND_TIMEOUT_SECONDS: float | None = 60.0  # 쿼리 1건 타임아웃
+    DB_MAX_INACTIVE_CONNECTION_LIFETIME_SECONDS: float = 300.0  # 유휴 커넥션 수명
+    BCRYPT_ROUNDS: int = 12  # bcrypt cost (바꾸면 로그인 시 기존 해시가 재해싱됨)
+    PASSWORD_HASH_WORKERS: int = 4  # 비밀번호 해싱 전용 스레드 수 (동시 해싱 상한)
+    USER_CACHE_MAX_SIZE: int = 10000  # 인증 사용자 캐시 최대 항목 수
+    USER_CACHE_TTL_SECONDS: float = 60.0  # 인증 사용자 캐시 유지 시간
+    JWT_CACHE_MAX_SIZE: int = 10000  # 검증된 JWT 페이로드 캐시 최대 항목 수
+    TAG_CATALOG_SYNC_SECONDS: float = 5.0  # 다른 워커의 태그 추가/삭제 반영 주기
+    TOKEN_REVOCATION_SYNC_SECONDS: float = 5.0  # 다른 워커의 로그아웃 반영 주기
+    TOKEN_REVOCATION_PRUNE_SECONDS: float = 600.0  # 만료된 블랙리스트 삭제 주기
+    GEMINI_MAX_CONCURRENCY: int = 8  # 워커당 Gemini 동시 요청 상한의 최댓값
+    GEMINI_MIN_CONCURRENCY: int = 1  # 느려지거나 실패할 때 줄어드는 상한의 최솟값
+    GEMINI_LATENCY_TARGET_SECONDS: float = 10.0  # 이보다 빠르면 상한을 늘림
+    GEMINI_QUEUE_TIMEOUT_SECONDS: float = 1.0  # 상한에 걸렸을 때 기다리는 시간
+    GEMINI_TIMEOUT_SECONDS: float = (
+        30.0  # Gemini 요청 1건(스트리밍은 조각 간격) 타임아웃
+    )
+    GEMINI_BREAKER_FAILURE_THRESHOLD: int = 5  # 차단기를 여는 연속 실패 횟수
+    GEMINI_BREAKER_RESET_SECONDS: float = 30.0  # 차단기가 열린 뒤 시험 요청까지 대기
+    AI_CACHE_MAX_SIZE: int = 1024  # 프로세스 내 Gemini 결과 캐시 항목 수
+    AI_CACHE_TTL_SECONDS: int = 3600  # 프로세스 내 Gemini 결과 캐시 유지 시간
+    JOB_WORKER_CONCURRENCY: int = 2  # 프로세스당 백그라운드 작업 워커 수
+    JOB_POLL_INTERVAL_SECONDS: float = 2.0  # 대기 중인 작업을 다시 확인하는 주기
+    JOB_LEASE_SECONDS: int = 300  # 실행 중 작업 점유 시간 (지나면 다른 워커가 회수)
+    JOB_MAX_ATTEMPTS: int = 3  # 실패 시 재시도를 포함한 최대 실행 횟수
+    LOG_LEVEL: str = "INFO"  # 애플리케이션 로그 레벨 (uvicorn 로그와 별개)
+    QUERY_PROFILER_ENABLED: bool = (
+        False  # 요청별 SQL 요약을 헤더/로그로 남김 (스테이징용)
+    )
+    QUERY_PROFILER_N_PLUS_ONE_THRESHOLD: int = (
+        3  # 같은 모양 쿼리가 이만큼 반복되면 N+1 의심
+    )
 
     class Config:
         env_file = ".env"
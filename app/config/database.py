@@ -1,24 +1,74 @@
 # 데이터 베이스 연결 설정과 초기화 함수
-import os
+from tortoise import BaseDBAsyncClient, Tortoise, connections, run_async
 
-from dotenv import load_dotenv
-from tortoise import Tortoise, run_async
+from app.config.config import settings
 
-load_dotenv()  # 데이터베이스 접근을 안전하게 만든다. (환경변수에 따로 관리하기 때문에)
+# 읽기 전용 복제본이 설정되지 않으면 읽기도 기본(primary) 연결을 사용
+READ_CONNECTION = "replica" if settings.DB_READ_HOST else "default"
 
-DB_USER = os.getenv("DB_USER")
-DB_PASSWORD = os.getenv("DB_PASSWORD")
-DB_HOST = os.getenv("DB_HOST")
-DB_NAME = os.getenv("DB_NAME")
-DB_PORT = os.getenv("DB_PORT")
+
+def database_url(host: str | None = None, port: int | None = None) -> str:
+    """
+    postgres:// 형식의 DB URL을 만듭니다. (풀 설정이 필요 없는 도구용)
+    :param host: 접속할 호스트 (없으면 DB_HOST)
+    :param port: 접속할 포트 (없으면 DB_PORT)
+    :return: DB URL
+    """
+    return (
+        f"postgres://{settings.DB_USER}:{settings.DB_PASSWORD}"
+        f"@{host or settings.DB_HOST}:{port or settings.DB_PORT}/{settings.DB_NAME}"
+    )
+
+
+def connection_config(host: str, port: int) -> dict:
+    """
+    asyncpg 커넥션 풀 설정이 포함된 Tortoise 연결 설정을 만듭니다.
+    :param host: 접속할 호스트
+    :param port: 접속할 포트
+    :return: TORTOISE_ORM["connections"]에 들어갈 설정
+    """
+    return {
+        "engine": "app.config.db_client",  # 쿼리 지표를 기록하는 asyncpg 클라이언트
+        "credentials": {
+            "host": host,
+            "port": port,
+            "user": settings.DB_USER,
+            "password": settings.DB_PASSWORD,
+            "database": settings.DB_NAME,
+            "minsize": settings.DB_POOL_MIN_SIZE,
+            "maxsize": settings.DB_POOL_MAX_SIZE,
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "command_timeout": settings.DB_COMMAND_TIMEOUT_SECONDS,
+            "max_inactive_connection_lifetime": (
+                settings.DB_MAX_INACTIVE_CONNECTION_LIFETIME_SECONDS
+            ),
+        },
+    }
+
+
+def database_connections() -> dict[str, dict]:
+    """기본 연결과 (설정된 경우) 읽기 전용 복제본 연결 설정을 반환합니다."""
+    db_connections = {"default": connection_config(settings.DB_HOST, settings.DB_PORT)}
+    if settings.DB_READ_HOST:
+        db_connections["replica"] = connection_config(
+            settings.DB_READ_HOST, settings.DB_READ_PORT or settings.DB_PORT
+        )
+    return db_connections
+
+
+def read_db() -> BaseDBAsyncClient:
+    """
+    읽기 전용 조회에 사용할 연결을 반환합니다.
+    복제본은 primary보다 조금 늦을 수 있으므로, 방금 쓴 값을 다시 읽어야 하는
+    곳(쓰기 흐름 안의 조회)에서는 사용하지 않습니다.
+    """
+    return connections.get(READ_CONNECTION)
 
 
 async def init_db():
-    await Tortoise.init(
-        # 환경변수로 관리하여 보안 강화
-        db_url=f"postgres://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}",
-        modules={"models": ["app.models", "aerich.models", "app.models.diaries"]},
-    )
+    from app.config.tortoise_config import TORTOISE_ORM
+
+    await Tortoise.init(config=TORTOISE_ORM)
     await Tortoise.generate_schemas()  # 필요 시 DB 스키마 생성 함수
 
 
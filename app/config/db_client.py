@@ -0,0 +1,80 @@
+# 쿼리 수와 시간을 지표(와 켜져 있으면 쿼리 프로파일러)로 기록하는 asyncpg 클라이언트
+# (TORTOISE_ORM 연결 설정의 engine으로 이 모듈을 지정)
+import time
+from typing import Any
+
+from tortoise.backends.asyncpg.client import AsyncpgDBClient, TransactionWrapper
+from tortoise.backends.base.client import (
+    NestedTransactionContext,
+    TransactionContext,
+    TransactionContextPooled,
+)
+
+from app.services.metrics import record_db_query
+from app.services.query_profiler import record_profiled_query
+
+
+def _record(connection_name: str, query: str, started: float) -> None:
+    seconds = time.perf_counter() - started
+    record_db_query(connection_name, query, seconds)
+    record_profiled_query(query, seconds)
+
+
+class InstrumentedAsyncpgDBClient(AsyncpgDBClient):
+    """Tortoise가 SQL을 실행하는 모든 경로를 감싸 소요 시간을 기록합니다."""
+
+    def _in_transaction(self) -> TransactionContext:
+        # 트랜잭션 안의 쿼리도 기록되도록 트랜잭션 연결도 같은 방식으로 감쌈
+        return TransactionContextPooled(
+            InstrumentedTransactionWrapper(self), self._pool_init_lock
+        )
+
+    async def execute_insert(self, query: str, values: list) -> Any:
+        started = time.perf_counter()
+        try:
+            return await super().execute_insert(query, values)
+        finally:
+            _record(self.connection_name, query, started)
+
+    async def execute_many(self, query: str, values: list) -> None:
+        started = time.perf_counter()
+        try:
+            await super().execute_many(query, values)
+        finally:
+            _record(self.connection_name, query, started)
+
+    async def execute_query(
+        self, query: str, values: list | None = None
+    ) -> tuple[int, list[dict]]:
+        started = time.perf_counter()
+        try:
+            result: tuple[int, list[dict]] = await super().execute_query(query, values)
+            return result
+        finally:
+            _record(self.connection_name, query, started)
+
+    async def execute_query_dict(
+        self, query: str, values: list | None = None
+    ) -> list[dict]:
+        started = time.perf_counter()
+        try:
+            rows: list[dict] = await super().execute_query_dict(query, values)
+            return rows
+        finally:
+            _record(self.connection_name, query, started)
+
+    async def execute_script(self, query: str) -> None:
+        started = time.perf_counter()
+        try:
+            await super().execute_script(query)
+        finally:
+            _record(self.connection_name, query, started)
+
+
+class InstrumentedTransactionWrapper(InstrumentedAsyncpgDBClient, TransactionWrapper):
+    # 실행은 TransactionWrapper(트랜잭션 연결)로, 기록은 위 클래스에서 처리
+    def _in_transaction(self) -> TransactionContext:
+        return NestedTransactionContext(InstrumentedTransactionWrapper(self))
+
+
+client_class = InstrumentedAsyncpgDBClient
@@ -1,27 +1,27 @@
-import os
+import asyncio
 
-from dotenv import load_dotenv
-from fastapi import FastAPI
-from tortoise import Tortoise
-from tortoise.contrib.fastapi import register_tortoise
+from tortoise import Tortoise, connections
+
+from app.config.database import database_connections
 
-load_dotenv()
 TORTOISE_APP_MODELS = [
     "aerich.models",
     "app.models.users",
     "app.models.token_blacklist",
     "app.models.diaries",
+    "app.models.diary_search",
     "app.models.diary_tags",
     "app.models.emotion_stats",
     "app.models.alert_logs",
     "app.models.tags",
     "app.models.emotion_keywords",
+    "app.models.jobs",
+    "app.models.ai_cache",
 ]
 
 TORTOISE_ORM = {
-    "connections": {
-        "default": f"postgres://{os.getenv('DB_USER')}:{os.getenv('DB_PASSWORD')}@{os.getenv('DB_HOST')}:{os.getenv('DB_PORT')}/{os.getenv('DB_NAME')}",
-    },
+    # default(primary)와 선택적인 replica(읽기 전용), 풀 설정은 Settings에서 관리
+    "connections": database_connections(),
     "apps": {
         "models": {
             "models": TORTOISE_APP_MODELS,
@@ -31,6 +31,18 @@ TORTOISE_ORM = {
 }
 
 
-def initialize_tortoise(app: FastAPI) -> None:
-    Tortoise.init_models(TORTOISE_APP_MODELS, "models")
-    register_tortoise(app, config=TORTOISE_ORM)
+async def init_tortoise() -> None:
+    """
+    ORM을 한 번만 초기화하고 커넥션 풀을 미리 만들어 둡니다.
+    서버 시작 시 스키마를 만들지 않습니다 (generate_schemas 미사용).
+    스키마는 aerich 마이그레이션으로 관리합니다.
+    """
+    await Tortoise.init(config=TORTOISE_ORM)
+    # 첫 요청이 커넥션 풀 생성과 접속 비용을 치르지 않도록 미리 연결
+    await asyncio.gather(
+        *(connection.execute_query("SELECT 1") for connection in connections.all())
+    )
+
+
+async def close_tortoise() -> None:
+    await connections.close_all()
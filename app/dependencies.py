@@ -36,7 +36,7 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> UserResponse:
         )
 
     # 토큰이 블랙리스트에 있는지 확인 (로그아웃된 토큰인지 확인)
-    if await auth_service.is_token_blacklisted(token):
+    if await auth_service.is_token_blacklisted(token, payload):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has been revoked"
         )
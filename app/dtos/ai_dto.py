@@ -0,0 +1,26 @@
+from pydantic import BaseModel
+
+
+class AICacheStatsResponse(BaseModel):
+    size: int
+    memory_hits: int
+    db_hits: int
+    misses: int
+
+
+class GeminiBreakerStats(BaseModel):
+    state: str  # closed / open / half_open
+    consecutive_failures: int
+    opened_count: int
+    rejected: int
+
+
+class GeminiLimiterStats(BaseModel):
+    limit: int  # 현재 동시 요청 상한
+    in_flight: int
+    rejected: int
+
+
+class GeminiStatsResponse(BaseModel):
+    breaker: GeminiBreakerStats
+    limiter: GeminiLimiterStats
@@ -1,8 +1,9 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Annotated, List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_validator
 
+from app.dtos.diary_tags import DiaryTagSchemas
 from app.models.diaries import EmotionType, MoodModel
 
 
@@ -27,7 +28,7 @@ class DiaryUpdateRequest(BaseModel):  # 일기 수정
     mood: MoodModel
 
 
-class DiaryResponse(BaseModel):
+class DiaryBase(BaseModel):  # 상세 응답과 내보내기가 공유하는 필드
     id: int
     title: str
     content: str
@@ -39,3 +40,56 @@ class DiaryResponse(BaseModel):
     model_config = {
         "from_attributes": True,
     }
+
+
+class DiaryResponse(DiaryBase):
+    # include=tags로 요청했을 때만 채움 (요청하지 않으면 null)
+    tags: Optional[List[DiaryTagSchemas.TagResponse]] = None
+
+    @field_validator("tags", mode="before")
+    @classmethod
+    def skip_unfetched_tags(cls, value):
+        # 모델에서 읽히는 M2M 관계 객체는 무시 (태그는 라우터에서 일괄 조회해 채움)
+        return value if isinstance(value, list) else None
+
+
+class DiaryListResponse(BaseModel):  # 커서 기반 페이지 응답
+    items: List[DiaryResponse]
+    next_cursor: Optional[str] = None
+
+
+class DiaryExportRecord(DiaryBase):  # 내보내기 NDJSON 한 줄
+    # 가져오기(DiaryImportRow)와 같은 형식이 되도록 태그명 목록으로 내보냄
+    tags: List[str] = []
+    mood: MoodModel
+    emotion_summary: Optional[dict] = None
+
+
+class DiaryImportRow(DiaryCreateRequest):  # 가져오기 한 줄 (NDJSON 객체/CSV 행)
+    title: str = Field(max_length=255)
+    tags: List[Annotated[str, Field(min_length=1, max_length=100)]] = []
+    created_at: Optional[datetime] = None
+
+    @field_validator("tags", mode="before")
+    @classmethod
+    def split_tags(cls, value):
+        # CSV에서는 "a,b,c" 형태의 문자열로 들어옴
+        if isinstance(value, str):
+            return [tag.strip() for tag in value.split(",") if tag.strip()]
+        return value
+
+    @field_validator("created_at", mode="before")
+    @classmethod
+    def empty_created_at(cls, value):
+        return value or None
+
+
+class DiaryImportError(BaseModel):
+    line: int
+    error: str
+
+
+class DiaryImportResponse(BaseModel):
+    imported: int
+    failed: int
+    errors: List[DiaryImportError] = []
@@ -1,4 +1,9 @@
-from pydantic import BaseModel
+from typing import Annotated, List
+
+from pydantic import BaseModel, Field, model_validator
+
+# 한 번에 붙이거나 뗄 수 있는 최대 태그 수
+MAX_BATCH_TAGS = 100
 
 
 class DiaryTagSchemas:
@@ -6,6 +11,23 @@ class DiaryTagSchemas:
     class TagAddRequest(BaseModel):
         id: int
 
+    # 요청 바디: 여러 태그 일괄 제거 (ID와 태그명을 섞어서 지정 가능)
+    class TagBatchRequest(BaseModel):
+        ids: List[int] = Field(default=[], max_length=MAX_BATCH_TAGS)
+        names: List[Annotated[str, Field(min_length=1, max_length=100)]] = Field(
+            default=[], max_length=MAX_BATCH_TAGS
+        )
+
+        @model_validator(mode="after")
+        def check_not_empty(self):
+            if not self.ids and not self.names:
+                raise ValueError("ids or names is required")
+            return self
+
+    # 요청 바디: 여러 태그 일괄 추가
+    class TagBatchAddRequest(TagBatchRequest):
+        create_missing: bool = False  # 없는 태그명은 새로 만들어 붙임
+
     # 응답 메시지
     class MessageResponse(BaseModel):
         message: str
@@ -14,3 +36,9 @@ class DiaryTagSchemas:
     class TagResponse(BaseModel):
         id: int
         name: str
+
+    # 일괄 추가/제거 응답: 요청한 태그와 실제로 바뀐 연결 수
+    class TagBatchResponse(BaseModel):
+        message: str
+        changed: int
+        tags: List["DiaryTagSchemas.TagResponse"]
@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+
+from app.models.emotion_stats import TimePeriodTypeModel
+
+
+class EmotionStatResponse(BaseModel):
+    time_period_type: TimePeriodTypeModel
+    time_period_value: str
+    emotion_type: str
+    frequency: int
+
+    model_config = {
+        "from_attributes": True,
+    }
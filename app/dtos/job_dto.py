@@ -0,0 +1,22 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+from app.models.jobs import JobStatus, JobType
+
+
+class JobResponse(BaseModel):
+    id: int
+    job_type: JobType
+    status: JobStatus
+    attempts: int
+    result: Optional[dict] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    model_config = {
+        "from_attributes": True,
+    }
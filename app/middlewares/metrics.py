@@ -0,0 +1,43 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.services.metrics import RequestStats, current_request, record_request
+
+
+class MetricsMiddleware:
+    """
+    요청마다 지연 시간, 상태 코드, DB 쿼리 수/시간을 기록하는 ASGI 미들웨어.
+    경로는 실제 URL이 아니라 라우트 템플릿(/diaries/{diary_id})으로 묶어
+    레이블 값이 늘어나지 않도록 합니다.
+    BaseHTTPMiddleware를 쓰지 않아 요청당 추가 비용은 몇 마이크로초 수준입니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500  # 응답을 시작하기 전에 예외가 나면 500으로 기록
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        stats = RequestStats()
+        token = current_request.set(stats)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            current_request.reset(token)
+            # 라우터가 매칭한 라우트 (FastAPI가 scope에 넣어 줌)
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "unmatched"
+            record_request(scope["method"], route_path, status, elapsed, stats)
@@ -0,0 +1,54 @@
+import logging
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.services.query_profiler import profile_queries
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = "X-Query-Profile"
+
+
+class QueryProfilerMiddleware:
+    """
+    요청마다 실행된 SQL을 모양별로 모아 응답 헤더(X-Query-Profile)와 로그로 요약하는
+    ASGI 미들웨어. 스테이징에서 QUERY_PROFILER_ENABLED로 켜서 사용합니다.
+    헤더는 응답을 시작할 때까지의 쿼리만 반영하므로, 스트리밍 응답은
+    끝난 뒤 남기는 로그를 봐야 합니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with profile_queries() as profile:
+
+            async def send_with_profile(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers.append(PROFILE_HEADER, profile.header_value())
+                await send(message)
+
+            await self.app(scope, receive, send_with_profile)
+
+        route = scope.get("route")
+        route_path = getattr(route, "path", None) or scope["path"]
+        if profile.n_plus_one():
+            logger.warning(
+                "Probable N+1 queries in %s %s: %s",
+                scope["method"],
+                route_path,
+                profile.summary(),
+            )
+        else:
+            logger.info(
+                "Query profile for %s %s: %s",
+                scope["method"],
+                route_path,
+                profile.header_value(),
+            )
@@ -0,0 +1,18 @@
+from tortoise import fields, models
+
+
+class AIResultCacheModel(models.Model):
+    key = fields.CharField(
+        max_length=64, pk=True, description="(종류, 내용, 모델, 프롬프트 버전) 해시"
+    )
+    kind = fields.CharField(max_length=30, description="결과 종류 (summary/emotion)")
+    model_name = fields.CharField(max_length=100, description="Gemini 모델 이름")
+    prompt_version = fields.CharField(max_length=20, description="프롬프트 버전")
+    result: dict = fields.JSONField(description="Gemini 결과")
+    created_at = fields.DatetimeField(auto_now_add=True, description="생성일")
+
+    class Meta:
+        table = "ai_result_cache"
+
+    def __str__(self):
+        return f"{self.kind}:{self.key}"
@@ -25,6 +25,7 @@ class DiaryModel(models.Model):
     user: fields.ForeignKeyRelation["UserModel"] = fields.ForeignKeyField(
         "models.UserModel", related_name="user_diaries", on_delete=fields.CASCADE
     )
+    user_id: int
     # user_email = fields.ForeignKeyField(
     #     "models.UserModel", related_name="diaries", description="사용자 이메일"
     # )
@@ -50,6 +51,8 @@ class DiaryModel(models.Model):
     class Meta:
         table = "diaries"
         app = "models"
+        # 커서 페이지네이션 (created_at, id) 정렬/범위 조회용 복합 인덱스
+        indexes = (("created_at", "id"),)
 
     def __str__(self):
         return self.title
@@ -0,0 +1,35 @@
+from typing import TYPE_CHECKING
+
+from tortoise import fields, models
+from tortoise.contrib.postgres.fields import TSVectorField
+from tortoise.contrib.postgres.indexes import GinIndex
+
+if TYPE_CHECKING:
+    from app.models.diaries import DiaryModel
+
+
+class DiarySearchModel(models.Model):
+    """
+    일기 제목/내용의 전문 검색용 문서 (tsvector).
+    diaries 조회 때마다 큰 tsvector를 함께 읽지 않도록 별도 테이블에 둡니다.
+    """
+
+    diary: fields.OneToOneRelation["DiaryModel"] = fields.OneToOneField(
+        "models.DiaryModel",
+        pk=True,
+        related_name="search_document",
+        on_delete=fields.CASCADE,
+    )
+    diary_id: int
+    user_id = fields.IntField(description="일기 작성자 ID")
+    document = TSVectorField(description="제목(A)/내용(D) 가중치가 적용된 검색 문서")
+    updated_at = fields.DatetimeField(auto_now=True, description="수정일자")
+
+    class Meta:
+        table = "diary_search"
+        app = "models"
+        # 사용자 범위 제한도 문서 안의 사용자 어휘소로 GIN 인덱스에서 처리
+        indexes = (GinIndex(fields=("document",)),)
+
+    def __str__(self):
+        return f"diary_search:{self.diary_id}"
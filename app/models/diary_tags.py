@@ -18,3 +18,5 @@ class DiaryTagModel(models.Model):
     class Meta:
         table = "diary_tags"
         unique_together = ("diary", "tag")
+        # 태그 필터 (tag_id로 diary_id 찾기)를 인덱스만으로 처리
+        indexes = (("tag", "diary"),)
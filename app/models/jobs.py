@@ -0,0 +1,55 @@
+from datetime import datetime
+from enum import Enum
+from typing import TYPE_CHECKING
+
+from tortoise import fields, models
+
+if TYPE_CHECKING:
+    from app.models.users import UserModel
+
+
+class JobType(str, Enum):
+    EMOTION_ANALYSIS = "emotion_analysis"
+
+
+class JobStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class JobModel(models.Model):
+    id = fields.IntField(pk=True, description="작업 고유 ID")
+    user: fields.ForeignKeyRelation["UserModel"] = fields.ForeignKeyField(
+        "models.UserModel", related_name="jobs", on_delete=fields.CASCADE
+    )
+    user_id: int
+    job_type = fields.CharEnumField(JobType, description="작업 종류")
+    status = fields.CharEnumField(
+        JobStatus, default=JobStatus.PENDING, description="작업 상태"
+    )
+    payload: dict = fields.JSONField(default=dict, description="작업 입력값")
+    result: dict | None = fields.JSONField(null=True, description="작업 결과")
+    error: str | None = fields.TextField(null=True, description="마지막 실패 사유")
+    attempts = fields.IntField(default=0, description="실행 시도 횟수")
+    run_after = fields.DatetimeField(description="이 시각 이후에 실행 가능")
+    locked_until: datetime | None = fields.DatetimeField(
+        null=True, description="실행 중인 워커의 점유 만료 시각"
+    )
+    started_at: datetime | None = fields.DatetimeField(
+        null=True, description="마지막 실행 시작 시각"
+    )
+    finished_at: datetime | None = fields.DatetimeField(
+        null=True, description="완료 시각"
+    )
+    created_at = fields.DatetimeField(auto_now_add=True, description="생성일")
+    updated_at = fields.DatetimeField(auto_now=True, description="수정일")
+
+    class Meta:
+        table = "jobs"
+        # 워커가 실행 가능한 작업을 찾을 때 사용하는 인덱스
+        indexes = (("status", "run_after"),)
+
+    def __str__(self):
+        return f"{self.job_type.value}#{self.id} ({self.status.value})"
@@ -10,3 +10,17 @@ class Tag(models.Model):
 
     def __str__(self):
         return self.name
+
+
+class TagCatalogVersionModel(models.Model):
+    """
+    태그 목록 버전 (행 하나). 태그가 추가/삭제될 때마다 1씩 올라가며,
+    각 워커는 이 값만 주기적으로 읽어 메모리의 태그 목록이 오래되었는지 확인합니다.
+    """
+
+    id = fields.IntField(pk=True)
+    version = fields.BigIntField(default=0, description="태그 목록 버전")
+    updated_at = fields.DatetimeField(auto_now=True, description="수정일자")
+
+    class Meta:
+        table = "tag_catalog_version"
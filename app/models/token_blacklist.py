@@ -2,11 +2,18 @@ from tortoise import fields, models
 
 
 class TokenBlacklist(models.Model):
-    token = fields.CharField(max_length=500, unique=True, description="블랙리스트 토큰")
-    created_at = fields.DatetimeField(auto_now_add=True, description="생성일")
+    fingerprint = fields.CharField(
+        max_length=64, unique=True, description="토큰 식별자 (jti 또는 SHA-256 해시)"
+    )
+    expires_at = fields.DatetimeField(
+        index=True, description="토큰 만료 시각 (지나면 삭제 가능)"
+    )
+    created_at = fields.DatetimeField(
+        auto_now_add=True, index=True, description="생성일"
+    )
 
     class Meta:
         table = "token_blacklist"
 
     def __str__(self):
-        return self.token
+        return self.fingerprint
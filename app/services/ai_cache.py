@@ -0,0 +1,101 @@
+import hashlib
+
+from app.config.config import settings
+from app.models.ai_cache import AIResultCacheModel
+from app.services.metrics import register_cache
+from app.utils.cache import TTLCache
+
+
+class AIResultCache:
+    """
+    Gemini 결과를 (종류, 내용, 모델, 프롬프트 버전) 해시로 저장하는 캐시.
+    프로세스 내 LRU를 먼저 확인하고, 없으면 ai_result_cache 테이블을 확인합니다.
+    내용이 같으면 결과도 같다고 보므로 DB 항목은 만료시키지 않고,
+    프롬프트나 모델을 바꿀 때는 버전을 올려 새 키를 쓰도록 합니다.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self._memory: TTLCache[str, dict] = TTLCache(max_size=max_size, ttl=ttl)
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(kind: str, content: str, model_name: str, prompt_version: str) -> str:
+        raw = "\x00".join((kind, model_name, prompt_version, content))
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    async def get(
+        self, kind: str, content: str, model_name: str, prompt_version: str
+    ) -> dict | None:
+        """
+        캐시된 결과를 반환합니다.
+        :return: 캐시된 결과 또는 None
+        """
+        key = self.make_key(kind, content, model_name, prompt_version)
+        result = self._memory.get(key)
+        if result is not None:
+            self.memory_hits += 1
+            return result
+
+        row = await AIResultCacheModel.get_or_none(key=key)
+        if row is not None:
+            self.db_hits += 1
+            self._memory.set(key, row.result)
+            return row.result
+
+        self.misses += 1
+        return None
+
+    async def set(
+        self,
+        kind: str,
+        content: str,
+        model_name: str,
+        prompt_version: str,
+        result: dict,
+    ) -> None:
+        """
+        결과를 메모리와 DB에 저장합니다.
+        같은 키가 이미 있으면 (동시에 같은 내용을 요청한 경우) 기존 값을 유지합니다.
+        """
+        key = self.make_key(kind, content, model_name, prompt_version)
+        self._memory.set(key, result)
+        await AIResultCacheModel.bulk_create(
+            [
+                AIResultCacheModel(
+                    key=key,
+                    kind=kind,
+                    model_name=model_name,
+                    prompt_version=prompt_version,
+                    result=result,
+                )
+            ],
+            ignore_conflicts=True,
+        )
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._memory),
+            "memory_hits": self.memory_hits,
+            "db_hits": self.db_hits,
+            "misses": self.misses,
+        }
+
+
+ai_result_cache = AIResultCache(
+    max_size=settings.AI_CACHE_MAX_SIZE, ttl=settings.AI_CACHE_TTL_SECONDS
+)
+
+# 메모리에서 못 찾은 요청만 DB를 확인하므로 계층별로 나누어 노출
+register_cache(
+    "ai_result_memory",
+    lambda: {
+        "hits": ai_result_cache.memory_hits,
+        "misses": ai_result_cache.db_hits + ai_result_cache.misses,
+    },
+)
+register_cache(
+    "ai_result_db",
+    lambda: {"hits": ai_result_cache.db_hits, "misses": ai_result_cache.misses},
+)
@@ -1,5 +1,10 @@
+import asyncio
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Any, Callable, Optional, TypeVar
+from uuid import uuid4
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
@@ -8,11 +13,34 @@ from app.config.config import settings
 from app.dtos.user_dto import (  # 사용자 DTO 임포트 (비밀번호 포함된 사용자 정보)
     UserInDB,
 )
-from app.models.token_blacklist import TokenBlacklist
 from app.models.users import UserModel  # 사용자 모델 임포트
+from app.services.metrics import PASSWORD_HASH_SECONDS, register_cache
+from app.services.token_revocation import token_fingerprint, token_revocation_store
+from app.utils.cache import TTLCache
 
 # 비밀번호 해싱을 위한 CryptContext 설정
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# rounds는 새 해시의 cost, min_rounds보다 낮은 cost로 저장된 해시는
+# verify_and_update가 새 해시를 돌려주므로 로그인 시 다시 해싱됨
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+)
+
+# bcrypt는 요청당 수백 ms CPU를 쓰므로 이벤트 루프 밖의 전용 스레드 풀에서 실행
+# (bcrypt C 확장은 해싱 중 GIL을 놓기 때문에 스레드로도 병렬 처리됨)
+_password_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash"
+)
+
+# 서명 검증을 마친 토큰의 페이로드 캐시 (토큰 SHA-256 -> 페이로드)
+# 각 항목은 토큰의 exp까지만 유지되고, 블랙리스트에 추가되면 즉시 제거됨
+_verified_token_cache: TTLCache[bytes, dict] = TTLCache(
+    max_size=settings.JWT_CACHE_MAX_SIZE
+)
+
+T = TypeVar("T")
 
 
 SECRET_KEY = settings.SECRET_KEY
@@ -20,6 +48,15 @@ ALGORITHM = settings.ALGORITHM
 ACCESS_TOKEN_EXPIRE_MINUTES = settings.ACCESS_TOKEN_EXPIRE_MINUTES
 REFRESH_TOKEN_EXPIRE_MINUTES = settings.REFRESH_TOKEN_EXPIRE_MINUTES
 
+# 인증된 사용자 조회 결과 캐시 (이메일 -> UserInDB)
+# update_user/delete_user에서 무효화하고, 다른 워커의 변경은 TTL 안에 반영됨
+_user_cache: TTLCache[str, UserInDB] = TTLCache(
+    max_size=settings.USER_CACHE_MAX_SIZE, ttl=settings.USER_CACHE_TTL_SECONDS
+)
+
+register_cache("user", _user_cache.stats)
+register_cache("verified_token", _verified_token_cache.stats)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
@@ -40,6 +77,39 @@ def get_password_hash(password: str) -> str:
     return str(pwd_context.hash(password))
 
 
+async def _run_in_password_executor(func: Callable[..., T], *args: Any) -> T:
+    loop = asyncio.get_running_loop()
+    started = time.perf_counter()
+    try:
+        return await loop.run_in_executor(_password_executor, func, *args)
+    finally:
+        PASSWORD_HASH_SECONDS.observe(time.perf_counter() - started, func.__name__)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """
+    get_password_hash를 전용 스레드 풀에서 실행합니다. (이벤트 루프 차단 없음)
+    :param password: 해싱할 평문 비밀번호
+    :return: 해싱된 비밀번호 문자열
+    """
+    return await _run_in_password_executor(get_password_hash, password)
+
+
+async def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, Optional[str]]:
+    """
+    비밀번호를 검증하고, 저장된 해시가 현재 설정(cost 등)과 다르면 새 해시를 만듭니다.
+    :param plain_password: 사용자가 입력한 평문 비밀번호
+    :param hashed_password: 데이터베이스에 저장된 해싱된 비밀번호
+    :return: (일치 여부, 새 해시 또는 None)
+    """
+    verified, new_hash = await _run_in_password_executor(
+        pwd_context.verify_and_update, plain_password, hashed_password
+    )
+    return bool(verified), new_hash
+
+
 def create_token(
     data: dict, token_type: str, expires_delta: Optional[timedelta] = None
 ) -> str:
@@ -72,21 +142,42 @@ def create_token(
         # 유효하지 않은 토큰 타입이 전달된 경우 에러 발생
         raise ValueError("Invalid token type. Must be 'access' or 'refresh'.")
 
-    # 페이로드에 만료 시간(exp)과 토큰 타입(type) 클레임 추가
-    to_encode.update({"exp": expire, "type": token_type})
+    # 페이로드에 만료 시간(exp), 토큰 타입(type), 폐기 식별용 jti 클레임 추가
+    to_encode.update({"exp": expire, "type": token_type, "jti": uuid4().hex})
 
     # JWT 인코딩 (서명)
     encoded_jwt = str(jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM))
     return encoded_jwt
 
 
-async def get_user(email: str) -> Optional[UserInDB]:
+async def get_user(email: str, use_cache: bool = True) -> Optional[UserInDB]:
+    """
+    이메일로 사용자를 조회합니다. 캐시에 있으면 DB를 조회하지 않습니다.
+    :param email: 사용자 이메일
+    :param use_cache: False면 캐시를 건너뛰고 항상 DB에서 조회
+    :return: UserInDB 객체 또는 None
+    """
+    if use_cache:
+        cached = _user_cache.get(email)
+        if cached is not None:
+            return cached
+
     user = await UserModel.get_or_none(email=email)
     if user:
-        return UserInDB.model_validate(user)
+        user_in_db = UserInDB.model_validate(user)
+        _user_cache.set(email, user_in_db)
+        return user_in_db
     return None
 
 
+def invalidate_cached_user(email: str) -> None:
+    """
+    사용자 정보가 바뀌었을 때 캐시에서 제거합니다.
+    :param email: 사용자 이메일
+    """
+    _user_cache.pop(email)
+
+
 async def authenticate_user(email: str, password: str) -> Optional[UserInDB]:
     """
     사용자 이메일과 비밀번호를 사용하여 인증을 수행합니다.
@@ -94,46 +185,97 @@ async def authenticate_user(email: str, password: str) -> Optional[UserInDB]:
     :param password: 사용자가 입력한 비밀번호
     :return: 인증된 UserInDB 객체 또는 False
     """
-    user = await get_user(email)  # 이메일로 사용자 조회
+    # 다른 워커에서 바뀐 비밀번호가 캐시 때문에 늦게 반영되지 않도록 DB에서 조회
+    user = await get_user(email, use_cache=False)
     if not user:
         return None  # 사용자가 존재하지 않으면 인증 실패
 
     # 저장된 해싱 비밀번호와 입력된 비밀번호 비교
-    if not verify_password(password, user.password):
+    verified, new_hash = await verify_and_update_password(password, user.password)
+    if not verified:
         return None  # 비밀번호가 일치하지 않으면 인증 실패
 
+    # 이전 설정으로 만든 해시면 로그인하는 김에 새 설정으로 다시 저장
+    if new_hash:
+        await UserModel.filter(id=user.id).update(password=new_hash)
+        invalidate_cached_user(user.email)
+        user = user.model_copy(update={"password": new_hash})
+
     return user  # 인증 성공 시 사용자 객체 반환
 
 
+def _token_cache_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
+
+
 def decode_token(token: str) -> Optional[dict]:
+    """
+    JWT 서명을 검증하고 페이로드를 반환합니다.
+    같은 토큰은 만료 전까지 검증 결과를 캐시해 서명 검증을 반복하지 않습니다.
+    :param token: JWT 문자열
+    :return: 페이로드 또는 None (검증 실패 시)
+    """
+    cache_key = _token_cache_key(token)
+    cached = _verified_token_cache.get(cache_key)
+    if cached is not None:
+        return dict(cached)
 
     try:
         # JWT 디코딩 및 서명 검증
         payload = dict(jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM]))
-        return payload
     except JWTError:
         # JWT 관련 오류 (예: 토큰 만료, 서명 불일치, 변조 등) 발생 시 None 반환
         return None
 
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        ttl = exp - time.time()
+        if ttl > 0:
+            _verified_token_cache.set(cache_key, dict(payload), ttl=ttl)
+    return payload
 
-async def add_token_to_blacklist(token: str):
+
+async def add_token_to_blacklist(token: str) -> None:
     """
     주어진 토큰을 블랙리스트에 추가하여 무효화합니다.
     주로 로그아웃 시 액세스 토큰을 재사용할 수 없도록 할 때 사용됩니다.
+    토큰 전체 대신 식별자(jti 또는 해시)와 만료 시각만 저장하며,
+    만료 시각이 지나면 주기적으로 삭제됩니다.
+    서명이 맞지 않거나 이미 만료된 토큰은 어차피 인증에 쓸 수 없으므로
+    저장하지 않습니다. (위조한 토큰으로 블랙리스트를 채울 수 없도록)
     :param token: 블랙리스트에 추가할 토큰 문자열
     """
-    if not await is_token_blacklisted(token):
-        await TokenBlacklist.create(token=token)
+    payload = decode_token(token)
+    if payload is None:
+        return
+
+    # 발급할 수 있는 가장 긴 수명을 넘겨 보관하지 않음
+    max_expires_at = datetime.now(timezone.utc) + timedelta(
+        minutes=max(ACCESS_TOKEN_EXPIRE_MINUTES, REFRESH_TOKEN_EXPIRE_MINUTES)
+    )
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)) and exp < max_expires_at.timestamp():
+        expires_at = datetime.fromtimestamp(exp, tz=timezone.utc)
+    else:
+        expires_at = max_expires_at
+    await token_revocation_store.revoke(token_fingerprint(token, payload), expires_at)
+    _verified_token_cache.pop(_token_cache_key(token))
 
 
-async def is_token_blacklisted(token: str) -> bool:
+async def is_token_blacklisted(token: str, payload: Optional[dict] = None) -> bool:
     """
     주어진 토큰이 블랙리스트에 등록되어 있는지 확인합니다.
+    보통은 메모리에 동기화된 블랙리스트로 답하므로 DB를 조회하지 않습니다.
     :param token: 확인할 토큰 문자열
+    :param payload: 이미 디코딩한 페이로드 (있으면 jti를 바로 사용)
     :return: 토큰이 블랙리스트에 있으면 True, 없으면 False
     """
-    blacklisted_token = await TokenBlacklist.get_or_none(token=token)
-    return blacklisted_token is not None  # 토큰이 존재하면 True, 없으면 False
+    if payload is None:
+        try:
+            payload = dict(jwt.get_unverified_claims(token))
+        except JWTError:
+            payload = {}
+    return await token_revocation_store.is_revoked(token_fingerprint(token, payload))
 
 
 async def update_user(user_id: int, user_update_data: dict) -> Optional[UserModel]:
@@ -148,12 +290,15 @@ async def update_user(user_id: int, user_update_data: dict) -> Optional[UserMode
         return None
 
     if "password" in user_update_data and user_update_data["password"]:
-        user_update_data["password"] = get_password_hash(user_update_data["password"])
+        user_update_data["password"] = await get_password_hash_async(
+            user_update_data["password"]
+        )
 
     for field, value in user_update_data.items():
         setattr(user, field, value)
 
     await user.save()
+    invalidate_cached_user(user.email)
     return user
 
 
@@ -163,4 +308,5 @@ async def delete_user(user_id: int) -> bool:
     if not user:
         return False
     await user.delete()
+    invalidate_cached_user(user.email)
     return True
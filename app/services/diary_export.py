@@ -0,0 +1,79 @@
+import zlib
+from typing import AsyncIterator
+
+from app.config.database import read_db
+from app.dtos.diary_dto import DiaryExportRecord, EmotionKeywordResponse
+from app.models.diaries import DiaryModel
+from app.models.emotion_keywords import EmotionKeywordModel
+from app.services.diary_tags import DiaryTagService
+
+EXPORT_BATCH_SIZE = 500
+
+
+async def iter_diary_export(user_id: int) -> AsyncIterator[bytes]:
+    """
+    사용자의 모든 일기를 NDJSON(한 줄에 일기 하나)으로 내보냅니다.
+    일기를 id 순으로 EXPORT_BATCH_SIZE개씩 읽고, 묶음마다 감정 키워드와 태그를
+    각각 한 번의 쿼리로 가져오므로 메모리는 일기 수와 관계없이 한 묶음 크기로
+    유지되고 쿼리 수는 묶음당 3번입니다.
+    :param user_id: 내보낼 일기의 작성자 ID
+    :return: 묶음 단위 NDJSON 바이트
+    """
+    tag_service = DiaryTagService()
+    db = read_db()  # 내보내기는 읽기 전용이므로 복제본(설정된 경우)에서 처리
+    last_id = 0
+    while True:
+        diaries = (
+            await DiaryModel.filter(user_id=user_id, id__gt=last_id)
+            .using_db(db)
+            .order_by("id")
+            .limit(EXPORT_BATCH_SIZE)
+        )
+        if not diaries:
+            break
+        diary_ids = [diary.id for diary in diaries]
+
+        keywords_by_diary: dict[int, list[EmotionKeywordResponse]] = {}
+        keyword_rows = (
+            await EmotionKeywordModel.filter(diary_id__in=diary_ids)
+            .using_db(db)
+            .order_by("id")
+            .values_list("diary_id", "word", "emotion")
+        )
+        for diary_id, word, emotion in keyword_rows:
+            keywords_by_diary.setdefault(diary_id, []).append(
+                EmotionKeywordResponse(word=word, emotion=emotion)
+            )
+        tags_by_diary = await tag_service.get_tags_for_diaries(diary_ids, using_db=db)
+
+        lines = [
+            DiaryExportRecord(
+                id=diary.id,
+                title=diary.title,
+                content=diary.content,
+                mood=diary.mood,
+                emotion=diary.emotion,
+                emotion_summary=diary.emotion_summary,
+                emotion_keywords=keywords_by_diary.get(diary.id, []),
+                tags=[tag.name for tag in tags_by_diary.get(diary.id, [])],
+                created_at=diary.created_at,
+                updated_at=diary.updated_at,
+            ).model_dump_json()
+            for diary in diaries
+        ]
+        yield ("\n".join(lines) + "\n").encode()
+        last_id = diary_ids[-1]
+
+
+async def gzip_stream(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """
+    바이트 스트림을 gzip 형식으로 압축하면서 그대로 흘려보냅니다.
+    :param chunks: 원본 바이트 스트림
+    :return: gzip 압축된 바이트 스트림
+    """
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)  # gzip 헤더 사용
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
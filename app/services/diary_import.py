@@ -0,0 +1,247 @@
+import codecs
+import csv
+import json
+import logging
+import zlib
+from typing import AsyncIterator
+
+from pydantic import ValidationError
+from tortoise import connections
+from tortoise.transactions import in_transaction
+
+from app.dtos.diary_dto import DiaryImportError, DiaryImportResponse, DiaryImportRow
+from app.models.diaries import DiaryModel
+from app.models.diary_tags import DiaryTagModel
+from app.models.tags import Tag
+from app.services import diary_search
+from app.services.tag_catalog import tag_catalog
+
+logger = logging.getLogger(__name__)
+
+IMPORT_BATCH_SIZE = 1000
+# 응답에 담는 행별 오류 최대 개수 (실패 건수는 모두 셈)
+MAX_REPORTED_ERRORS = 1000
+
+# bulk_create는 생성된 id를 돌려주지 않으므로 시퀀스에서 id를 미리 받아 둠
+_RESERVE_IDS_SQL = (
+    "SELECT nextval(pg_get_serial_sequence('diaries', 'id')) AS id "
+    "FROM generate_series(1, $1)"
+)
+
+RawRow = tuple[int, dict | ValueError]  # (줄 번호, 파싱된 행 또는 파싱 오류)
+
+
+async def iter_lines(
+    chunks: AsyncIterator[bytes], gzipped: bool = False
+) -> AsyncIterator[str]:
+    """
+    업로드 바이트 스트림을 줄 단위 문자열로 바꿉니다.
+    본문 전체를 메모리에 올리지 않습니다.
+    :param chunks: 요청 본문 바이트 스트림
+    :param gzipped: 본문이 gzip으로 압축되어 있으면 True
+    :return: 줄바꿈이 제거된 줄
+    """
+    decompressor = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16) if gzipped else None
+    # 청크 경계에서 잘린 멀티바이트 문자와 BOM(엑셀 CSV)을 처리
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    async for chunk in chunks:
+        if decompressor is not None:
+            chunk = decompressor.decompress(chunk)
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    if decompressor is not None:
+        buffer += decoder.decode(decompressor.flush())
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer.rstrip("\r")
+
+
+async def iter_ndjson_rows(lines: AsyncIterator[str]) -> AsyncIterator[RawRow]:
+    line_no = 0
+    async for line in lines:
+        line_no += 1
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            yield line_no, ValueError(f"Invalid JSON: {e}")
+            continue
+        if not isinstance(row, dict):
+            yield line_no, ValueError("Each line must be a JSON object")
+            continue
+        yield line_no, row
+
+
+async def iter_csv_rows(lines: AsyncIterator[str]) -> AsyncIterator[RawRow]:
+    """
+    첫 줄을 헤더로 하는 CSV를 행 단위로 읽습니다.
+    따옴표 안의 줄바꿈으로 여러 줄에 걸친 행은
+    따옴표 개수가 짝수가 될 때까지 이어 붙입니다.
+    """
+    header: list[str] | None = None
+    record: list[str] = []
+    record_line_no = 0
+    line_no = 0
+    async for line in lines:
+        line_no += 1
+        if not record:
+            record_line_no = line_no
+        record.append(line)
+        text = "\n".join(record)
+        if text.count('"') % 2:
+            continue
+        record = []
+        if not text.strip():
+            continue
+        values = next(csv.reader([text]))
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        if len(values) != len(header):
+            yield record_line_no, ValueError(
+                f"Expected {len(header)} columns, got {len(values)}"
+            )
+            continue
+        yield record_line_no, dict(zip(header, values))
+    if record:
+        yield record_line_no, ValueError("Unterminated quoted field")
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc'])}: {detail['msg']}"
+        for detail in error.errors()
+    )
+
+
+class DiaryImporter:
+    """
+    검증된 행을 IMPORT_BATCH_SIZE개씩 모아 한 트랜잭션으로 저장합니다.
+    묶음마다 id 예약, 일기 일괄 삽입, 태그 연결 일괄 삽입, 검색 문서 upsert로
+    행 개수와 관계없이 일정한 수의 쿼리만 실행합니다.
+    """
+
+    def __init__(self, user_id: int):
+        self.user_id = user_id
+        self.imported = 0
+        self.failed = 0
+        self.errors: list[DiaryImportError] = []
+        self._batch: list[tuple[int, DiaryImportRow]] = []
+
+    def record_error(self, line_no: int, message: str) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(DiaryImportError(line=line_no, error=message))
+
+    async def add(self, line_no: int, raw: dict | ValueError) -> None:
+        if isinstance(raw, ValueError):
+            self.record_error(line_no, str(raw))
+            return
+        try:
+            row = DiaryImportRow.model_validate(raw)
+        except ValidationError as e:
+            self.record_error(line_no, _format_validation_error(e))
+            return
+        self._batch.append((line_no, row))
+        if len(self._batch) >= IMPORT_BATCH_SIZE:
+            await self.flush()
+
+    async def _resolve_tag_ids(self, names: list[str]) -> dict[str, int]:
+        # 없는 태그는 먼저 만들어 둠 (일기 저장이 실패해도 태그만 남는 것은 무해)
+        tag_ids = await tag_catalog.resolve_ids(names)
+        missing = [name for name in names if name not in tag_ids]
+        if missing:
+            await Tag.bulk_create(
+                [Tag(name=name) for name in missing], ignore_conflicts=True
+            )
+            # 복제본 지연으로 방금 만든 태그를 못 찾지 않도록 primary에서 조회
+            tag_ids.update(
+                await tag_catalog.resolve_ids(
+                    missing, using_db=connections.get("default")
+                )
+            )
+            await tag_catalog.publish_change()  # 다른 워커도 새 태그를 읽도록
+        return tag_ids
+
+    async def flush(self) -> None:
+        batch, self._batch = self._batch, []
+        if not batch:
+            return
+        try:
+            tag_names = list(dict.fromkeys(tag for _, row in batch for tag in row.tags))
+            tag_ids = await self._resolve_tag_ids(tag_names) if tag_names else {}
+
+            async with in_transaction("default") as conn:
+                reserved = await conn.execute_query_dict(_RESERVE_IDS_SQL, [len(batch)])
+                diaries = [
+                    DiaryModel(
+                        id=reserved_row["id"],
+                        user_id=self.user_id,
+                        title=row.title,
+                        content=row.content,
+                        mood=row.mood,
+                        # 작성일자가 없으면 auto_now_add로 현재 시각 사용
+                        **({"created_at": row.created_at} if row.created_at else {}),
+                    )
+                    for reserved_row, (_, row) in zip(reserved, batch)
+                ]
+                await DiaryModel.bulk_create(diaries, using_db=conn)
+
+                diary_tags = [
+                    DiaryTagModel(diary_id=diary.id, tag_id=tag_ids[tag])
+                    for diary, (_, row) in zip(diaries, batch)
+                    for tag in dict.fromkeys(row.tags)
+                ]
+                if diary_tags:
+                    await DiaryTagModel.bulk_create(
+                        diary_tags, ignore_conflicts=True, using_db=conn
+                    )
+                await diary_search.index_diaries(
+                    [
+                        (diary.id, self.user_id, diary.title, diary.content)
+                        for diary in diaries
+                    ],
+                    using_db=conn,
+                )
+        except Exception as e:
+            logger.exception("Failed to import a batch of %s diaries", len(batch))
+            for line_no, _ in batch:
+                self.record_error(line_no, f"{type(e).__name__}: {e}")
+        else:
+            self.imported += len(batch)
+
+    def report(self) -> DiaryImportResponse:
+        return DiaryImportResponse(
+            imported=self.imported, failed=self.failed, errors=self.errors
+        )
+
+
+async def import_diaries(
+    user_id: int,
+    chunks: AsyncIterator[bytes],
+    file_format: str = "ndjson",
+    gzipped: bool = False,
+) -> DiaryImportResponse:
+    """
+    NDJSON 또는 CSV 업로드 스트림을 읽으면서 일기를 일괄 저장합니다.
+    :param user_id: 일기 작성자 ID
+    :param chunks: 요청 본문 바이트 스트림
+    :param file_format: "ndjson" 또는 "csv" (CSV는 첫 줄이 헤더)
+    :param gzipped: 본문이 gzip으로 압축되어 있으면 True
+    :return: 저장/실패 건수와 행별 오류
+    """
+    lines = iter_lines(chunks, gzipped)
+    rows = iter_csv_rows(lines) if file_format == "csv" else iter_ndjson_rows(lines)
+    importer = DiaryImporter(user_id)
+    try:
+        async for line_no, raw in rows:
+            await importer.add(line_no, raw)
+    except zlib.error as e:
+        # 압축이 깨진 경우 그 앞까지 읽은 행은 저장하고 오류로 보고
+        importer.record_error(0, f"Invalid gzip body: {e}")
+    await importer.flush()
+    return importer.report()
@@ -0,0 +1,215 @@
+import argparse
+import re
+
+from tortoise import BaseDBAsyncClient, connections, run_async
+
+from app.config.database import read_db
+from app.models.diaries import DiaryModel
+
+REINDEX_BATCH_SIZE = 500
+
+# tsvector 위치 값의 최대치와 어휘소당 위치 개수 제한 (Postgres 제약)
+MAX_POSITION = 16383
+MAX_POSITIONS_PER_TERM = 256
+# 지나치게 긴 토큰(URL, 난수 문자열 등)은 색인하지 않음
+MAX_TERM_LENGTH = 64
+
+_WORD_RE = re.compile(r"\w+")
+# 한글 음절 구간과 그 외(영문/숫자 등) 구간으로 나눔
+_SEGMENT_RE = re.compile(r"[가-힣]+|[^\W가-힣]+")
+_HANGUL_RE = re.compile(r"[가-힣]")
+
+# TSVectorField는 모델 인스턴스로 값을 다룰 수 없으므로 검색 문서는 SQL로 upsert
+_UPSERT_SQL = """
+INSERT INTO diary_search (diary_id, user_id, document, updated_at)
+VALUES ($1, $2, $3::tsvector, CURRENT_TIMESTAMP)
+ON CONFLICT (diary_id) DO UPDATE
+SET user_id = EXCLUDED.user_id,
+    document = EXCLUDED.document,
+    updated_at = EXCLUDED.updated_at
+"""
+
+# 사용자 범위 제한 어휘소와 검색어를 AND로 묶어 GIN 인덱스에서 함께 처리하고,
+# 점수는 검색어로만 계산
+_SEARCH_SQL = """
+SELECT diary_id, rank FROM (
+    SELECT diary_id, ts_rank(document, $2::tsquery) AS rank
+    FROM diary_search
+    WHERE document @@ ($1::tsquery && $2::tsquery)
+) AS matches
+{after}
+ORDER BY rank DESC, diary_id DESC
+LIMIT {limit}
+"""
+
+
+def search_terms(text: str) -> list[str]:
+    """
+    텍스트를 검색 어휘소 목록으로 나눕니다.
+    한국어는 조사/어미가 붙어 형태가 바뀌므로 한글 구간은 음절 바이그램으로,
+    그 외 구간은 소문자 단어 그대로 사용합니다. (예: "오늘은" -> 오늘, 늘은)
+    :param text: 제목, 내용 또는 검색어
+    :return: 등장 순서대로의 어휘소 목록 (중복 포함)
+    """
+    terms: list[str] = []
+    for word in _WORD_RE.findall(text.lower()):
+        for segment in _SEGMENT_RE.findall(word):
+            if len(segment) > MAX_TERM_LENGTH:
+                continue
+            if _HANGUL_RE.match(segment) and len(segment) > 1:
+                terms += [segment[i : i + 2] for i in range(len(segment) - 1)]
+            else:
+                terms.append(segment)
+    return terms
+
+
+def _quote(term: str) -> str:
+    return "'" + term.replace("\\", "\\\\").replace("'", "''") + "'"
+
+
+def _user_lexeme(user_id: int) -> str:
+    # \w+ 토큰에는 나올 수 없는 문자로 시작해 일반 어휘소와 겹치지 않음
+    return _quote(f"@user:{user_id}")
+
+
+def build_search_document(user_id: int, title: str, content: str) -> str:
+    """
+    일기의 검색 문서(tsvector 리터럴)를 만듭니다.
+    제목 어휘소는 가중치 A, 내용 어휘소는 기본 가중치(D)를 가집니다.
+    :param user_id: 일기 작성자 ID
+    :param title: 일기 제목
+    :param content: 일기 내용
+    :return: tsvector 리터럴 문자열
+    """
+    positions: dict[str, list[str]] = {}
+    position = 0
+    for weight, text in (("A", title), ("", content)):
+        for term in search_terms(text):
+            position = min(position + 1, MAX_POSITION)
+            term_positions = positions.setdefault(term, [])
+            if len(term_positions) < MAX_POSITIONS_PER_TERM:
+                term_positions.append(f"{position}{weight}")
+    lexemes = [_user_lexeme(user_id)] + [
+        f"{_quote(term)}:{','.join(term_positions)}"
+        for term, term_positions in positions.items()
+    ]
+    return " ".join(lexemes)
+
+
+def build_search_query(text: str) -> str | None:
+    """
+    검색어를 tsquery 리터럴로 바꿉니다. 모든 어휘소가 포함된 일기만 찾습니다.
+    한 글자 한글 검색어는 바이그램과 맞지 않으므로 접두어 검색으로 처리합니다.
+    :param text: 사용자가 입력한 검색어
+    :return: tsquery 리터럴 (검색할 어휘소가 없으면 None)
+    """
+    terms = dict.fromkeys(search_terms(text))
+    if not terms:
+        return None
+    return " & ".join(
+        _quote(term) + (":*" if _HANGUL_RE.match(term) and len(term) == 1 else "")
+        for term in terms
+    )
+
+
+async def index_diary(
+    diary: DiaryModel, using_db: BaseDBAsyncClient | None = None
+) -> None:
+    """
+    일기의 검색 문서를 만들거나 갱신합니다. 일기 생성/수정 시 호출합니다.
+    :param diary: 색인할 일기
+    :param using_db: 일기 저장과 같은 트랜잭션에서 실행할 때 넘기는 연결
+    """
+    await index_diaries(
+        [(diary.id, diary.user_id, diary.title, diary.content)], using_db=using_db
+    )
+
+
+async def index_diaries(
+    rows: list[tuple[int, int, str, str]],
+    using_db: BaseDBAsyncClient | None = None,
+) -> None:
+    """
+    여러 일기의 검색 문서를 한 번에 upsert합니다.
+    :param rows: [(일기 ID, 작성자 ID, 제목, 내용)]
+    :param using_db: 트랜잭션 연결
+    """
+    conn = using_db or connections.get("default")
+    await conn.execute_many(
+        _UPSERT_SQL,
+        [
+            [diary_id, user_id, build_search_document(user_id, title, content)]
+            for diary_id, user_id, title, content in rows
+        ],
+    )
+
+
+async def search_diaries(
+    user_id: int,
+    query: str,
+    limit: int,
+    after: tuple[float, int] | None = None,
+) -> list[tuple[int, float]]:
+    """
+    사용자의 일기를 전문 검색하여 점수 순으로 반환합니다.
+    (rank, id) 키셋 페이지네이션을 사용하므로 뒤쪽 페이지도 OFFSET 없이 조회합니다.
+    :param user_id: 검색하는 사용자 ID (본인 일기만 검색)
+    :param query: build_search_query로 만든 tsquery 리터럴
+    :param limit: 최대 결과 수
+    :param after: 이전 페이지 마지막 항목의 (rank, id)
+    :return: [(일기 ID, 점수)]
+    """
+    values: list = [_user_lexeme(user_id), query]
+    after_clause = ""
+    if after is not None:
+        after_clause = "WHERE (rank, diary_id) < ($3::real, $4)"
+        values += list(after)
+    values.append(limit)
+    sql = _SEARCH_SQL.format(after=after_clause, limit=f"${len(values)}")
+    rows = await read_db().execute_query_dict(sql, values)
+    return [(row["diary_id"], row["rank"]) for row in rows]
+
+
+async def rebuild_search_index(user_id: int | None = None) -> int:
+    """
+    모든 일기의 검색 문서를 다시 만듭니다. (기존 일기 백필/토크나이저 변경 시)
+    :param user_id: 특정 사용자만 다시 만들 때 지정
+    :return: 색인한 일기 수
+    """
+    query = DiaryModel.all()
+    if user_id is not None:
+        query = query.filter(user_id=user_id)
+
+    indexed = 0
+    last_id = 0
+    while True:
+        rows = (
+            await query.filter(id__gt=last_id)
+            .order_by("id")
+            .limit(REINDEX_BATCH_SIZE)
+            .values_list("id", "user_id", "title", "content")
+        )
+        if not rows:
+            break
+        await index_diaries(rows)
+        indexed += len(rows)
+        last_id = rows[-1][0]
+    return indexed
+
+
+async def main(user_id: int | None) -> None:
+    from app.config.tortoise_config import close_tortoise, init_tortoise
+
+    await init_tortoise()
+    try:
+        indexed = await rebuild_search_index(user_id)
+        print(f"Indexed {indexed} diaries")
+    finally:
+        await close_tortoise()
+
+
+if __name__ == "__main__":
+    # uv run python -m app.services.diary_search [--user-id 1]
+    parser = argparse.ArgumentParser(description="일기 검색 색인 재생성")
+    parser.add_argument("--user-id", type=int, default=None)
+    run_async(main(parser.parse_args().user_id))
@@ -1,40 +1,220 @@
+from tortoise import BaseDBAsyncClient
+from tortoise.expressions import Subquery
+from tortoise.functions import Count, Max
+from tortoise.transactions import in_transaction
+
+from app.config.database import read_db
 from app.dtos.diary_tags import DiaryTagSchemas
 from app.models.diaries import DiaryModel
+from app.models.diary_tags import DiaryTagModel
 from app.models.tags import Tag
+from app.services.tag_catalog import tag_catalog
+
+# 이미 붙어 있는 태그는 건너뛰고, 새로 붙은 태그 ID만 반환
+_ATTACH_TAGS_SQL = """
+INSERT INTO diary_tags (diary_id, tag_id)
+SELECT $1, tag_id FROM unnest($2::int[]) AS tag_id
+ON CONFLICT (diary_id, tag_id) DO NOTHING
+RETURNING tag_id
+"""
 
 
 class DiaryTagService:
+    # 태그 존재 여부는 메모리의 태그 카탈로그로 확인 (tags 테이블 미조회)
     async def add_tag_to_diary(self, diary_id: int, tag_id: int):
-        diary = await DiaryModel.get_or_none(id=diary_id)
-        tag = await Tag.get_or_none(id=tag_id)
-
-        if not diary or not tag:
+        if (
+            not await DiaryModel.exists(id=diary_id)
+            or await tag_catalog.get_name(tag_id) is None
+        ):
             raise Exception("Diary or Tag not found")
 
-        await diary.tags.add(tag)
+        await DiaryTagModel.bulk_create(
+            [DiaryTagModel(diary_id=diary_id, tag_id=tag_id)], ignore_conflicts=True
+        )
 
         return DiaryTagSchemas.MessageResponse(message="Tag added to diary")
 
     async def remove_tag_from_diary(
         self, diary_id: int, tag_id: int
     ) -> DiaryTagSchemas.MessageResponse:
-        diary = await DiaryModel.get_or_none(id=diary_id)
-        tag = await Tag.get_or_none(id=tag_id)
-
-        if not diary or not tag:
+        if (
+            not await DiaryModel.exists(id=diary_id)
+            or await tag_catalog.get_name(tag_id) is None
+        ):
             raise Exception("Diary or Tag not found")
 
-        await diary.tags.remove(tag)
+        await DiaryTagModel.filter(diary_id=diary_id, tag_id=tag_id).delete()
 
         return DiaryTagSchemas.MessageResponse(message="Tag removed from diary")
 
+    async def _resolve_tags(
+        self, tag_ids: list[int], names: list[str]
+    ) -> tuple[dict[int, str], list[str]]:
+        """
+        요청한 태그 ID/태그명을 태그 카탈로그로 확인합니다. (보통 DB 미조회)
+        :return: ({태그 ID: 태그명}, 존재하지 않는 태그명 목록)
+        :raises Exception: 존재하지 않는 태그 ID가 있을 때
+        """
+        tags = await tag_catalog.get_names(tag_ids)
+        unknown_ids = [tag_id for tag_id in tag_ids if tag_id not in tags]
+        if unknown_ids:
+            raise Exception(f"Tag not found: {unknown_ids}")
+        ids_by_name = await tag_catalog.resolve_ids(names)
+        tags.update({tag_id: name for name, tag_id in ids_by_name.items()})
+        return tags, [name for name in names if name not in ids_by_name]
+
+    async def add_tags_to_diary(
+        self, diary_id: int, request: DiaryTagSchemas.TagBatchAddRequest
+    ) -> DiaryTagSchemas.TagBatchResponse:
+        """
+        여러 태그를 한 번에 일기에 붙입니다.
+        태그 수와 관계없이 일기 확인, (필요 시) 태그 생성, 연결 삽입을
+        한 트랜잭션 안에서 일정한 수의 쿼리로 처리합니다.
+        :param diary_id: 일기 ID
+        :param request: 붙일 태그 ID/태그명과 없는 태그명 생성 여부
+        :return: 붙인 태그 목록과 새로 생긴 연결 수
+        """
+        names = list(dict.fromkeys(request.names))
+        tags, missing_names = await self._resolve_tags(request.ids, names)
+        if missing_names and not request.create_missing:
+            raise Exception(f"Tag not found: {missing_names}")
+
+        created: dict[int, str] = {}
+        async with in_transaction("default") as conn:
+            if not await DiaryModel.exists(id=diary_id, using_db=conn):
+                raise Exception("Diary not found")
+            if missing_names:
+                await Tag.bulk_create(
+                    [Tag(name=name) for name in missing_names],
+                    ignore_conflicts=True,
+                    using_db=conn,
+                )
+                # 방금 만든 태그는 같은 트랜잭션 연결로 조회
+                # (롤백되면 없어질 태그이므로 커밋 전에는 카탈로그에 넣지 않음)
+                created = dict(
+                    await Tag.filter(name__in=missing_names)
+                    .using_db(conn)
+                    .values_list("id", "name")
+                )
+                still_missing = set(missing_names) - set(created.values())
+                if still_missing:
+                    raise Exception(f"Tag not found: {sorted(still_missing)}")
+                tags.update(created)
+            attached = await conn.execute_query_dict(
+                _ATTACH_TAGS_SQL, [diary_id, list(tags)]
+            )
+        if created:
+            # 커밋된 뒤에 카탈로그에 반영하고 다른 워커도 새 태그를 읽도록 알림
+            await tag_catalog.add_many(created)
+
+        return DiaryTagSchemas.TagBatchResponse(
+            message="Tags added to diary",
+            changed=len(attached),
+            tags=[
+                DiaryTagSchemas.TagResponse(id=tag_id, name=name)
+                for tag_id, name in tags.items()
+            ],
+        )
+
+    async def remove_tags_from_diary(
+        self, diary_id: int, request: DiaryTagSchemas.TagBatchRequest
+    ) -> DiaryTagSchemas.TagBatchResponse:
+        """
+        여러 태그를 한 번에 일기에서 뗍니다. (일기 확인과 일괄 삭제를 한 트랜잭션으로)
+        :param diary_id: 일기 ID
+        :param request: 뗄 태그 ID/태그명
+        :return: 뗀 태그 목록과 실제로 삭제된 연결 수
+        """
+        names = list(dict.fromkeys(request.names))
+        tags, missing_names = await self._resolve_tags(request.ids, names)
+        if missing_names:
+            raise Exception(f"Tag not found: {missing_names}")
+
+        async with in_transaction("default") as conn:
+            if not await DiaryModel.exists(id=diary_id, using_db=conn):
+                raise Exception("Diary not found")
+            removed = (
+                await DiaryTagModel.filter(diary_id=diary_id, tag_id__in=list(tags))
+                .using_db(conn)
+                .delete()
+            )
+
+        return DiaryTagSchemas.TagBatchResponse(
+            message="Tags removed from diary",
+            changed=removed,
+            tags=[
+                DiaryTagSchemas.TagResponse(id=tag_id, name=name)
+                for tag_id, name in tags.items()
+            ],
+        )
+
     async def get_tags_of_diary(
         self, diary_id: int
     ) -> list[DiaryTagSchemas.TagResponse]:
-        diary = await DiaryModel.get_or_none(id=diary_id).prefetch_related("tags")
-
-        if not diary:
+        if not await DiaryModel.exists(id=diary_id, using_db=read_db()):
             raise Exception("Diary not found")
 
-        tags = await diary.tags.all()
-        return [DiaryTagSchemas.TagResponse(id=tag.id, name=tag.name) for tag in tags]
+        tags_by_diary = await self.get_tags_for_diaries([diary_id])
+        return tags_by_diary.get(diary_id, [])
+
+    async def get_tags_for_diaries(
+        self, diary_ids: list[int], using_db: BaseDBAsyncClient | None = None
+    ) -> dict[int, list[DiaryTagSchemas.TagResponse]]:
+        """
+        여러 일기의 태그를 한 번의 쿼리로 조회합니다. (일기마다 조회하는 N+1 방지)
+        diary_tags만 읽고 태그명은 태그 카탈로그에서 채웁니다.
+        :param diary_ids: 일기 ID 목록
+        :param using_db: 조회할 연결 (없으면 읽기 전용 연결)
+        :return: {일기 ID: 태그 목록} (태그가 없는 일기는 빠짐)
+        """
+        tags_by_diary, _ = await self.get_tags_with_fingerprint(diary_ids, using_db)
+        return tags_by_diary
+
+    async def get_tags_with_fingerprint(
+        self, diary_ids: list[int], using_db: BaseDBAsyncClient | None = None
+    ) -> tuple[dict[int, list[DiaryTagSchemas.TagResponse]], tuple[int, int | None]]:
+        """
+        get_tags_for_diaries와 같지만, 읽은 연결로 get_tags_fingerprint와 같은 값도
+        함께 계산합니다. (태그를 포함한 응답의 ETag를 추가 쿼리 없이 만들 때 사용)
+        :param diary_ids: 일기 ID 목록
+        :param using_db: 조회할 연결 (없으면 읽기 전용 연결)
+        :return: ({일기 ID: 태그 목록}, (연결 개수, 최대 연결 id))
+        """
+        rows = (
+            await DiaryTagModel.filter(diary_id__in=diary_ids)
+            .using_db(using_db or read_db())
+            .order_by("id")
+            .values_list("id", "diary_id", "tag_id")
+        )
+        names = await tag_catalog.get_names(list({tag_id for _, _, tag_id in rows}))
+        tags_by_diary: dict[int, list[DiaryTagSchemas.TagResponse]] = {}
+        for _, diary_id, tag_id in rows:
+            if tag_id in names:
+                tags_by_diary.setdefault(diary_id, []).append(
+                    DiaryTagSchemas.TagResponse(id=tag_id, name=names[tag_id])
+                )
+        # id 순으로 정렬했으므로 마지막 행이 최대 id
+        fingerprint = (len(rows), rows[-1][0] if rows else None)
+        return tags_by_diary, fingerprint
+
+    async def get_tags_fingerprint(
+        self,
+        diary_ids: list[int] | Subquery,
+        using_db: BaseDBAsyncClient | None = None,
+    ) -> tuple[int, int | None]:
+        """
+        여러 일기의 태그 연결 상태를 ETag용 값 하나로 요약합니다. (집계 쿼리 한 번)
+        연결은 추가될 때마다 더 큰 id를 받으므로, 개수가 그대로여도 무언가 추가되었다면
+        최대 id가 바뀝니다. 따라서 (개수, 최대 id)가 같으면 연결이 바뀌지 않은 것입니다.
+        :param diary_ids: 일기 ID 목록 또는 일기 ID 서브쿼리
+        :param using_db: 조회할 연결 (없으면 읽기 전용 연결)
+        :return: (연결 개수, 최대 연결 id)
+        """
+        row = (
+            await DiaryTagModel.filter(diary_id__in=diary_ids)
+            .using_db(using_db or read_db())
+            .annotate(count=Count("id"), last_id=Max("id"))
+            .first()
+            .values("count", "last_id")
+        )
+        return (row["count"], row["last_id"]) if row else (0, None)
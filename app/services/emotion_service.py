@@ -0,0 +1,135 @@
+import logging
+
+from tortoise.transactions import in_transaction
+
+from app.dtos.diary_dto import DiaryResponse, EmotionKeywordResponse
+from app.models.diaries import DiaryModel, EmotionType
+from app.models.emotion_keywords import EmotionKeywordModel
+from app.models.jobs import JobModel
+from app.services import gemini_service
+from app.services.emotion_stats_service import apply_emotion_change
+
+logger = logging.getLogger(__name__)
+
+
+def decide_overall_emotion(scores: dict[EmotionType, int]) -> EmotionType | None:
+    """
+    감정별 키워드 개수로 일기의 전체 감정을 결정합니다.
+    동점일 경우 부정 > 긍정 > 중립 순으로 우선합니다.
+    :param scores: 감정별 키워드 개수
+    :return: 전체 감정 (키워드가 없으면 None)
+    """
+    overall_emotion: EmotionType | None = None
+    max_score = 0
+    for emotion_type, score in scores.items():
+        if score > max_score:
+            max_score = score
+            overall_emotion = emotion_type
+        elif score == max_score and overall_emotion is not None:
+            if (
+                emotion_type == EmotionType.NEGATIVE
+                and overall_emotion != EmotionType.NEGATIVE
+            ):
+                overall_emotion = EmotionType.NEGATIVE
+            elif (
+                emotion_type == EmotionType.POSITIVE
+                and overall_emotion == EmotionType.NEUTRAL
+            ):
+                overall_emotion = EmotionType.POSITIVE
+    return overall_emotion
+
+
+async def analyze_and_save_diary_emotion(diary_id: int, user_id: int) -> DiaryResponse:
+    """
+    일기 내용을 Gemini API로 분석하여 감정 키워드와 전체 감정을 저장합니다.
+    기존 키워드 삭제, 새 키워드 일괄 삽입, 일기 감정 수정을 하나의 트랜잭션으로
+    처리하므로 키워드 개수와 관계없이 DB 왕복 횟수가 일정하고,
+    중간에 실패해도 일부만 저장되지 않습니다.
+    :param diary_id: 분석할 일기의 ID
+    :param user_id: 일기 작성자 ID
+    :return: 업데이트된 일기 정보 (감정 키워드 포함)
+    :raises LookupError: 일기가 없거나 작성자가 다른 경우
+    :raises GeminiError: Gemini 호출이 거절/실패했거나 응답을 해석할 수 없는 경우
+        (키워드 없음으로 저장하지 않음)
+    """
+    diary = await DiaryModel.get_or_none(id=diary_id, user_id=user_id)
+    if not diary:
+        raise LookupError(f"Diary {diary_id} not found")
+
+    analysis_result = await gemini_service.analyze_diary_emotion(
+        diary_id=diary.id, user_id=user_id, content=diary.content
+    )
+
+    # 새로운 감정 키워드는 메모리에서 먼저 만들고 한 번에 저장
+    keywords: list[EmotionKeywordModel] = []
+    overall_sentiment_scores = {
+        EmotionType.POSITIVE: 0,
+        EmotionType.NEGATIVE: 0,
+        EmotionType.NEUTRAL: 0,
+    }
+    for keyword_data in analysis_result.get("keywords", []):
+        word = keyword_data.get("word")
+        emotion_str = keyword_data.get("emotion")
+        if word and emotion_str:
+            try:
+                emotion_type = EmotionType(emotion_str)
+            except ValueError:
+                logger.warning("Invalid emotion type received: %s", emotion_str)
+                continue
+            keywords.append(
+                EmotionKeywordModel(
+                    diary_id=diary.id, word=str(word)[:100], emotion=emotion_type
+                )
+            )
+            overall_sentiment_scores[emotion_type] += 1
+
+    # 전체 감정 결정 (가장 많은 키워드 감정으로)
+    new_emotion = decide_overall_emotion(overall_sentiment_scores)
+
+    async with in_transaction("default") as conn:
+        # 같은 일기의 분석이 동시에 끝나거나 분석 중 감정이 바뀌어도 통계가 한 번만
+        # 반영되도록, 이전 감정은 잠근 행에서 읽음 (Gemini 호출 전에 읽은 값 미사용)
+        diary = (
+            await DiaryModel.select_for_update()
+            .using_db(conn)
+            .get_or_none(id=diary_id, user_id=user_id)
+        )
+        if not diary:
+            raise LookupError(f"Diary {diary_id} not found")
+        old_emotion = diary.emotion
+        diary.emotion = new_emotion
+
+        # 기존 감정 키워드 삭제 후 일괄 삽입
+        await EmotionKeywordModel.filter(diary_id=diary.id).using_db(conn).delete()
+        if keywords:
+            await EmotionKeywordModel.bulk_create(keywords, using_db=conn)
+        await diary.save(using_db=conn, update_fields=["emotion", "updated_at"])
+        # 감정 통계는 이전 감정 -1, 새 감정 +1로만 갱신
+        await apply_emotion_change(
+            user_id, diary.created_at, old_emotion, diary.emotion, using_db=conn
+        )
+
+    # 다시 조회하지 않고 메모리의 값으로 응답 구성
+    return DiaryResponse(
+        id=diary.id,
+        title=diary.title,
+        content=diary.content,
+        emotion=diary.emotion,
+        emotion_keywords=[
+            EmotionKeywordResponse.model_validate(keyword) for keyword in keywords
+        ],
+        created_at=diary.created_at,
+        updated_at=diary.updated_at,
+    )
+
+
+async def run_emotion_analysis_job(job: JobModel) -> dict:
+    """
+    감정 분석 작업 핸들러. 워커가 작업을 꺼내 실행할 때 호출됩니다.
+    :param job: 실행할 작업 (payload에 diary_id 포함)
+    :return: 작업 결과로 저장할 일기 정보 (JSON 직렬화 가능)
+    """
+    diary_response = await analyze_and_save_diary_emotion(
+        diary_id=job.payload["diary_id"], user_id=job.user_id
+    )
+    return diary_response.model_dump(mode="json")
@@ -0,0 +1,164 @@
+import argparse
+from collections import Counter
+from datetime import datetime
+
+from tortoise import BaseDBAsyncClient, connections, run_async
+from tortoise.expressions import F, Q
+from tortoise.transactions import in_transaction
+
+from app.models.diaries import DiaryModel, EmotionType
+from app.models.emotion_stats import EmotionStatModel, TimePeriodTypeModel
+
+StatKey = tuple[int, TimePeriodTypeModel, str, str]
+
+REBUILD_BATCH_SIZE = 1000
+
+# 증가분은 한 번의 upsert로 반영 (행이 없으면 생성, 있으면 더하기)
+_INCREMENT_SQL = """
+INSERT INTO emotion_stats
+    (user_email_id, time_period_type, time_period_value, emotion_type, frequency)
+VALUES {values}
+ON CONFLICT (user_email_id, time_period_type, time_period_value, emotion_type)
+DO UPDATE SET frequency = emotion_stats.frequency + EXCLUDED.frequency
+"""
+
+
+def period_values(moment: datetime) -> list[tuple[TimePeriodTypeModel, str]]:
+    """
+    일기 작성 시각이 속하는 일/주/월 기간 값을 반환합니다.
+    값은 문자열 정렬 순서가 시간 순서와 같도록 만듭니다. (예: 2025-07-14, 2025-W29)
+    :param moment: 일기 작성 시각
+    :return: [(기간 종류, 기간 값)]
+    """
+    return [
+        (TimePeriodTypeModel.DAILY, moment.strftime("%Y-%m-%d")),
+        (TimePeriodTypeModel.WEEKLY, moment.strftime("%G-W%V")),
+        (TimePeriodTypeModel.MONTHLY, moment.strftime("%Y-%m")),
+    ]
+
+
+async def apply_emotion_change(
+    user_id: int,
+    written_at: datetime,
+    old_emotion: EmotionType | None,
+    new_emotion: EmotionType | None,
+    using_db: BaseDBAsyncClient | None = None,
+) -> None:
+    """
+    일기 감정이 바뀌었을 때 통계 카운터를 증분으로 갱신합니다.
+    이전 감정은 1 감소, 새 감정은 1 증가시키며 일기 이력을 다시 읽지 않습니다.
+    :param user_id: 일기 작성자 ID
+    :param written_at: 일기 작성 시각 (어느 기간에 속하는지 결정)
+    :param old_emotion: 이전 감정 (처음 분석이면 None)
+    :param new_emotion: 새 감정 (키워드가 없으면 None)
+    :param using_db: 감정 저장과 같은 트랜잭션에서 실행할 때 넘기는 연결
+    """
+    if old_emotion == new_emotion:
+        return
+    conn = using_db or connections.get("default")
+    periods = period_values(written_at)
+
+    if old_emotion is not None:
+        period_filter = Q(
+            *[
+                Q(time_period_type=period_type, time_period_value=period_value)
+                for period_type, period_value in periods
+            ],
+            join_type=Q.OR,
+        )
+        await (
+            EmotionStatModel.filter(
+                period_filter,
+                user_email_id=user_id,
+                emotion_type=old_emotion.value,
+                frequency__gt=0,
+            )
+            .using_db(conn)
+            .update(frequency=F("frequency") - 1)
+        )
+
+    if new_emotion is not None:
+        placeholders = []
+        values: list = []
+        for period_type, period_value in periods:
+            start = len(values)
+            placeholders.append(
+                f"(${start + 1}, ${start + 2}, ${start + 3}, ${start + 4}, 1)"
+            )
+            values += [user_id, period_type.value, period_value, new_emotion.value]
+        await conn.execute_query(
+            _INCREMENT_SQL.format(values=", ".join(placeholders)), values
+        )
+
+
+async def rebuild_emotion_stats(user_id: int | None = None) -> int:
+    """
+    diaries의 감정으로 통계 테이블을 처음부터 다시 만듭니다. (백필/정합성 복구용)
+    일기는 id 순으로 나누어 읽으므로 메모리는 기간 수에만 비례합니다.
+    :param user_id: 특정 사용자만 다시 만들 때 지정
+    :return: 생성된 통계 행 수
+    """
+    counts: Counter[StatKey] = Counter()
+    query = DiaryModel.filter(emotion__isnull=False)
+    if user_id is not None:
+        query = query.filter(user_id=user_id)
+
+    last_id = 0
+    while True:
+        rows = (
+            await query.filter(id__gt=last_id)
+            .order_by("id")
+            .limit(REBUILD_BATCH_SIZE)
+            .values_list("id", "user_id", "emotion", "created_at")
+        )
+        if not rows:
+            break
+        for diary_id, diary_user_id, emotion, created_at in rows:
+            for period_type, period_value in period_values(created_at):
+                emotion_value = EmotionType(emotion).value
+                counts[(diary_user_id, period_type, period_value, emotion_value)] += 1
+        last_id = rows[-1][0]
+
+    async with in_transaction("default") as conn:
+        stale = EmotionStatModel.all()
+        if user_id is not None:
+            stale = stale.filter(user_email_id=user_id)
+        await stale.using_db(conn).delete()
+        await EmotionStatModel.bulk_create(
+            [
+                EmotionStatModel(
+                    user_email_id=stat_user_id,
+                    time_period_type=period_type,
+                    time_period_value=period_value,
+                    emotion_type=emotion_value,
+                    frequency=frequency,
+                )
+                for (
+                    stat_user_id,
+                    period_type,
+                    period_value,
+                    emotion_value,
+                ), frequency in counts.items()
+            ],
+            batch_size=REBUILD_BATCH_SIZE,
+            using_db=conn,
+        )
+    return len(counts)
+
+
+async def main(user_id: int | None) -> None:
+    from app.config.tortoise_config import close_tortoise, init_tortoise
+
+    await init_tortoise()
+    try:
+        created = await rebuild_emotion_stats(user_id)
+        print(f"Rebuilt {created} emotion stat rows")
+    finally:
+        await close_tortoise()
+
+
+if __name__ == "__main__":
+    # uv run python -m app.services.emotion_stats_service [--user-id 1]
+    parser = argparse.ArgumentParser(description="감정 통계 테이블 재생성")
+    parser.add_argument("--user-id", type=int, default=None)
+    run_async(main(parser.parse_args().user_id))
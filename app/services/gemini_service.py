@@ -1,11 +1,308 @@
+import asyncio
 import json
-
-import google.generativeai as genai
-from google.generativeai.types import GenerateContentResponse
+import logging
+import time
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import TYPE_CHECKING, AsyncGenerator, AsyncIterator
 
 from app.config.config import settings
+from app.services.ai_cache import ai_result_cache
+from app.services.metrics import (
+    GEMINI_REJECTED,
+    GEMINI_REQUEST_SECONDS,
+    GEMINI_TOKENS,
+    registry,
+)
+from app.utils.resilience import AIMDLimiter, CircuitBreaker, CircuitState
+
+if TYPE_CHECKING:
+    import google.generativeai as genai
+    from google.generativeai.types import AsyncGenerateContentResponse
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_MODEL_NAME = "gemini-2.0-flash-thinking-exp-1219"
+EMOTION_MODEL_NAME = "models/gemini-2.0-flash-thinking-exp-1219"
+
+# 프롬프트를 바꾸면 버전을 올려 이전 결과가 캐시에서 재사용되지 않도록 함
+SUMMARY_PROMPT_VERSION = "v1"
+EMOTION_PROMPT_VERSION = "v1"
+
+# 상한에 걸린 요청에 안내할 재시도 대기 시간 (초)
+LIMITER_RETRY_AFTER_SECONDS = 1.0
+
+
+class GeminiError(Exception):
+    """Gemini 호출 실패"""
+
+
+class GeminiTimeoutError(GeminiError, TimeoutError):
+    """제한 시간 안에 Gemini 응답(또는 다음 조각)을 받지 못함"""
+
+
+class GeminiUnavailableError(GeminiError):
+    """차단기가 열려 있거나 동시 요청 상한에 걸려 요청을 보내지 않고 거절함"""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class GeminiUpstreamError(GeminiError):
+    """Gemini API가 오류를 반환함"""
+
+
+class GeminiInvalidResponseError(GeminiError):
+    """Gemini 응답을 해석할 수 없음 (JSON이 아닌 응답 등)"""
+
+
+# 워커 하나에서 동시에 Gemini로 나가는 요청 수를 응답 시간에 맞춰 조절하고,
+# 연속으로 실패하면 잠시 요청을 보내지 않음
+gemini_limiter = AIMDLimiter(
+    min_limit=settings.GEMINI_MIN_CONCURRENCY,
+    max_limit=settings.GEMINI_MAX_CONCURRENCY,
+    latency_target=settings.GEMINI_LATENCY_TARGET_SECONDS,
+)
+gemini_breaker = CircuitBreaker(
+    failure_threshold=settings.GEMINI_BREAKER_FAILURE_THRESHOLD,
+    reset_timeout=settings.GEMINI_BREAKER_RESET_SECONDS,
+)
+
+
+@lru_cache(maxsize=None)
+def _get_model(model_name: str) -> "genai.GenerativeModel":
+    """
+    모델 이름별 GenerativeModel 인스턴스를 한 번만 생성해 재사용합니다.
+    Gemini SDK는 가져오는 데 1초 가까이 걸리므로 서버 시작 시가 아니라
+    처음 호출될 때 import하고 API 키를 설정합니다.
+    :param model_name: Gemini 모델 이름
+    :return: GenerativeModel 인스턴스
+    """
+    import google.generativeai as genai
+
+    genai.configure(api_key=settings.GEMINI_API_KEY)
+    return genai.GenerativeModel(model_name)
+
+
+def _is_overload_error(error: Exception) -> bool:
+    """
+    Gemini 쪽 과부하/장애로 볼 오류인지 판단합니다. (차단기와 상한에 반영할 실패)
+    API 오류 중 상태 코드가 없거나 429/5xx인 것과 전송 오류만 해당하고,
+    요청이 잘못된 4xx, 안전 필터로 막힌 조각의 ValueError, 코드 버그 등은
+    다른 사용자의 요청까지 막지 않도록 제외합니다.
+    """
+    # 오류가 났을 때만 필요하므로 SDK와 마찬가지로 처음 쓸 때 가져옴
+    from google.api_core import exceptions as api_exceptions
+
+    if isinstance(error, api_exceptions.GoogleAPICallError):
+        code = error.code
+        return code is None or code == 429 or code >= 500
+    return isinstance(error, (api_exceptions.RetryError, ConnectionError))
+
+
+registry.callback(
+    "gemini_breaker_state",
+    "Gemini circuit breaker state (1 for the current state)",
+    "gauge",
+    lambda: (
+        ({"state": state.value}, float(gemini_breaker.state == state))
+        for state in CircuitState
+    ),
+)
+registry.callback(
+    "gemini_concurrency_limit",
+    "Current adaptive limit on concurrent Gemini calls",
+    "gauge",
+    lambda: [({}, float(int(gemini_limiter.limit)))],
+)
+registry.callback(
+    "gemini_in_flight",
+    "Gemini calls currently in flight",
+    "gauge",
+    lambda: [({}, float(gemini_limiter.in_flight))],
+)
+
+
+class _GeminiCall:
+    """_gemini_call 안에서 첫 응답 시각과 토큰 사용량을 기록하는 용도"""
+
+    def __init__(self, operation: str) -> None:
+        self.operation = operation
+        self.started_at = time.monotonic()
+        self.first_response_at: float | None = None
 
-genai.configure(api_key=settings.GEMINI_API_KEY)
+    def mark_first_response(self) -> None:
+        if self.first_response_at is None:
+            self.first_response_at = time.monotonic()
+
+    def record_usage(self, response: "AsyncGenerateContentResponse") -> None:
+        usage = getattr(response, "usage_metadata", None)
+        for kind, field in (
+            ("prompt", "prompt_token_count"),
+            ("output", "candidates_token_count"),
+        ):
+            count = getattr(usage, field, 0)
+            if count:
+                GEMINI_TOKENS.inc(self.operation, kind, amount=count)
+
+
+@asynccontextmanager
+async def _gemini_call(operation: str) -> AsyncIterator[_GeminiCall]:
+    """
+    Gemini 호출 하나를 차단기와 동시 요청 제한기로 감쌉니다.
+    차단기가 열려 있거나 GEMINI_QUEUE_TIMEOUT_SECONDS 안에 슬롯을 얻지 못하면
+    요청을 보내지 않고 바로 거절하며, 끝난 뒤 결과(성공/시간 초과/오류)와
+    첫 응답까지 걸린 시간을 차단기와 제한기에 반영합니다.
+    SDK 예외는 GeminiError 하위 예외로 바꿔서 올립니다.
+    :param operation: 지표 레이블로 쓸 호출 종류 (summary/summary_stream/emotion)
+    :return: 첫 응답 시각을 기록할 호출 객체
+    :raises GeminiUnavailableError: 차단기가 열려 있거나 상한에 걸린 경우
+    """
+    if not gemini_breaker.allow():
+        GEMINI_REJECTED.inc(operation, "breaker_open")
+        raise GeminiUnavailableError(
+            "Gemini is temporarily unavailable", gemini_breaker.retry_after()
+        )
+    if not await gemini_limiter.acquire(settings.GEMINI_QUEUE_TIMEOUT_SECONDS):
+        gemini_breaker.release()
+        GEMINI_REJECTED.inc(operation, "concurrency_limit")
+        raise GeminiUnavailableError(
+            "Too many concurrent Gemini requests", LIMITER_RETRY_AFTER_SECONDS
+        )
+
+    call = _GeminiCall(operation)
+    succeeded: bool | None = None  # 취소 등으로 끝나면 None (판단 보류)
+    outcome = "cancelled"
+    try:
+        yield call
+        succeeded = True
+        outcome = "ok"
+    except TimeoutError as e:
+        succeeded = False
+        outcome = "timeout"
+        raise GeminiTimeoutError("Gemini API timed out") from e
+    except GeminiError:
+        outcome = "error"
+        raise
+    except Exception as e:
+        if _is_overload_error(e):
+            succeeded = False
+            outcome = "error"
+        else:
+            outcome = "client_error"
+        raise GeminiUpstreamError(f"Gemini API error: {e}") from e
+    finally:
+        GEMINI_REQUEST_SECONDS.observe(
+            time.monotonic() - call.started_at, operation, outcome
+        )
+        if succeeded is True:
+            gemini_breaker.record_success()
+        elif succeeded is False:
+            gemini_breaker.record_failure()
+        else:
+            gemini_breaker.release()
+        finished_at = call.first_response_at or time.monotonic()
+        await gemini_limiter.release(finished_at - call.started_at, succeeded)
+
+
+async def _generate_content(
+    model_name: str, prompt: str, operation: str
+) -> "AsyncGenerateContentResponse":
+    """
+    이벤트 루프를 막지 않는 비동기 SDK 호출로 Gemini에 요청합니다.
+    :param model_name: Gemini 모델 이름
+    :param prompt: 요청 프롬프트
+    :param operation: 지표 레이블로 쓸 호출 종류
+    :return: Gemini 응답
+    :raises GeminiError: 거절/시간 초과/API 오류
+    """
+    model = _get_model(model_name)
+    async with _gemini_call(operation) as call:
+        async with asyncio.timeout(settings.GEMINI_TIMEOUT_SECONDS):
+            response = await model.generate_content_async(prompt)
+        call.record_usage(response)
+        return response
+
+
+def gemini_stats() -> dict:
+    """차단기 상태와 동시 요청 상한 (모니터링용)"""
+    return {"breaker": gemini_breaker.stats(), "limiter": gemini_limiter.stats()}
+
+
+def _summary_prompt(content: str) -> str:
+    return f"""다음 일기 내용을 2~3줄로 요약해주세요:
+
+{content}
+
+요약:"""
+
+
+def _cancel_stream(response: "AsyncGenerateContentResponse") -> None:
+    # SDK는 스트림 취소 API를 제공하지 않으므로 내부 gRPC 호출을 직접 취소
+    # (읽기만 멈추면 호출이 가비지 컬렉션될 때까지 Gemini 쪽 생성이 계속됨)
+    cancel = getattr(getattr(response, "_iterator", None), "cancel", None)
+    if callable(cancel):
+        cancel()
+
+
+async def stream_summary(content: str) -> AsyncGenerator[str, None]:
+    """
+    Gemini 스트리밍 생성으로 일기 요약을 생성되는 대로 조각 단위로 반환합니다.
+    캐시에 있으면 전체 요약을 한 조각으로 반환하고,
+    끝까지 받은 요약은 캐시에 저장합니다. (빈 요약은 저장하지 않음)
+    중간에 소비를 멈추면(클라이언트 연결 끊김 등) Gemini 호출도 취소합니다.
+    :param content: 요약할 일기 내용
+    :return: 요약 텍스트 조각
+    :raises GeminiTimeoutError: 첫 조각 또는 다음 조각을 GEMINI_TIMEOUT_SECONDS
+        안에 받지 못한 경우
+    :raises GeminiError: 거절/API 오류
+    """
+    cached = await ai_result_cache.get(
+        "summary", content, SUMMARY_MODEL_NAME, SUMMARY_PROMPT_VERSION
+    )
+    if cached is not None and cached.get("summary_text"):
+        yield str(cached["summary_text"])
+        return
+
+    model = _get_model(SUMMARY_MODEL_NAME)
+    parts: list[str] = []
+    async with _gemini_call("summary_stream") as call:
+        async with asyncio.timeout(settings.GEMINI_TIMEOUT_SECONDS):
+            response = await model.generate_content_async(
+                _summary_prompt(content), stream=True
+            )
+        call.mark_first_response()
+        chunks = aiter(response)
+        completed = False
+        try:
+            while True:
+                # 조각 사이 간격마다 타임아웃 적용 (전체 생성 시간은 제한하지 않음)
+                async with asyncio.timeout(settings.GEMINI_TIMEOUT_SECONDS):
+                    try:
+                        chunk = await anext(chunks)
+                    except StopAsyncIteration:
+                        break
+                if chunk.text:
+                    parts.append(chunk.text)
+                    yield chunk.text
+            completed = True
+            call.record_usage(response)  # 스트림이 끝나야 사용량이 채워짐
+        finally:
+            if not completed:
+                _cancel_stream(response)
+
+    if not parts:
+        # 모든 조각이 비어 있으면 캐시하지 않음 (호출한 쪽에서 빈 요약을 오류로 처리)
+        logger.warning("Gemini returned an empty streamed summary")
+        return
+    await ai_result_cache.set(
+        "summary",
+        content,
+        SUMMARY_MODEL_NAME,
+        SUMMARY_PROMPT_VERSION,
+        {"summary_text": "".join(parts)},
+    )
 
 
 async def summarize_diary_content(content: str) -> str:
@@ -13,15 +310,26 @@ async def summarize_diary_content(content: str) -> str:
     Gemini API를 사용하여 일기 내용을 2~3줄로 요약합니다.
     :param content: 요약할 일기 내용
     :return: 요약된 내용
+    :raises GeminiError: 거절/시간 초과/API 오류
     """
-    model = genai.GenerativeModel("gemini-2.0-flash-thinking-exp-1219")
-    prompt = f"""다음 일기 내용을 2~3줄로 요약해주세요:
-
-{content}
+    cached = await ai_result_cache.get(
+        "summary", content, SUMMARY_MODEL_NAME, SUMMARY_PROMPT_VERSION
+    )
+    if cached is not None:
+        return str(cached["summary_text"])
 
-요약:"""
-    response: genai.types.GenerateContentResponse = model.generate_content(prompt)
-    return str(response.text)
+    response = await _generate_content(
+        SUMMARY_MODEL_NAME, _summary_prompt(content), "summary"
+    )
+    summary_text = str(response.text)
+    await ai_result_cache.set(
+        "summary",
+        content,
+        SUMMARY_MODEL_NAME,
+        SUMMARY_PROMPT_VERSION,
+        {"summary_text": summary_text},
+    )
+    return summary_text
 
 
 async def analyze_diary_emotion(diary_id: int, user_id: int, content: str) -> dict:
@@ -31,8 +339,16 @@ async def analyze_diary_emotion(diary_id: int, user_id: int, content: str) -> di
     :param user_id: 사용자 ID
     :param content: 분석할 일기 내용
     :return: 감정 키워드가 포함된 JSON
+    :raises GeminiInvalidResponseError: 응답이 JSON이 아닌 경우
+    :raises GeminiError: 거절/시간 초과/API 오류
     """
-    model = genai.GenerativeModel("models/gemini-2.0-flash-thinking-exp-1219")
+    # 캐시는 내용만으로 키를 만들므로 diary_id/user_id는 현재 요청 값으로 채움
+    cached = await ai_result_cache.get(
+        "emotion", content, EMOTION_MODEL_NAME, EMOTION_PROMPT_VERSION
+    )
+    if cached is not None:
+        return {**cached, "diary_id": diary_id, "user_id": user_id}
+
     prompt = f"""아래는 사용자가 작성한 일기 내용입니다.
 각 문장에서 나타나는 감정 키워드를 추출해주세요.
 감정 키워드는 '긍정', '부정', '중립'
@@ -61,17 +377,20 @@ async def analyze_diary_emotion(diary_id: int, user_id: int, content: str) -> di
 
 부정적 감정 키워드만 따로 추출하고 싶으니, 부정 키워드도 꼭 포함해 주세요.
 """
-    response: GenerateContentResponse = model.generate_content(prompt)
+    response = await _generate_content(EMOTION_MODEL_NAME, prompt, "emotion")
     raw_text = response.text.strip()
     # 마크다운 코드 블록 제거
     if raw_text.startswith("```json") and raw_text.endswith("```"):
         raw_text = raw_text[len("```json\n") : -len("```")].strip()
     try:
-        return dict(json.loads(raw_text))
-    except json.JSONDecodeError:
-        # Gemini가 유효한 JSON을 반환하지 않을 경우를 대비한 처리
-        print(f"Gemini API에서 유효하지 않은 JSON 응답: {response.text}")
-        return {
-            "error": "Failed to parse Gemini API response",
-            "raw_response": response.text,
-        }
+        result = dict(json.loads(raw_text))
+    except (TypeError, ValueError) as e:
+        # 키워드가 없는 것으로 저장하지 않도록 실패로 올림 (작업은 재시도됨)
+        logger.warning("Invalid JSON response from Gemini: %s", response.text)
+        raise GeminiInvalidResponseError("Failed to parse Gemini API response") from e
+
+    # 파싱에 성공한 결과만 캐시
+    await ai_result_cache.set(
+        "emotion", content, EMOTION_MODEL_NAME, EMOTION_PROMPT_VERSION, result
+    )
+    return result
@@ -0,0 +1,205 @@
+import asyncio
+import logging
+from datetime import timedelta
+from typing import Awaitable, Callable
+
+from tortoise import timezone
+from tortoise.expressions import Q
+from tortoise.transactions import in_transaction
+
+from app.config.config import settings
+from app.models.jobs import JobModel, JobStatus, JobType
+from app.services.emotion_service import run_emotion_analysis_job
+from app.services.gemini_service import GeminiUnavailableError
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[JobModel], Awaitable[dict]]
+
+# 작업 종류별 실행 함수
+JOB_HANDLERS: dict[JobType, JobHandler] = {
+    JobType.EMOTION_ANALYSIS: run_emotion_analysis_job,
+}
+
+# 재시도 대기 시간 (초) = RETRY_BASE_SECONDS * 2^(시도 횟수 - 1)
+RETRY_BASE_SECONDS = 5
+
+
+async def claim_next_job() -> JobModel | None:
+    """
+    실행 가능한 작업 하나를 점유합니다.
+    SELECT ... FOR UPDATE SKIP LOCKED로 여러 워커/프로세스가 같은 작업을
+    가져가지 않도록 하고, 점유 시간이 지난 RUNNING 작업(워커가 죽은 경우)도
+    다시 가져옵니다.
+    :return: 점유한 작업 또는 None
+    """
+    now = timezone.now()
+    async with in_transaction("default") as conn:
+        job = (
+            await JobModel.filter(
+                Q(status=JobStatus.PENDING, run_after__lte=now)
+                | Q(status=JobStatus.RUNNING, locked_until__lt=now)
+            )
+            .order_by("run_after", "id")
+            .select_for_update(skip_locked=True)
+            .using_db(conn)
+            .first()
+        )
+        if job is None:
+            return None
+
+        job.status = JobStatus.RUNNING
+        job.attempts += 1
+        job.started_at = now
+        job.locked_until = now + timedelta(seconds=settings.JOB_LEASE_SECONDS)
+        await job.save(
+            using_db=conn,
+            update_fields=["status", "attempts", "started_at", "locked_until"],
+        )
+    return job
+
+
+async def _finish_job(job: JobModel, result: dict) -> None:
+    job.status = JobStatus.SUCCEEDED
+    job.result = result
+    job.error = None
+    job.locked_until = None
+    job.finished_at = timezone.now()
+    await job.save(
+        update_fields=["status", "result", "error", "locked_until", "finished_at"]
+    )
+
+
+async def _fail_job(job: JobModel, error: str) -> None:
+    # 최대 시도 횟수 전까지는 지수 백오프로 다시 대기열에 넣음
+    if job.attempts < settings.JOB_MAX_ATTEMPTS:
+        job.status = JobStatus.PENDING
+        job.run_after = timezone.now() + timedelta(
+            seconds=RETRY_BASE_SECONDS * 2 ** (job.attempts - 1)
+        )
+    else:
+        job.status = JobStatus.FAILED
+        job.finished_at = timezone.now()
+    job.error = error
+    job.locked_until = None
+    await job.save(
+        update_fields=["status", "run_after", "error", "locked_until", "finished_at"]
+    )
+
+
+async def _defer_job(job: JobModel, delay: float, error: str) -> None:
+    # 실행하지 못하고 거절된 경우라 시도 횟수에 넣지 않고 delay 뒤에 다시 실행
+    job.status = JobStatus.PENDING
+    job.attempts -= 1
+    job.run_after = timezone.now() + timedelta(seconds=max(delay, 1.0))
+    job.error = error
+    job.locked_until = None
+    await job.save(
+        update_fields=["status", "attempts", "run_after", "error", "locked_until"]
+    )
+
+
+async def run_job(job: JobModel) -> None:
+    """
+    점유한 작업을 핸들러로 실행하고 결과/실패를 기록합니다.
+    :param job: claim_next_job으로 점유한 작업
+    """
+    handler = JOB_HANDLERS[job.job_type]
+    try:
+        result = await handler(job)
+    except asyncio.CancelledError:
+        # 종료 중 취소된 작업은 다음 워커가 바로 가져갈 수 있도록 되돌림
+        job.status = JobStatus.PENDING
+        job.attempts -= 1
+        job.locked_until = None
+        await asyncio.shield(
+            job.save(update_fields=["status", "attempts", "locked_until"])
+        )
+        raise
+    except GeminiUnavailableError as e:
+        logger.warning("Job %s deferred: %s", job.id, e)
+        await _defer_job(job, e.retry_after, f"{type(e).__name__}: {e}")
+    except Exception as e:
+        logger.exception("Job %s failed (attempt %s)", job.id, job.attempts)
+        await _fail_job(job, f"{type(e).__name__}: {e}")
+    else:
+        await _finish_job(job, result)
+
+
+class JobWorkerPool:
+    """
+    jobs 테이블을 대기열로 사용하는 프로세스 내 워커 풀.
+    작업은 DB에 저장되므로 서버가 재시작되어도 남아 있고, 실행 도중 죽은 작업은
+    점유 시간(JOB_LEASE_SECONDS)이 지나면 다시 실행됩니다.
+    """
+
+    def __init__(self, concurrency: int, poll_interval: float):
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self._wakeup = asyncio.Event()
+        self._tasks: list[asyncio.Task] = []
+
+    def start(self) -> None:
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._worker_loop(), name=f"job-worker-{i}")
+            for i in range(self.concurrency)
+        ]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def notify(self) -> None:
+        """새 작업이 등록되었음을 알려 대기 중인 워커를 즉시 깨웁니다."""
+        self._wakeup.set()
+
+    async def _worker_loop(self) -> None:
+        while True:
+            self._wakeup.clear()
+            try:
+                job = await claim_next_job()
+            except Exception:
+                logger.exception("Failed to claim a job")
+                job = None
+
+            if job is None:
+                # 새 작업 알림이 오거나 poll_interval이 지나면 다시 확인
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                except TimeoutError:
+                    pass
+                continue
+
+            try:
+                await run_job(job)
+            except Exception:
+                # 결과 저장 실패 등은 점유 시간이 지나면 다른 워커가 다시 실행
+                logger.exception("Failed to record the outcome of job %s", job.id)
+
+
+job_worker_pool = JobWorkerPool(
+    concurrency=settings.JOB_WORKER_CONCURRENCY,
+    poll_interval=settings.JOB_POLL_INTERVAL_SECONDS,
+)
+
+
+async def enqueue_job(user_id: int, job_type: JobType, payload: dict) -> JobModel:
+    """
+    작업을 jobs 테이블에 등록하고 워커를 깨웁니다.
+    :param user_id: 작업을 요청한 사용자 ID
+    :param job_type: 작업 종류
+    :param payload: 핸들러에 전달할 입력값
+    :return: 등록된 작업
+    """
+    job = await JobModel.create(
+        user_id=user_id,
+        job_type=job_type,
+        payload=payload,
+        run_after=timezone.now(),
+    )
+    job_worker_pool.notify()
+    return job
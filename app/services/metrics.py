@@ -0,0 +1,123 @@
+import re
+from contextvars import ContextVar
+from typing import Callable, Iterable
+
+from app.utils.metrics import MetricsRegistry, Sample
+
+# 프로세스(워커)별 지표. 여러 워커를 띄우면 Prometheus가 워커마다 수집해 합산
+registry = MetricsRegistry()
+
+REQUEST_SECONDS = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template and status code",
+    ("method", "route", "status"),
+)
+REQUEST_DB_QUERIES = registry.histogram(
+    "http_request_db_queries",
+    "Number of DB queries issued while handling one HTTP request",
+    ("route",),
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89),
+)
+REQUEST_DB_SECONDS = registry.histogram(
+    "http_request_db_duration_seconds",
+    "Total DB time spent while handling one HTTP request",
+    ("route",),
+)
+DB_QUERY_SECONDS = registry.histogram(
+    "db_query_duration_seconds",
+    "DB query latency (including waiting for a pooled connection)",
+    ("connection", "operation"),
+)
+GEMINI_REQUEST_SECONDS = registry.histogram(
+    "gemini_request_duration_seconds",
+    "Gemini call latency by operation and outcome",
+    ("operation", "outcome"),
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0),
+)
+GEMINI_REJECTED = registry.counter(
+    "gemini_rejected_total",
+    "Gemini calls shed before being sent (breaker open or concurrency limit)",
+    ("operation", "reason"),
+)
+GEMINI_TOKENS = registry.counter(
+    "gemini_tokens_total",
+    "Tokens reported by Gemini usage metadata",
+    ("operation", "kind"),
+)
+PASSWORD_HASH_SECONDS = registry.histogram(
+    "password_hash_duration_seconds",
+    "bcrypt hash/verify latency (including waiting for a hashing thread)",
+    ("operation",),
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+
+# 캐시 이름 -> {"hits": .., "misses": ..}를 돌려주는 함수
+_cache_sources: dict[str, Callable[[], dict[str, int]]] = {}
+
+
+def register_cache(name: str, stats: Callable[[], dict[str, int]]) -> None:
+    """
+    캐시 적중/미스 횟수를 cache_hits_total/cache_misses_total로 노출합니다.
+    :param name: cache 레이블 값
+    :param stats: 현재 {"hits": 적중 수, "misses": 미스 수}를 반환하는 함수
+    """
+    _cache_sources[name] = stats
+
+
+def _cache_samples(key: str) -> Callable[[], Iterable[Sample]]:
+    def collect() -> Iterable[Sample]:
+        for name, stats in _cache_sources.items():
+            yield {"cache": name}, stats()[key]
+
+    return collect
+
+
+registry.callback(
+    "cache_hits_total", "In-process cache hits", "counter", _cache_samples("hits")
+)
+registry.callback(
+    "cache_misses_total", "In-process cache misses", "counter", _cache_samples("misses")
+)
+
+
+# SQL의 첫 단어 (SELECT/INSERT/UPDATE/DELETE/WITH ...)
+_OPERATION_RE = re.compile(r"\s*(\w+)")
+
+
+class RequestStats:
+    """요청 하나를 처리하는 동안 실행된 DB 쿼리 수와 시간"""
+
+    __slots__ = ("db_queries", "db_seconds")
+
+    def __init__(self) -> None:
+        self.db_queries = 0
+        self.db_seconds = 0.0
+
+
+current_request: ContextVar[RequestStats | None] = ContextVar(
+    "current_request", default=None
+)
+
+
+def record_db_query(connection: str, query: str, seconds: float) -> None:
+    """
+    DB 쿼리 하나의 소요 시간을 기록하고, 요청 처리 중이면 요청별 합계에도 더합니다.
+    :param connection: Tortoise 연결 이름 (default/replica)
+    :param query: 실행한 SQL
+    :param seconds: 소요 시간 (초)
+    """
+    match = _OPERATION_RE.match(query)
+    operation = match.group(1).upper() if match else ""
+    DB_QUERY_SECONDS.observe(seconds, connection, operation)
+    stats = current_request.get()
+    if stats is not None:
+        stats.db_queries += 1
+        stats.db_seconds += seconds
+
+
+def record_request(
+    method: str, route: str, status: int, seconds: float, stats: RequestStats
+) -> None:
+    REQUEST_SECONDS.observe(seconds, method, route, str(status))
+    REQUEST_DB_QUERIES.observe(stats.db_queries, route)
+    REQUEST_DB_SECONDS.observe(stats.db_seconds, route)
@@ -0,0 +1,157 @@
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from app.config.config import settings
+
+# 문자열 리터럴, 바인드 변수($1), 숫자 리터럴(지수 표기 포함)
+# (따옴표로 감싼 식별자 안의 숫자는 제외)
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_PARAM_RE = re.compile(r"\$\d+")
+_NUMBER_RE = re.compile(r'(?<![\w"$.])-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?\b')
+# IN (?,?,?) / VALUES (?,?),(?,?) 처럼 값 개수만 다른 목록
+_LIST_RE = re.compile(
+    r"\(\s*\?(?:\s*,\s*\?)*\s*\)(?:\s*,\s*\(\s*\?(?:\s*,\s*\?)*\s*\))*"
+)
+_SPACE_RE = re.compile(r"\s+")
+
+
+def normalize_sql(query: str) -> str:
+    """
+    값만 다른 쿼리가 같은 문자열이 되도록 SQL을 정규화합니다.
+    리터럴과 바인드 변수는 ?로, 값 목록은 (...)로 바꾸고 공백을 한 칸으로 줄입니다.
+    :param query: 실행한 SQL
+    :return: 쿼리 모양 (shape)
+    """
+    shape = _STRING_RE.sub("?", query)
+    shape = _PARAM_RE.sub("?", shape)
+    shape = _NUMBER_RE.sub("?", shape)
+    shape = _LIST_RE.sub("(...)", shape)
+    return _SPACE_RE.sub(" ", shape).strip()
+
+
+class QueryShapeStats:
+    __slots__ = ("count", "seconds")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.seconds = 0.0
+
+
+class QueryProfile:
+    """
+    한 구간(요청 하나, 테스트 블록 하나)에서 실행된 SQL을 모양별로 모은 기록.
+    같은 모양이 n_plus_one_threshold번 이상 반복되면 N+1로 의심합니다.
+    """
+
+    def __init__(self, n_plus_one_threshold: int | None = None):
+        self.n_plus_one_threshold = (
+            n_plus_one_threshold or settings.QUERY_PROFILER_N_PLUS_ONE_THRESHOLD
+        )
+        self.shapes: dict[str, QueryShapeStats] = {}
+        self.total_queries = 0
+        self.total_seconds = 0.0
+
+    def record(self, query: str, seconds: float) -> None:
+        shape = normalize_sql(query)
+        stats = self.shapes.get(shape)
+        if stats is None:
+            stats = self.shapes[shape] = QueryShapeStats()
+        stats.count += 1
+        stats.seconds += seconds
+        self.total_queries += 1
+        self.total_seconds += seconds
+
+    def n_plus_one(self) -> list[tuple[str, QueryShapeStats]]:
+        """반복 횟수가 많은 순으로 정렬한 N+1 의심 쿼리 모양"""
+        suspects = [
+            (shape, stats)
+            for shape, stats in self.shapes.items()
+            if stats.count >= self.n_plus_one_threshold
+        ]
+        return sorted(suspects, key=lambda item: item[1].count, reverse=True)
+
+    def header_value(self) -> str:
+        """응답 헤더에 넣을 한 줄 요약 (쿼리 원문은 넣지 않음)"""
+        return (
+            f"queries={self.total_queries}; "
+            f"db_ms={self.total_seconds * 1000:.1f}; "
+            f"shapes={len(self.shapes)}; "
+            f"n_plus_one={len(self.n_plus_one())}"
+        )
+
+    def summary(self, limit: int = 5) -> str:
+        """
+        로그/단언 실패 메시지용 요약. 실행 횟수가 많은 쿼리 모양부터 보여 줍니다.
+        :param limit: 보여 줄 쿼리 모양 수
+        """
+        lines = [self.header_value()]
+        suspects = {shape for shape, _ in self.n_plus_one()}
+        ranked = sorted(
+            self.shapes.items(),
+            key=lambda item: (item[1].count, item[1].seconds),
+            reverse=True,
+        )
+        for shape, stats in ranked[:limit]:
+            mark = " [N+1?]" if shape in suspects else ""
+            lines.append(
+                f"  {stats.count}x {stats.seconds * 1000:.1f}ms{mark} {shape[:300]}"
+            )
+        if len(ranked) > limit:
+            lines.append(f"  ... {len(ranked) - limit} more shapes")
+        return "\n".join(lines)
+
+
+# 현재 활성화된 프로파일들. 겹쳐 쓸 수 있도록(테스트 블록 안의 요청 등) 튜플로 보관
+_active_profiles: ContextVar[tuple[QueryProfile, ...]] = ContextVar(
+    "active_query_profiles", default=()
+)
+
+
+def record_profiled_query(query: str, seconds: float) -> None:
+    """DB 클라이언트가 쿼리마다 호출합니다. 활성화된 프로파일이 없으면 아무것도 안 함"""
+    for profile in _active_profiles.get():
+        profile.record(query, seconds)
+
+
+@contextmanager
+def profile_queries(
+    n_plus_one_threshold: int | None = None,
+) -> Iterator[QueryProfile]:
+    """
+    블록 안에서(같은 컨텍스트의 하위 작업 포함) 실행된 SQL을 기록합니다.
+    :param n_plus_one_threshold: N+1로 볼 반복 횟수 (기본값은 설정)
+    :return: 기록이 쌓이는 QueryProfile
+    """
+    profile = QueryProfile(n_plus_one_threshold)
+    token = _active_profiles.set((*_active_profiles.get(), profile))
+    try:
+        yield profile
+    finally:
+        _active_profiles.reset(token)
+
+
+@contextmanager
+def assert_max_queries(
+    max_queries: int, allow_n_plus_one: bool = True
+) -> Iterator[QueryProfile]:
+    """
+    블록 안의 쿼리 수가 max_queries를 넘으면 AssertionError를 냅니다.
+    쿼리 수 회귀를 테스트에서 잡기 위한 도우미입니다.
+
+        with assert_max_queries(3):
+            await client.get("/diaries")
+
+    :param max_queries: 허용하는 최대 쿼리 수
+    :param allow_n_plus_one: False면 N+1 의심 쿼리가 있어도 실패
+    """
+    with profile_queries() as profile:
+        yield profile
+    if profile.total_queries > max_queries:
+        raise AssertionError(
+            f"Expected at most {max_queries} queries, got "
+            f"{profile.total_queries}\n{profile.summary()}"
+        )
+    if not allow_n_plus_one and profile.n_plus_one():
+        raise AssertionError(f"Probable N+1 queries\n{profile.summary()}")
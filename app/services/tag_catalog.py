@@ -0,0 +1,186 @@
+import asyncio
+import logging
+
+from tortoise import BaseDBAsyncClient, connections
+
+from app.config.config import settings
+from app.config.database import read_db
+from app.models.tags import Tag, TagCatalogVersionModel
+
+logger = logging.getLogger(__name__)
+
+CATALOG_VERSION_ID = 1
+
+# 버전 행이 없으면 만들고, 있으면 1 올린 뒤 새 버전을 반환
+_BUMP_VERSION_SQL = """
+INSERT INTO tag_catalog_version (id, version, updated_at)
+VALUES ($1, 1, CURRENT_TIMESTAMP)
+ON CONFLICT (id) DO UPDATE
+SET version = tag_catalog_version.version + 1, updated_at = EXCLUDED.updated_at
+RETURNING version
+"""
+
+
+class TagCatalog:
+    """
+    전체 태그 목록(id <-> 이름)을 프로세스 메모리에 들고 있는 카탈로그.
+    처음 사용할 때 한 번 읽고, 이후 태그 조회는 DB를 거치지 않습니다.
+    태그를 추가/삭제한 워커는 메모리를 바로 고치고(write-through) 버전을 올리며,
+    다른 워커는 sync_interval마다 버전 값 하나만 읽어 바뀌었을 때만 다시 읽습니다.
+    """
+
+    def __init__(self, sync_interval: float):
+        self.sync_interval = sync_interval
+        self._names_by_id: dict[int, str] = {}
+        self._ids_by_name: dict[str, int] = {}
+        self._version = 0
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+
+    async def _read_version(self) -> int:
+        row = (
+            await TagCatalogVersionModel.filter(id=CATALOG_VERSION_ID)
+            .using_db(read_db())
+            .first()
+            .values("version")
+        )
+        return int(row["version"]) if row else 0
+
+    async def load(self) -> None:
+        """태그 전체를 다시 읽습니다. 버전을 먼저 읽어 그 사이의 변경을 놓치지 않음."""
+        version = await self._read_version()
+        rows = await Tag.all(using_db=read_db()).values_list("id", "name")
+        self._names_by_id = {tag_id: name for tag_id, name in rows}
+        self._ids_by_name = {name: tag_id for tag_id, name in rows}
+        self._version = version
+        self._loaded = True
+
+    async def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        async with self._load_lock:
+            if not self._loaded:
+                await self.load()
+
+    async def sync(self) -> None:
+        """다른 워커가 태그를 바꿨으면 (DB 버전이 더 높으면) 다시 읽습니다."""
+        if self._loaded and await self._read_version() > self._version:
+            await self.load()
+
+    def _remember(self, tag_id: int, name: str) -> None:
+        self._names_by_id[tag_id] = name
+        self._ids_by_name[name] = tag_id
+
+    async def _fetch_missing(
+        self, query_filter: dict, using_db: BaseDBAsyncClient | None
+    ) -> None:
+        # 다른 워커가 방금 만든 태그는 다음 동기화 전까지 메모리에 없을 수 있으므로
+        # 메모리에 없는 것만 DB에서 찾아 채움
+        rows = (
+            await Tag.filter(**query_filter)
+            .using_db(using_db or read_db())
+            .values_list("id", "name")
+        )
+        for tag_id, name in rows:
+            self._remember(tag_id, name)
+
+    async def all_tags(self) -> list[tuple[int, str]]:
+        """
+        전체 태그를 ID 순으로 반환합니다.
+        :return: [(태그 ID, 태그명)]
+        """
+        await self._ensure_loaded()
+        return sorted(self._names_by_id.items())
+
+    async def get_names(self, tag_ids: list[int]) -> dict[int, str]:
+        """
+        태그 ID들을 이름으로 바꿉니다.
+        :param tag_ids: 태그 ID 목록
+        :return: {태그 ID: 태그명} (존재하지 않는 ID는 빠짐)
+        """
+        await self._ensure_loaded()
+        missing = [tag_id for tag_id in tag_ids if tag_id not in self._names_by_id]
+        if missing:
+            await self._fetch_missing({"id__in": missing}, None)
+        return {
+            tag_id: self._names_by_id[tag_id]
+            for tag_id in tag_ids
+            if tag_id in self._names_by_id
+        }
+
+    async def get_name(self, tag_id: int) -> str | None:
+        return (await self.get_names([tag_id])).get(tag_id)
+
+    async def resolve_ids(
+        self, names: list[str], using_db: BaseDBAsyncClient | None = None
+    ) -> dict[str, int]:
+        """
+        태그명들을 ID로 바꿉니다.
+        :param names: 태그명 목록
+        :param using_db: 메모리에 없는 이름을 찾을 연결 (없으면 읽기 전용 연결,
+            방금 만든 태그를 찾을 때는 primary 연결을 넘김)
+        :return: {태그명: 태그 ID} (존재하지 않는 태그명은 빠짐)
+        """
+        await self._ensure_loaded()
+        missing = [name for name in names if name not in self._ids_by_name]
+        if missing:
+            await self._fetch_missing({"name__in": missing}, using_db)
+        return {
+            name: self._ids_by_name[name] for name in names if name in self._ids_by_name
+        }
+
+    async def publish_change(self) -> None:
+        """
+        태그가 바뀌었음을 다른 워커에 알리기 위해 버전을 올립니다.
+        올린 버전이 바로 다음 버전이면 (그 사이 다른 변경이 없었으면) 이 워커의
+        메모리는 이미 최신이므로 다시 읽지 않습니다.
+        """
+        rows = await connections.get("default").execute_query_dict(
+            _BUMP_VERSION_SQL, [CATALOG_VERSION_ID]
+        )
+        new_version = int(rows[0]["version"])
+        if new_version == self._version + 1:
+            self._version = new_version
+
+    async def add(self, tag_id: int, name: str) -> None:
+        """새로 만든 태그를 카탈로그에 반영합니다. (write-through)"""
+        await self.add_many({tag_id: name})
+
+    async def add_many(self, tags: dict[int, str]) -> None:
+        """
+        새로 만든 태그들을 카탈로그에 반영하고 버전은 한 번만 올립니다.
+        태그를 만든 트랜잭션이 커밋된 뒤에 호출해야 합니다.
+        :param tags: {태그 ID: 태그명}
+        """
+        for tag_id, name in tags.items():
+            self._remember(tag_id, name)
+        await self.publish_change()
+
+    async def remove(self, tag_id: int) -> None:
+        """삭제한 태그를 카탈로그에서 제거합니다. (write-through)"""
+        name = self._names_by_id.pop(tag_id, None)
+        if name is not None:
+            self._ids_by_name.pop(name, None)
+        await self.publish_change()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._sync_loop(), name="tag-catalog")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _sync_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.sync_interval)
+            try:
+                await self.sync()
+            except Exception:
+                logger.exception("Tag catalog sync failed")
+
+
+tag_catalog = TagCatalog(sync_interval=settings.TAG_CATALOG_SYNC_SECONDS)
@@ -0,0 +1,138 @@
+import asyncio
+import hashlib
+import logging
+from datetime import datetime, timedelta
+
+from tortoise import timezone
+
+from app.config.config import settings
+from app.models.token_blacklist import TokenBlacklist
+
+logger = logging.getLogger(__name__)
+
+
+def token_fingerprint(token: str, payload: dict | None = None) -> str:
+    """
+    블랙리스트에 저장할 토큰 식별자를 만듭니다.
+    jti 클레임이 있으면 그대로 쓰고, 없으면 (이전 버전 토큰)
+    토큰의 SHA-256 해시를 씁니다.
+    :param token: JWT 문자열
+    :param payload: 디코딩된 토큰 페이로드
+    :return: 64자 이하의 식별자
+    """
+    jti = payload.get("jti") if payload else None
+    if isinstance(jti, str) and 0 < len(jti) <= 64:
+        return jti
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class TokenRevocationStore:
+    """
+    폐기된 토큰 식별자를 프로세스 메모리에 들고 있는 저장소.
+    시작할 때 만료되지 않은 블랙리스트를 모두 읽고, 이후에는 sync_interval마다
+    새로 추가된 행만 읽어와 다른 워커의 로그아웃도 반영합니다.
+    덕분에 인증 요청마다 블랙리스트를 조회하지 않아도 되고,
+    만료된 행은 prune_interval마다 DB와 메모리에서 함께 지웁니다.
+    """
+
+    def __init__(self, sync_interval: float, prune_interval: float):
+        self.sync_interval = sync_interval
+        self.prune_interval = prune_interval
+        self._revoked: dict[str, datetime] = {}  # 식별자 -> 토큰 만료 시각
+        self._loaded = False
+        self._synced_at: datetime | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def _sync_overlap(self) -> timedelta:
+        # 커밋 지연이나 서버 간 시계 차이로 놓치는 행이 없도록 겹쳐서 읽음
+        return timedelta(seconds=max(60.0, self.sync_interval * 2))
+
+    async def load(self) -> None:
+        """만료되지 않은 블랙리스트 전체를 메모리에 읽어옵니다."""
+        now = timezone.now()
+        rows = await TokenBlacklist.filter(expires_at__gt=now).values_list(
+            "fingerprint", "expires_at"
+        )
+        self._revoked = {fingerprint: expires_at for fingerprint, expires_at in rows}
+        self._synced_at = now
+        self._loaded = True
+
+    async def sync(self) -> None:
+        """마지막 동기화 이후 (다른 워커에서) 추가된 행을 메모리에 반영합니다."""
+        if self._synced_at is None:
+            await self.load()
+            return
+        now = timezone.now()
+        rows = await TokenBlacklist.filter(
+            created_at__gte=self._synced_at - self._sync_overlap
+        ).values_list("fingerprint", "expires_at")
+        for fingerprint, expires_at in rows:
+            self._revoked[fingerprint] = expires_at
+        self._synced_at = now
+
+    async def prune(self) -> None:
+        """만료된 토큰은 어차피 검증에 실패하므로 DB와 메모리에서 지웁니다."""
+        now = timezone.now()
+        deleted = await TokenBlacklist.filter(expires_at__lte=now).delete()
+        self._revoked = {
+            fingerprint: expires_at
+            for fingerprint, expires_at in self._revoked.items()
+            if expires_at > now
+        }
+        if deleted:
+            logger.info("Pruned %s expired blacklisted tokens", deleted)
+
+    async def revoke(self, fingerprint: str, expires_at: datetime) -> None:
+        """
+        토큰을 폐기합니다. 이미 폐기된 토큰이면 아무 일도 하지 않습니다.
+        :param fingerprint: token_fingerprint로 만든 식별자
+        :param expires_at: 토큰 만료 시각
+        """
+        await TokenBlacklist.bulk_create(
+            [TokenBlacklist(fingerprint=fingerprint, expires_at=expires_at)],
+            ignore_conflicts=True,
+        )
+        self._revoked[fingerprint] = expires_at
+
+    async def is_revoked(self, fingerprint: str) -> bool:
+        """
+        토큰 폐기 여부를 확인합니다.
+        메모리에 올라와 있으면 DB를 조회하지 않고, 아직 load 전이면 DB를 조회합니다.
+        :param fingerprint: token_fingerprint로 만든 식별자
+        :return: 폐기되었으면 True
+        """
+        if self._loaded:
+            return fingerprint in self._revoked
+        return await TokenBlacklist.exists(fingerprint=fingerprint)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(
+                self._maintenance_loop(), name="token-revocation"
+            )
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _maintenance_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        next_prune = loop.time()
+        while True:
+            try:
+                await self.sync()
+                if loop.time() >= next_prune:
+                    await self.prune()
+                    next_prune = loop.time() + self.prune_interval
+            except Exception:
+                logger.exception("Token revocation maintenance failed")
+            await asyncio.sleep(self.sync_interval)
+
+
+token_revocation_store = TokenRevocationStore(
+    sync_interval=settings.TOKEN_REVOCATION_SYNC_SECONDS,
+    prune_interval=settings.TOKEN_REVOCATION_PRUNE_SECONDS,
+)
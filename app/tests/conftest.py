@@ -0,0 +1,17 @@
+import os
+
+# .env 없이도 테스트가 실행되도록 설정 기본값 채우기 (이미 설정된 값은 유지)
+# DB에 접속하는 테스트는 없으므로 DB 설정은 형식만 맞춤
+for _key, _value in {
+    "SECRET_KEY": "test-secret",
+    "ALGORITHM": "HS256",
+    "ACCESS_TOKEN_EXPIRE_MINUTES": "30",
+    "REFRESH_TOKEN_EXPIRE_MINUTES": "1440",
+    "GEMINI_API_KEY": "unused",
+    "DB_USER": "unused",
+    "DB_PASSWORD": "unused",
+    "DB_HOST": "localhost",
+    "DB_PORT": "5432",
+    "DB_NAME": "unused",
+}.items():
+    os.environ.setdefault(_key, _value)
@@ -0,0 +1,102 @@
+import pytest
+
+from app.services.query_profiler import (
+    assert_max_queries,
+    normalize_sql,
+    profile_queries,
+    record_profiled_query,
+)
+
+
+@pytest.mark.parametrize(
+    ("query", "shape"),
+    [
+        (
+            'SELECT "t1"."id" FROM "diaries" "t1" WHERE "t1"."id"=$1 LIMIT 10',
+            'SELECT "t1"."id" FROM "diaries" "t1" WHERE "t1"."id"=? LIMIT ?',
+        ),
+        (
+            "SELECT * FROM tags WHERE name='it''s' AND id=-3",
+            "SELECT * FROM tags WHERE name=? AND id=?",
+        ),
+        ("SELECT 1.5e3, 2E-4, 7e+10, 0.25", "SELECT ?, ?, ?, ?"),
+        (
+            "SELECT * FROM diaries WHERE id IN ($1, $2,$3)",
+            "SELECT * FROM diaries WHERE id IN (...)",
+        ),
+        (
+            'INSERT INTO "tags" ("name") VALUES ($1),($2),\n ($3)',
+            'INSERT INTO "tags" ("name") VALUES (...)',
+        ),
+        ("SELECT  id\n\tFROM   diaries ", "SELECT id FROM diaries"),
+    ],
+)
+def test_normalize_sql(query: str, shape: str) -> None:
+    assert normalize_sql(query) == shape
+
+
+def test_queries_differing_only_in_values_share_a_shape() -> None:
+    with profile_queries() as profile:
+        record_profiled_query("SELECT * FROM diaries WHERE id=1", 0.001)
+        record_profiled_query("SELECT * FROM diaries WHERE id=22", 0.002)
+        record_profiled_query("SELECT * FROM diaries WHERE id IN (1, 2, 3)", 0.001)
+
+    assert profile.total_queries == 3
+    assert len(profile.shapes) == 2
+    assert profile.shapes["SELECT * FROM diaries WHERE id=?"].count == 2
+
+
+def test_nested_profiles_record_into_every_active_profile() -> None:
+    with profile_queries() as outer:
+        record_profiled_query("SELECT 1", 0.001)
+        with profile_queries() as inner:
+            record_profiled_query("SELECT 2", 0.001)
+        record_profiled_query("SELECT 3", 0.001)
+
+    # 블록을 벗어난 뒤에는 기록하지 않음
+    record_profiled_query("SELECT 4", 0.001)
+
+    assert outer.total_queries == 3
+    assert inner.total_queries == 1
+
+
+def test_n_plus_one_flags_repeated_shapes() -> None:
+    with profile_queries(n_plus_one_threshold=3) as profile:
+        for diary_id in range(3):
+            record_profiled_query(f"SELECT * FROM tags WHERE diary_id={diary_id}", 0)
+        record_profiled_query("SELECT * FROM diaries", 0)
+
+    suspects = profile.n_plus_one()
+    assert [shape for shape, _ in suspects] == ["SELECT * FROM tags WHERE diary_id=?"]
+    assert "n_plus_one=1" in profile.header_value()
+
+
+def test_assert_max_queries_passes_within_limit() -> None:
+    with assert_max_queries(2) as profile:
+        record_profiled_query("SELECT 1", 0.001)
+        record_profiled_query("SELECT 2", 0.001)
+
+    assert profile.total_queries == 2
+
+
+def test_assert_max_queries_reports_shapes_on_failure() -> None:
+    with pytest.raises(AssertionError) as excinfo:
+        with assert_max_queries(1):
+            record_profiled_query("SELECT * FROM diaries WHERE id=1", 0.001)
+            record_profiled_query("SELECT * FROM diaries WHERE id=2", 0.001)
+
+    message = str(excinfo.value)
+    assert message.startswith("Expected at most 1 queries, got 2\n")
+    assert "2x" in message
+    assert "SELECT * FROM diaries WHERE id=?" in message
+
+
+def test_assert_max_queries_can_reject_n_plus_one() -> None:
+    with pytest.raises(AssertionError, match="Probable N") as excinfo:
+        with assert_max_queries(10, allow_n_plus_one=False):
+            for diary_id in range(5):
+                record_profiled_query(
+                    f"SELECT * FROM tags WHERE diary_id={diary_id}", 0
+                )
+
+    assert "[N+1?]" in str(excinfo.value)
@@ -0,0 +1,140 @@
+import asyncio
+
+import pytest
+
+from app.utils import resilience
+from app.utils.resilience import AIMDLimiter, CircuitBreaker, CircuitState
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    # 차단기 테스트는 동기 함수라 이벤트 루프 시계에 영향이 없음
+    fake = FakeClock()
+    monkeypatch.setattr(resilience.time, "monotonic", fake)
+    return fake
+
+
+def test_breaker_opens_after_threshold_failures(clock: FakeClock) -> None:
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30.0)
+
+    for _ in range(2):
+        assert breaker.allow()
+        breaker.record_failure()
+    assert breaker.state == CircuitState.CLOSED
+
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert not breaker.allow()
+    assert breaker.rejected == 1
+    assert breaker.retry_after() == pytest.approx(30.0)
+
+
+def test_breaker_success_resets_consecutive_failures(clock: FakeClock) -> None:
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30.0)
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_half_open_allows_single_probe(clock: FakeClock) -> None:
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30.0)
+    breaker.record_failure()
+
+    clock.now += 30.0
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert breaker.allow()
+    # 시험 요청이 끝나기 전까지 다른 요청은 거절
+    assert not breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.allow()
+
+
+def test_failed_probe_reopens_breaker(clock: FakeClock) -> None:
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30.0)
+    breaker.record_failure()
+
+    clock.now += 30.0
+    assert breaker.allow()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.opened_count == 2
+    assert breaker.retry_after() == pytest.approx(30.0)
+
+
+def test_release_frees_probe_after_cancellation(clock: FakeClock) -> None:
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30.0)
+    breaker.record_failure()
+
+    clock.now += 30.0
+    assert breaker.allow()
+    # 취소된 시험 요청은 성공/실패로 치지 않고 슬롯만 반납
+    breaker.release()
+
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert breaker.consecutive_failures == 1
+    assert breaker.allow()
+
+
+@pytest.mark.asyncio
+async def test_acquire_times_out_at_limit() -> None:
+    limiter = AIMDLimiter(min_limit=1, max_limit=2, latency_target=10.0)
+
+    assert await limiter.acquire(timeout=0.01)
+    assert await limiter.acquire(timeout=0.01)
+    assert not await limiter.acquire(timeout=0.01)
+    assert limiter.stats() == {"limit": 2, "in_flight": 2, "rejected": 1}
+
+
+@pytest.mark.asyncio
+async def test_waiting_acquire_gets_released_slot() -> None:
+    limiter = AIMDLimiter(min_limit=1, max_limit=1, latency_target=10.0)
+    assert await limiter.acquire(timeout=0.01)
+
+    waiter = asyncio.create_task(limiter.acquire(timeout=1.0))
+    await asyncio.sleep(0)
+    await limiter.release(latency=0.1, succeeded=True)
+
+    assert await waiter
+    assert limiter.in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_backoff_applies_once_per_latency_window() -> None:
+    limiter = AIMDLimiter(min_limit=1, max_limit=8, latency_target=10.0)
+    for _ in range(3):
+        assert await limiter.acquire(timeout=0.01)
+
+    # 동시에 끝난 실패들은 한 번만 줄임
+    await limiter.release(latency=20.0, succeeded=False)
+    await limiter.release(latency=20.0, succeeded=False)
+    assert limiter.limit == 4
+
+    # 목표 시간 안의 성공은 조금씩 늘림
+    await limiter.release(latency=1.0, succeeded=True)
+    assert limiter.limit == pytest.approx(4.25)
+
+
+@pytest.mark.asyncio
+async def test_undecided_release_keeps_limit() -> None:
+    limiter = AIMDLimiter(min_limit=1, max_limit=8, latency_target=10.0)
+    assert await limiter.acquire(timeout=0.01)
+
+    await limiter.release(latency=None, succeeded=None)
+
+    assert limiter.limit == 8
+    assert limiter.in_flight == 0
@@ -0,0 +1,75 @@
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    크기 제한(LRU)과 만료 시간(TTL)을 함께 적용하는 프로세스 내 캐시.
+    이벤트 루프 안에서만 사용하므로 별도의 락은 두지 않습니다.
+    """
+
+    def __init__(self, max_size: int, ttl: float | None = None):
+        """
+        :param max_size: 최대 항목 수 (넘으면 가장 오래 사용하지 않은 항목부터 제거)
+        :param ttl: 기본 만료 시간 (초), None이면 만료 없음
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[K, tuple[float | None, V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: K) -> V | None:
+        """
+        캐시된 값을 반환합니다. 없거나 만료되었으면 None을 반환합니다.
+        :param key: 캐시 키
+        :return: 캐시된 값 또는 None
+        """
+        entry = self._data.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at is None or expires_at > time.monotonic():
+                self._data.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._data[key]
+        self.misses += 1
+        return None
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        """
+        값을 저장합니다.
+        :param key: 캐시 키
+        :param value: 저장할 값
+        :param ttl: 이 항목에만 적용할 만료 시간 (초), 없으면 기본값 사용
+        """
+        if self.max_size <= 0:
+            return
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def pop(self, key: K) -> V | None:
+        """
+        항목을 즉시 제거합니다 (쓰기 시 무효화용).
+        :param key: 캐시 키
+        :return: 제거된 값 또는 None
+        """
+        entry = self._data.pop(key, None)
+        return entry[1] if entry is not None else None
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {"size": len(self._data), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,35 @@
+import hashlib
+
+from fastapi import Response
+from starlette.status import HTTP_304_NOT_MODIFIED
+
+
+def make_etag(*parts: object) -> str:
+    """
+    응답 내용을 결정하는 값들로 강한(strong) ETag를 만듭니다.
+    :param parts: 내용이 바뀌면 함께 바뀌는 값들 (id, updated_at, 조회 조건 등)
+    :return: 따옴표로 감싼 ETag 문자열
+    """
+    raw = "|".join(str(part) for part in parts)
+    return '"' + hashlib.sha256(raw.encode()).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    If-None-Match 헤더가 현재 ETag와 일치하는지 확인합니다.
+    If-None-Match는 약한 비교를 사용하므로 W/ 접두어는 무시합니다.
+    :param if_none_match: 요청의 If-None-Match 헤더 값
+    :param etag: 현재 응답의 ETag
+    :return: 일치하면 True (304로 응답 가능)
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (candidate.strip() for candidate in if_none_match.split(","))
+    return any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+def not_modified(etag: str) -> Response:
+    """본문 없이 304 Not Modified 응답을 만듭니다."""
+    return Response(status_code=HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
@@ -0,0 +1,187 @@
+import math
+from bisect import bisect_left
+from typing import Callable, Iterable
+
+# 기본 지연 시간 버킷 (초)
+DEFAULT_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+Labels = tuple[str, ...]
+Sample = tuple[dict[str, str], float]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Counter:
+    """
+    증가만 하는 값. 레이블 값 조합마다 별도로 셉니다.
+    이벤트 루프 안에서만 갱신하므로 락은 두지 않습니다.
+    """
+
+    metric_type = "counter"
+
+    def __init__(self, name: str, help_text: str, label_names: Labels = ()):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self._values: dict[Labels, float] = {}
+
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def get(self, *label_values: str) -> float:
+        return self._values.get(label_values, 0.0)
+
+    def collect(self) -> Iterable[str]:
+        for label_values, value in self._values.items():
+            labels = _format_labels(self.label_names, label_values)
+            yield f"{self.name}{labels} {_format_value(value)}"
+
+
+class Histogram:
+    """
+    고정 버킷 히스토그램. 관측 한 번은 이진 탐색과 덧셈 몇 번이면 끝나고,
+    누적 버킷 값은 수집(/metrics 요청) 시에만 계산합니다.
+    """
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        label_names: Labels = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.buckets = buckets
+        # 레이블 값 조합 -> [버킷별 개수(+Inf 포함)..., 합계]
+        self._values: dict[Labels, list[float]] = {}
+
+    def observe(self, value: float, *label_values: str) -> None:
+        counts = self._values.get(label_values)
+        if counts is None:
+            counts = self._values[label_values] = [0.0] * (len(self.buckets) + 2)
+        counts[bisect_left(self.buckets, value)] += 1
+        counts[-1] += value
+
+    def count(self, *label_values: str) -> int:
+        counts = self._values.get(label_values)
+        return int(sum(counts[:-1])) if counts else 0
+
+    def collect(self) -> Iterable[str]:
+        for label_values, counts in self._values.items():
+            cumulative = 0.0
+            for bound, bucket_count in zip((*self.buckets, math.inf), counts[:-1]):
+                cumulative += bucket_count
+                labels = _format_labels(
+                    (*self.label_names, "le"), (*label_values, _format_value(bound))
+                )
+                yield f"{self.name}_bucket{labels} {_format_value(cumulative)}"
+            labels = _format_labels(self.label_names, label_values)
+            yield f"{self.name}_sum{labels} {_format_value(counts[-1])}"
+            yield f"{self.name}_count{labels} {_format_value(cumulative)}"
+
+
+class CallbackMetric:
+    """
+    수집할 때 함수를 호출해 값을 읽는 지표.
+    이미 다른 곳에서 세고 있는 값(캐시 적중 수, 차단기 상태 등)을 그대로 노출합니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        metric_type: str,
+        callback: Callable[[], Iterable[Sample]],
+    ):
+        self.name = name
+        self.help_text = help_text
+        self.metric_type = metric_type
+        self.callback = callback
+
+    def collect(self) -> Iterable[str]:
+        for labels, value in self.callback():
+            formatted = _format_labels(labels.keys(), labels.values())
+            yield f"{self.name}{formatted} {_format_value(value)}"
+
+
+Metric = Counter | Histogram | CallbackMetric
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+
+    def counter(self, name: str, help_text: str, label_names: Labels = ()) -> Counter:
+        metric = Counter(name, help_text, label_names)
+        self.register(metric)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        label_names: Labels = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        metric = Histogram(name, help_text, label_names, buckets)
+        self.register(metric)
+        return metric
+
+    def callback(
+        self,
+        name: str,
+        help_text: str,
+        metric_type: str,
+        callback: Callable[[], Iterable[Sample]],
+    ) -> CallbackMetric:
+        metric = CallbackMetric(name, help_text, metric_type, callback)
+        self.register(metric)
+        return metric
+
+    def render(self) -> str:
+        """
+        등록된 모든 지표를 Prometheus 텍스트 형식(0.0.4)으로 만듭니다.
+        :return: /metrics 응답 본문
+        """
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.help_text}")
+            lines.append(f"# TYPE {metric.name} {metric.metric_type}")
+            lines.extend(metric.collect())
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,55 @@
+import base64
+import json
+from datetime import datetime
+
+
+def encode_cursor(created_at: datetime, diary_id: int) -> str:
+    """
+    (created_at, id) 위치를 클라이언트에 넘겨줄 불투명한 커서 문자열로 인코딩합니다.
+    :param created_at: 페이지 마지막 항목의 작성일자
+    :param diary_id: 페이지 마지막 항목의 ID
+    :return: URL-safe base64 커서 문자열
+    """
+    raw = json.dumps([created_at.isoformat(), diary_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    encode_cursor로 만든 커서를 (created_at, id)로 되돌립니다.
+    :param cursor: 클라이언트가 보낸 커서 문자열
+    :return: (작성일자, 일기 ID)
+    :raises ValueError: 커서 형식이 올바르지 않은 경우
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at_str, diary_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at_str), int(diary_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def encode_rank_cursor(rank: float, diary_id: int) -> str:
+    """
+    검색 결과의 (rank, id) 위치를 커서 문자열로 인코딩합니다.
+    :param rank: 페이지 마지막 항목의 검색 점수
+    :param diary_id: 페이지 마지막 항목의 ID
+    :return: URL-safe base64 커서 문자열
+    """
+    raw = json.dumps([rank, diary_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_rank_cursor(cursor: str) -> tuple[float, int]:
+    """
+    encode_rank_cursor로 만든 커서를 (rank, id)로 되돌립니다.
+    :param cursor: 클라이언트가 보낸 커서 문자열
+    :return: (검색 점수, 일기 ID)
+    :raises ValueError: 커서 형식이 올바르지 않은 경우
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        rank, diary_id = json.loads(base64.urlsafe_b64decode(padded))
+        return float(rank), int(diary_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
@@ -0,0 +1,165 @@
+import asyncio
+import time
+from enum import Enum
+
+
+class AIMDLimiter:
+    """
+    동시 요청 수 상한을 응답 시간에 따라 조절하는 제한기 (AIMD).
+    목표 시간 안에 성공하면 상한을 조금씩 올리고(가산 증가),
+    느리거나 실패하면 절반으로 줄입니다(승산 감소).
+    동시에 끝난 실패들로 상한이 한꺼번에 바닥까지 떨어지지 않도록
+    감소는 latency_target 간격에 한 번만 적용합니다.
+    """
+
+    def __init__(
+        self,
+        min_limit: int,
+        max_limit: int,
+        latency_target: float,
+        backoff_ratio: float = 0.5,
+    ):
+        """
+        :param min_limit: 상한의 최솟값
+        :param max_limit: 상한의 최댓값 (처음에는 이 값으로 시작)
+        :param latency_target: 이 시간 안에 끝나면 여유가 있다고 보는 응답 시간 (초)
+        :param backoff_ratio: 감소 시 곱하는 비율
+        """
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_target = latency_target
+        self.backoff_ratio = backoff_ratio
+        self.limit = float(max_limit)
+        self.in_flight = 0
+        self.rejected = 0
+        self._last_decrease = 0.0
+        self._changed = asyncio.Condition()
+
+    async def acquire(self, timeout: float) -> bool:
+        """
+        실행 슬롯을 얻습니다. 상한에 걸리면 timeout까지만 기다립니다.
+        :param timeout: 최대 대기 시간 (초)
+        :return: 슬롯을 얻었으면 True, 시간 안에 얻지 못했으면 False
+        """
+        async with self._changed:
+            try:
+                async with asyncio.timeout(timeout):
+                    await self._changed.wait_for(
+                        lambda: self.in_flight < int(self.limit)
+                    )
+            except TimeoutError:
+                self.rejected += 1
+                return False
+            self.in_flight += 1
+            return True
+
+    async def release(self, latency: float | None, succeeded: bool | None) -> None:
+        """
+        슬롯을 반납하고 결과에 따라 상한을 조절합니다.
+        :param latency: 요청에 걸린 시간 (초)
+        :param succeeded: 성공이면 True, 과부하로 볼 실패면 False,
+            상한 조절에 반영하지 않을 결과(취소 등)면 None
+        """
+        async with self._changed:
+            self.in_flight -= 1
+            if succeeded and latency is not None and latency <= self.latency_target:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            elif succeeded is not None:
+                now = time.monotonic()
+                if now - self._last_decrease >= self.latency_target:
+                    self._last_decrease = now
+                    self.limit = max(self.min_limit, self.limit * self.backoff_ratio)
+            self._changed.notify_all()
+
+    def stats(self) -> dict[str, float | int]:
+        return {
+            "limit": int(self.limit),
+            "in_flight": self.in_flight,
+            "rejected": self.rejected,
+        }
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    연속 실패가 failure_threshold번 쌓이면 열려서(open) reset_timeout 동안
+    요청을 바로 거절하는 차단기.
+    시간이 지나면 반쯤 열린(half_open) 상태가 되어 시험 요청 하나만 보내고,
+    성공하면 닫고(closed) 실패하면 다시 엽니다.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        """
+        :param failure_threshold: 차단기를 여는 연속 실패 횟수
+        :param reset_timeout: 열린 뒤 시험 요청을 보내기까지 기다리는 시간 (초)
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.consecutive_failures = 0
+        self.opened_count = 0
+        self.rejected = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def state(self) -> CircuitState:
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return CircuitState.HALF_OPEN
+        return CircuitState.OPEN
+
+    def allow(self) -> bool:
+        """
+        요청을 보내도 되는지 확인합니다. half_open에서는 시험 요청 하나만 허용합니다.
+        허용된 요청은 끝난 뒤 record_success/record_failure/release 중 하나를
+        반드시 호출해야 합니다.
+        :return: 보내도 되면 True
+        """
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return True
+        if state == CircuitState.HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        self.rejected += 1
+        return False
+
+    def retry_after(self) -> float:
+        """다시 시도해 볼 수 있을 때까지 남은 시간 (초)"""
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+
+    def record_success(self) -> None:
+        self.consecutive_failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self.consecutive_failures += 1
+        # 시험 요청이 실패했거나 닫힌 상태에서 연속 실패가 쌓이면 (다시) 엶
+        if self._probing or (
+            self._opened_at is None
+            and self.consecutive_failures >= self.failure_threshold
+        ):
+            self._opened_at = time.monotonic()
+            self.opened_count += 1
+        self._probing = False
+
+    def release(self) -> None:
+        """성공/실패로 판단할 수 없이 끝난 요청(취소 등)의 시험 슬롯을 반납합니다."""
+        self._probing = False
+
+    def stats(self) -> dict[str, str | int]:
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self.consecutive_failures,
+            "opened_count": self.opened_count,
+            "rejected": self.rejected,
+        }
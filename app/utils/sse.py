@@ -0,0 +1,16 @@
+import json
+
+# 프록시(nginx 등)가 이벤트를 모아서 보내지 않도록 하는 응답 헤더
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def format_sse(event: str, data: dict) -> bytes:
+    """
+    Server-Sent Events 메시지 하나를 만듭니다.
+    data는 JSON 한 줄로 직렬화하므로 내용에 줄바꿈이 있어도 메시지가 깨지지 않습니다.
+    :param event: 이벤트 이름
+    :param data: 이벤트 데이터
+    :return: text/event-stream 형식의 바이트
+    """
+    payload = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    return f"event: {event}\ndata: {payload}\n\n".encode()
@@ -0,0 +1,97 @@
+"""
+get_current_user 마이크로 벤치마크: 검증된 JWT 캐시 사용/미사용 비교.
+
+    uv run python -m benchmarks.bench_get_current_user --iterations 20000
+
+DB 없이 JWT 디코딩/검증 비용만 비교할 수 있도록 사용자 캐시와
+토큰 블랙리스트를 메모리에 미리 채워둔 상태에서 측정합니다.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from datetime import datetime, timezone
+
+# .env 없이도 실행되도록 설정 기본값 채우기 (이미 설정된 값은 유지)
+for _key, _value in {
+    "SECRET_KEY": "benchmark-secret",
+    "ALGORITHM": "HS256",
+    "ACCESS_TOKEN_EXPIRE_MINUTES": "30",
+    "REFRESH_TOKEN_EXPIRE_MINUTES": "1440",
+    "GEMINI_API_KEY": "unused",
+    "DB_USER": "unused",
+    "DB_PASSWORD": "unused",
+    "DB_HOST": "localhost",
+    "DB_PORT": "5432",
+    "DB_NAME": "unused",
+}.items():
+    os.environ.setdefault(_key, _value)
+
+from app.dependencies import get_current_user  # noqa: E402
+from app.dtos.user_dto import UserInDB  # noqa: E402
+from app.services import auth_service  # noqa: E402
+from app.services.token_revocation import token_revocation_store  # noqa: E402
+
+EMAIL = "bench@example.com"
+
+
+def prime_in_memory_state() -> str:
+    now = datetime.now(timezone.utc)
+    user = UserInDB(
+        id=1,
+        email=EMAIL,
+        nickname="bench",
+        name="bench",
+        phone_number="010-0000-0000",
+        is_active=True,
+        created_at=now,
+        updated_at=now,
+        password="unused",
+    )
+    auth_service._user_cache.set(EMAIL, user)
+    # 빈 블랙리스트가 이미 적재된 상태로 간주 (DB 조회 없음)
+    token_revocation_store._loaded = True
+    return auth_service.create_token(data={"sub": EMAIL}, token_type="access")
+
+
+async def measure(token: str, iterations: int, use_cache: bool) -> list[float]:
+    cache = auth_service._verified_token_cache
+    cache.clear()
+    cache.max_size = auth_service.settings.JWT_CACHE_MAX_SIZE if use_cache else 0
+
+    await get_current_user(token)  # 워밍업 (캐시 사용 시 첫 검증 결과 저장)
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await get_current_user(token)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def report(label: str, samples: list[float]) -> float:
+    ordered = sorted(samples)
+    mean_us = statistics.fmean(samples) * 1e6
+    p50_us = ordered[len(ordered) // 2] * 1e6
+    p99_us = ordered[int(len(ordered) * 0.99) - 1] * 1e6
+    print(
+        f"{label:<14} mean {mean_us:8.2f} us  p50 {p50_us:8.2f} us  "
+        f"p99 {p99_us:8.2f} us  ({len(samples) / sum(samples):,.0f} ops/s)"
+    )
+    return mean_us
+
+
+async def main(iterations: int) -> None:
+    token = prime_in_memory_state()
+    without_cache = report(
+        "without cache", await measure(token, iterations, use_cache=False)
+    )
+    with_cache = report("with cache", await measure(token, iterations, use_cache=True))
+    print(f"speedup        x{without_cache / with_cache:.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20000)
+    asyncio.run(main(parser.parse_args().iterations))
@@ -0,0 +1,386 @@
+"""
+HTTP 벤치마크: 주요 API를 프로세스 안에서(httpx ASGI transport) 호출해
+시나리오별 p50/p95/p99 지연 시간과 초당 요청 수를 측정합니다.
+
+    uv run python -m benchmarks.bench_http --requests 200 --concurrency 8
+    uv run python -m benchmarks.bench_http --json before.json
+    uv run python -m benchmarks.bench_http --compare before.json
+
+.env의 DB 설정으로 접속한 Postgres에 벤치마크 전용 DB(mydiary_bench_<pid>)를
+만들어 스키마를 생성하고, 끝나면 삭제합니다. 그래서 DB 계정에 CREATEDB 권한이
+필요하고 기존 데이터에는 영향이 없습니다. 읽기 복제본 설정은 무시합니다.
+원시 SQL(unnest, $n 바인드 변수)을 쓰는 경로가 있어 SQLite로는 실행할 수 없습니다.
+Gemini 호출은 고정된 감정 분석 JSON을 --gemini-latency 뒤에 돌려주는 가짜 모델로
+바꾸므로 네트워크와 API 키가 필요 없습니다.
+
+시나리오(앞 시나리오가 만든 사용자/일기를 다음 시나리오가 사용):
+signup, login, me(get_current_user), create_diary, get_diary, list_diaries,
+attach_tags, emotion(작업 등록부터 백그라운드 워커 완료까지, GET /jobs 폴링.
+폴링 간격을 너무 줄이면 폴링 요청이 워커와 이벤트 루프를 나눠 써서 느려짐)
+signup/login은 bcrypt 비용이 커서 --auth-requests 만큼만 실행합니다.
+--json으로 결과를 저장하고 --compare로 다른 커밋의 결과와 비교할 수 있습니다.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable
+
+import httpx
+
+STUB_EMOTION_RESULT = {
+    "keywords": [
+        {"word": "기쁨", "emotion": "긍정"},
+        {"word": "피곤", "emotion": "부정"},
+        {"word": "산책", "emotion": "중립"},
+    ]
+}
+DIARY_CONTENT = (
+    "오늘은 아침 일찍 일어나 공원을 산책했다. 햇살이 좋아서 기분이 좋았지만 "
+    "오후에는 회의가 길어져서 조금 피곤했다. "
+)
+READ_ONLY_SCENARIOS = ("me", "get_diary", "list_diaries")
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    requests: int
+    concurrency: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_ms: float
+    rps: float
+
+
+class _StubResponse:
+    def __init__(self, text: str):
+        self.text = text
+        self.usage_metadata = None
+
+
+class _StubModel:
+    """GenerativeModel 대신 쓰는 가짜 모델 (감정 분석 응답 형식의 JSON 반환)"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    async def generate_content_async(self, prompt: str, **kwargs: Any) -> Any:
+        await asyncio.sleep(self.latency)
+        return _StubResponse(json.dumps(STUB_EMOTION_RESULT, ensure_ascii=False))
+
+
+def percentile(ordered: list[float], q: float) -> float:
+    # nearest-rank 방식 (정렬된 표본 기준)
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))]
+
+
+async def run_scenario(
+    name: str,
+    requests: int,
+    concurrency: int,
+    call: Callable[[int], Awaitable[None]],
+) -> ScenarioResult:
+    """
+    call(0..requests-1)을 동시에 concurrency개씩 실행하며 호출별 시간을 잽니다.
+    :param name: 시나리오 이름
+    :param requests: 총 호출 수
+    :param concurrency: 동시에 실행할 호출 수
+    :param call: i번째 요청을 보내고 응답을 확인하는 함수
+    """
+    indexes = iter(range(requests))
+    samples: list[float] = []
+
+    async def worker() -> None:
+        for i in indexes:
+            started = time.perf_counter()
+            await call(i)
+            samples.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    ordered = sorted(samples)
+    return ScenarioResult(
+        name=name,
+        requests=requests,
+        concurrency=concurrency,
+        p50_ms=percentile(ordered, 0.50) * 1000,
+        p95_ms=percentile(ordered, 0.95) * 1000,
+        p99_ms=percentile(ordered, 0.99) * 1000,
+        mean_ms=statistics.fmean(ordered) * 1000,
+        rps=requests / elapsed,
+    )
+
+
+def expect(response: httpx.Response, status_code: int) -> httpx.Response:
+    if response.status_code != status_code:
+        raise RuntimeError(
+            f"{response.request.method} {response.request.url.path} returned "
+            f"{response.status_code} (expected {status_code}): {response.text[:300]}"
+        )
+    return response
+
+
+async def run_benchmarks(args: argparse.Namespace) -> list[ScenarioResult]:
+    # 설정(DB_NAME 등)을 바꾼 뒤에 앱을 가져와야 하므로 여기서 import
+    from tortoise import Tortoise, connections
+
+    from app import app
+    from app.config.tortoise_config import TORTOISE_ORM
+    from app.services import gemini_service
+
+    # lru_cache로 감싼 함수 자리에 가짜 모델을 돌려주는 함수를 넣음
+    stub_model = _StubModel(args.gemini_latency)
+    gemini_service._get_model = lambda model_name: stub_model  # type: ignore[assignment]
+
+    # 벤치마크 전용 DB를 만들고 스키마 생성 (서버 시작 경로는 스키마를 만들지 않음)
+    await Tortoise.init(config=TORTOISE_ORM, _create_db=True)
+    try:
+        await Tortoise.generate_schemas()
+        await connections.close_all()
+
+        # lifespan을 그대로 실행해 실제 서버와 같은 초기화(커넥션 풀 예열, 작업 워커,
+        # 토큰 블랙리스트 적재)를 거친 상태에서 측정
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://bench"
+            ) as client:
+                return await _run_scenarios(client, args)
+    finally:
+        await Tortoise.init(config=TORTOISE_ORM)
+        await Tortoise._drop_databases()
+
+
+async def _run_scenarios(
+    client: httpx.AsyncClient, args: argparse.Namespace
+) -> list[ScenarioResult]:
+    results: list[ScenarioResult] = []
+    auth_requests = min(args.auth_requests, args.requests)
+    tokens: list[dict[str, str]] = []
+    diaries: list[tuple[int, dict[str, str]]] = []
+
+    async def measure(
+        name: str, requests: int, call: Callable[[int], Awaitable[None]]
+    ) -> None:
+        if args.only and name not in args.only:
+            # 다음 시나리오가 쓸 데이터는 만들어야 하므로 측정만 건너뜀
+            for i in range(requests):
+                await call(i)
+            return
+        if name in READ_ONLY_SCENARIOS:
+            for i in range(min(args.warmup, requests)):
+                await call(i)
+        result = await run_scenario(name, requests, args.concurrency, call)
+        results.append(result)
+        print_result(result)
+
+    async def signup(i: int) -> None:
+        expect(
+            await client.post(
+                "/users/signup",
+                json={
+                    "email": f"bench{i}@example.com",
+                    "password": "bench-password",
+                    "nickname": f"bench{i}",
+                    "name": "bench",
+                    "phone_number": "010-0000-0000",
+                },
+            ),
+            201,
+        )
+
+    async def login(i: int) -> None:
+        response = expect(
+            await client.post(
+                "/users/login",
+                data={
+                    "username": f"bench{i}@example.com",
+                    "password": "bench-password",
+                },
+            ),
+            200,
+        )
+        tokens.append({"Authorization": f"Bearer {response.json()['access_token']}"})
+
+    async def me(i: int) -> None:
+        expect(await client.get("/users/me", headers=tokens[i % len(tokens)]), 200)
+
+    async def create_diary(i: int) -> None:
+        headers = tokens[i % len(tokens)]
+        response = expect(
+            await client.post(
+                "/diaries",
+                json={
+                    "title": f"bench diary {i}",
+                    # 내용이 같으면 Gemini 결과 캐시에 걸리므로 일기마다 다르게 작성
+                    "content": f"{DIARY_CONTENT}#{i}",
+                    "mood": "SOSO",
+                },
+                headers=headers,
+            ),
+            201,
+        )
+        diaries.append((response.json()["id"], headers))
+
+    async def get_diary(i: int) -> None:
+        diary_id, headers = diaries[i % len(diaries)]
+        expect(await client.get(f"/diaries/{diary_id}", headers=headers), 200)
+
+    async def list_diaries(i: int) -> None:
+        headers = tokens[i % len(tokens)]
+        expect(await client.get("/diaries", headers=headers), 200)
+
+    tag_ids = [
+        expect(await client.post("/tags", json={"name": f"bench-tag-{n}"}), 201).json()[
+            "id"
+        ]
+        for n in range(3)
+    ]
+
+    async def attach_tags(i: int) -> None:
+        diary_id, headers = diaries[i % len(diaries)]
+        expect(
+            await client.post(
+                f"/diaries/{diary_id}/tags/batch",
+                json={"ids": tag_ids},
+                headers=headers,
+            ),
+            200,
+        )
+
+    async def emotion(i: int) -> None:
+        diary_id, headers = diaries[i]
+        job = expect(
+            await client.post(f"/diaries/{diary_id}/emotion_stats", headers=headers),
+            202,
+        ).json()
+        # 작업이 끝날 때까지의 시간 (폴링 간격만큼의 오차 포함)
+        while job["status"] in ("pending", "running"):
+            await asyncio.sleep(args.poll_interval)
+            response = await client.get(f"/jobs/{job['id']}", headers=headers)
+            job = expect(response, 200).json()
+        if job["status"] != "succeeded":
+            raise RuntimeError(f"emotion analysis job failed: {job}")
+
+    await measure("signup", auth_requests, signup)
+    await measure("login", auth_requests, login)
+    await measure("me", args.requests, me)
+    await measure("create_diary", args.requests, create_diary)
+    await measure("get_diary", args.requests, get_diary)
+    await measure("list_diaries", args.requests, list_diaries)
+    await measure("attach_tags", args.requests, attach_tags)
+    await measure("emotion", min(args.requests, len(diaries)), emotion)
+    return results
+
+
+def print_header() -> None:
+    print(
+        f"{'scenario':<14}{'requests':>9}{'conc':>6}{'p50 ms':>10}{'p95 ms':>10}"
+        f"{'p99 ms':>10}{'mean ms':>10}{'req/s':>10}"
+    )
+
+
+def print_result(result: ScenarioResult) -> None:
+    print(
+        f"{result.name:<14}{result.requests:>9}{result.concurrency:>6}"
+        f"{result.p50_ms:>10.2f}{result.p95_ms:>10.2f}{result.p99_ms:>10.2f}"
+        f"{result.mean_ms:>10.2f}{result.rps:>10.1f}"
+    )
+
+
+def print_comparison(results: list[ScenarioResult], baseline_path: str) -> None:
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    previous = {item["name"]: item for item in baseline["results"]}
+    print(f"\ncompared with {baseline_path} (commit {baseline.get('commit')})")
+    print(f"{'scenario':<14}{'p50':>10}{'p95':>10}{'p99':>10}{'req/s':>10}")
+    for result in results:
+        old = previous.get(result.name)
+        if old is None:
+            continue
+        changes = [
+            (getattr(result, key) - old[key]) / old[key] * 100 if old[key] else 0.0
+            for key in ("p50_ms", "p95_ms", "p99_ms", "rps")
+        ]
+        print(f"{result.name:<14}" + "".join(f"{c:>+9.1f}%" for c in changes))
+
+
+def git_commit() -> str | None:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return f"{commit}-dirty" if dirty else commit
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="주요 API 지연 시간/처리량 측정")
+    parser.add_argument("--requests", type=int, default=200, help="시나리오별 요청 수")
+    parser.add_argument("--auth-requests", type=int, default=32)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--gemini-latency", type=float, default=0.0)
+    parser.add_argument("--poll-interval", type=float, default=0.02)
+    parser.add_argument(
+        "--only", nargs="+", help="측정할 시나리오 (나머지는 데이터 준비만)"
+    )
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 파일")
+    args = parser.parse_args()
+
+    # 설정을 읽기 전에 벤치마크 전용 DB를 가리키도록 환경 변수 변경
+    os.environ["DB_NAME"] = f"mydiary_bench_{os.getpid()}"
+    os.environ["DB_READ_HOST"] = ""  # .env에 복제본이 설정되어 있어도 primary만 사용
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+    print(
+        f"requests: {args.requests} (signup/login: "
+        f"{min(args.auth_requests, args.requests)})  "
+        f"concurrency: {args.concurrency}  gemini latency: {args.gemini_latency}s"
+    )
+    print_header()
+    results = asyncio.run(run_benchmarks(args))
+
+    if args.compare:
+        print_comparison(results, args.compare)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "commit": git_commit(),
+                    "python": sys.version.split()[0],
+                    "platform": platform.platform(),
+                    "args": vars(args),
+                    "results": [asdict(result) for result in results],
+                },
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+콜드 스타트 벤치마크: 서버 프로세스 시작부터 첫 응답까지 걸리는 시간 측정.
+
+    uv run python -m benchmarks.bench_startup --runs 5
+
+매 회차마다 새 uvicorn 프로세스를 띄우고 GET /health(--path로 변경 가능)가
+200을 반환할 때까지의 시간(time-to-first-response)을 잽니다.
+lifespan에서 DB에 연결하므로 .env의 DB 설정이 실제로 접속 가능한 Postgres를
+가리켜야 합니다.
+`import app`에 걸리는 시간도 별도 프로세스에서 함께 측정합니다.
+"""
+
+import argparse
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+IMPORT_SNIPPET = (
+    "import time; started = time.perf_counter(); import app; "
+    "print(time.perf_counter() - started)"
+)
+
+
+def measure_import() -> float:
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_SNIPPET],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def measure_first_response(port: int, path: str, timeout: float) -> float:
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+        ],
+        env=os.environ.copy(),
+    )
+    try:
+        url = f"http://127.0.0.1:{port}{path}"
+        while time.perf_counter() - started < timeout:
+            if server.poll() is not None:
+                raise RuntimeError(f"server exited with code {server.returncode}")
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - started
+            except (urllib.error.URLError, ConnectionError):
+                time.sleep(0.01)
+        raise TimeoutError(f"no response from {url} within {timeout}s")
+    finally:
+        server.send_signal(signal.SIGTERM)
+        try:
+            server.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+
+def report(label: str, samples: list[float]) -> None:
+    print(
+        f"{label:<24} median {statistics.median(samples) * 1000:8.1f} ms  "
+        f"min {min(samples) * 1000:8.1f} ms  max {max(samples) * 1000:8.1f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="서버 콜드 스타트 시간 측정")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--path", default="/health", help="첫 응답을 확인할 경로")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    args = parser.parse_args()
+
+    import_times = [measure_import() for _ in range(args.runs)]
+    first_response_times = [
+        measure_first_response(args.port, args.path, args.timeout)
+        for _ in range(args.runs)
+    ]
+
+    print(f"runs: {args.runs}")
+    report("import app", import_times)
+    report("time to first response", first_response_times)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,4 @@
-import os
+from app.config.database import database_url
 
-from dotenv import load_dotenv
-
-load_dotenv()
-DB_USER = os.getenv("DB_USER")
-DB_PASSWORD = os.getenv("DB_PASSWORD")
-DB_HOST = os.getenv("DB_HOST")
-DB_PORT = os.getenv("DB_PORT")
-DB_NAME = os.getenv("DB_NAME")
-
-# TortoiseORM DB URL
-DATABASE_URL = f"postgres://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+# TortoiseORM DB URL (연결 설정은 app/config/database.py에서 한 곳으로 관리)
+DATABASE_URL = database_url()